@@ -20,6 +20,11 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analyzers.indicator_frame import IndicatorFrame
 
 
 class BollingerRSIAnalyzer:
@@ -38,12 +43,13 @@ class BollingerRSIAnalyzer:
         self.bb_std = bb_std
         self.rsi_period = rsi_period
 
-    def analyze(self, df):
+    def analyze(self, df, indicators=None):
         """
         볼린저 밴드 & RSI 종합 분석
 
         Args:
             df: OHLCV 데이터프레임 (columns: Open, High, Low, Close, Volume)
+            indicators: 공유 지표 캐시 (IndicatorFrame, 없으면 새로 생성)
 
         Returns:
             dict: 분석 결과
@@ -57,11 +63,13 @@ class BollingerRSIAnalyzer:
                 'strategy_suggestions': []
             }
 
+        indicators = IndicatorFrame.of(df, indicators)
+
         # 1. 볼린저 밴드 분석
-        bb_result = self._analyze_bollinger_bands(df)
+        bb_result = self._analyze_bollinger_bands(df, indicators)
 
         # 2. RSI 분석
-        rsi_result = self._analyze_rsi(df)
+        rsi_result = self._analyze_rsi(df, indicators)
 
         # 3. 종합 시그널 생성
         combined_signal, combined_score = self._generate_combined_signal(bb_result, rsi_result)
@@ -79,37 +87,24 @@ class BollingerRSIAnalyzer:
 
     # ==================== 볼린저 밴드 분석 ====================
 
-    def _analyze_bollinger_bands(self, df):
+    def _analyze_bollinger_bands(self, df, indicators):
         """볼린저 밴드 분석"""
-        # 볼린저 밴드 계산
-        df_copy = df.copy()
-        df_copy['BB_Middle'] = df_copy['Close'].rolling(window=self.bb_period).mean()
-        df_copy['BB_Std'] = df_copy['Close'].rolling(window=self.bb_period).std()
-        df_copy['BB_Upper'] = df_copy['BB_Middle'] + (self.bb_std * df_copy['BB_Std'])
-        df_copy['BB_Lower'] = df_copy['BB_Middle'] - (self.bb_std * df_copy['BB_Std'])
-
-        # %B 계산 (현재가가 밴드 내에서 어디에 위치하는지)
-        df_copy['BB_PercentB'] = (df_copy['Close'] - df_copy['BB_Lower']) / (df_copy['BB_Upper'] - df_copy['BB_Lower'])
-
-        # 밴드폭 계산
-        df_copy['BB_Width'] = (df_copy['BB_Upper'] - df_copy['BB_Lower']) / df_copy['BB_Middle']
-
-        # 최근 데이터
-        latest = df_copy.iloc[-1]
-        previous = df_copy.iloc[-2] if len(df_copy) > 1 else latest
+        # 볼린저 밴드 계산 (%B: 밴드 내 현재가 위치, 밴드폭: 변동성)
+        bands = indicators.bollinger(self.bb_period, self.bb_std)
+        close = indicators.column('Close')
 
         # 현재 상태 판단
-        current_price = latest['Close']
-        bb_upper = latest['BB_Upper']
-        bb_middle = latest['BB_Middle']
-        bb_lower = latest['BB_Lower']
-        percent_b = latest['BB_PercentB']
-        bb_width = latest['BB_Width']
+        current_price = close[-1]
+        bb_upper = bands['upper'][-1]
+        bb_middle = bands['middle'][-1]
+        bb_lower = bands['lower'][-1]
+        percent_b = bands['percent_b'][-1]
+        bb_width = bands['width'][-1]
 
         # 상태 분석
         position = self._get_bb_position(current_price, bb_upper, bb_middle, bb_lower)
-        squeeze_status = self._detect_bb_squeeze(df_copy)
-        breakout = self._detect_bb_breakout(df_copy)
+        squeeze_status = self._detect_bb_squeeze(bands['width'])
+        breakout = self._detect_bb_breakout(close, bands)
 
         # 시그널 생성
         bb_signal = self._get_bb_signal(position, percent_b, squeeze_status, breakout)
@@ -139,14 +134,15 @@ class BollingerRSIAnalyzer:
         else:
             return 'below_lower'  # 하단 밴드 아래
 
-    def _detect_bb_squeeze(self, df):
+    def _detect_bb_squeeze(self, width):
         """볼린저 밴드 스퀴즈 (수축) 감지"""
-        if len(df) < 20:
+        recent_width = width[-20:]
+        if len(width) < 20 or np.isnan(recent_width).all():
             return 'normal'
 
         # 최근 밴드폭과 과거 밴드폭 비교
-        current_width = df['BB_Width'].iloc[-1]
-        avg_width = df['BB_Width'].tail(20).mean()
+        current_width = width[-1]
+        avg_width = np.nanmean(recent_width)
 
         if current_width < avg_width * 0.7:
             return 'squeeze'  # 밴드폭 수축 (큰 움직임 임박)
@@ -155,16 +151,15 @@ class BollingerRSIAnalyzer:
         else:
             return 'normal'
 
-    def _detect_bb_breakout(self, df):
+    def _detect_bb_breakout(self, close, bands):
         """볼린저 밴드 돌파 감지"""
-        if len(df) < 3:
+        if len(close) < 3:
             return None
 
-        latest = df.iloc[-1]
-        previous = df.iloc[-2]
+        upper, middle, lower = bands['upper'], bands['middle'], bands['lower']
 
         # 상단 밴드 돌파
-        if latest['Close'] > latest['BB_Upper'] and previous['Close'] <= previous['BB_Upper']:
+        if close[-1] > upper[-1] and close[-2] <= upper[-2]:
             return {
                 'type': 'upper_breakout',
                 'description': '상단 밴드 돌파 (과매수 주의)',
@@ -173,7 +168,7 @@ class BollingerRSIAnalyzer:
             }
 
         # 하단 밴드 돌파
-        if latest['Close'] < latest['BB_Lower'] and previous['Close'] >= previous['BB_Lower']:
+        if close[-1] < lower[-1] and close[-2] >= lower[-2]:
             return {
                 'type': 'lower_breakout',
                 'description': '하단 밴드 돌파 (저점 매수 기회)',
@@ -182,7 +177,7 @@ class BollingerRSIAnalyzer:
             }
 
         # 중간선 상향 돌파
-        if latest['Close'] > latest['BB_Middle'] and previous['Close'] <= previous['BB_Middle']:
+        if close[-1] > middle[-1] and close[-2] <= middle[-2]:
             return {
                 'type': 'middle_up_breakout',
                 'description': '중간선 상향 돌파 (상승 전환)',
@@ -191,7 +186,7 @@ class BollingerRSIAnalyzer:
             }
 
         # 중간선 하향 이탈
-        if latest['Close'] < latest['BB_Middle'] and previous['Close'] >= previous['BB_Middle']:
+        if close[-1] < middle[-1] and close[-2] >= middle[-2]:
             return {
                 'type': 'middle_down_breakout',
                 'description': '중간선 하향 이탈 (하락 전환)',
@@ -247,28 +242,19 @@ class BollingerRSIAnalyzer:
 
     # ==================== RSI 분석 ====================
 
-    def _analyze_rsi(self, df):
+    def _analyze_rsi(self, df, indicators):
         """RSI (Relative Strength Index) 분석"""
         # RSI 계산
-        df_copy = df.copy()
-        delta = df_copy['Close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        avg_gain = gain.rolling(window=self.rsi_period).mean()
-        avg_loss = loss.rolling(window=self.rsi_period).mean()
-
-        rs = avg_gain / avg_loss
-        df_copy['RSI'] = 100 - (100 / (1 + rs))
+        rsi = indicators.rsi(self.rsi_period)
 
         # 최근 RSI 값
-        current_rsi = df_copy['RSI'].iloc[-1]
-        previous_rsi = df_copy['RSI'].iloc[-2] if len(df_copy) > 1 else current_rsi
+        current_rsi = rsi[-1]
+        previous_rsi = rsi[-2] if len(rsi) > 1 else current_rsi
 
         # RSI 상태 분석
         rsi_zone = self._get_rsi_zone(current_rsi)
-        rsi_trend = self._get_rsi_trend(df_copy)
-        divergence = self._detect_rsi_divergence(df_copy)
+        rsi_trend = self._get_rsi_trend(rsi)
+        divergence = self._detect_rsi_divergence(df, rsi)
 
         # 시그널 생성
         rsi_signal = self._get_rsi_signal(current_rsi, rsi_zone, rsi_trend, divergence)
@@ -296,12 +282,12 @@ class BollingerRSIAnalyzer:
         else:
             return 'oversold'  # 과매도
 
-    def _get_rsi_trend(self, df):
+    def _get_rsi_trend(self, rsi):
         """RSI 추세 분석"""
-        if len(df) < 5:
+        if len(rsi) < 5:
             return 'neutral'
 
-        rsi_values = df['RSI'].tail(5).values
+        rsi_values = rsi[-5:]
 
         # 선형 회귀로 추세 파악
         x = np.arange(len(rsi_values))
@@ -318,7 +304,7 @@ class BollingerRSIAnalyzer:
         else:
             return 'strong_downtrend'  # 강한 하락 추세
 
-    def _detect_rsi_divergence(self, df):
+    def _detect_rsi_divergence(self, df, rsi):
         """RSI 다이버전스 감지"""
         if len(df) < 20:
             return None
@@ -331,7 +317,7 @@ class BollingerRSIAnalyzer:
         price_lows = recent_df['Low'].nsmallest(3)
 
         # RSI 고점/저점
-        rsi_values = recent_df['RSI']
+        rsi_values = pd.Series(rsi[-20:], index=recent_df.index)
 
         # 강세 다이버전스 (Bullish Divergence)
         # 가격은 낮아지는데 RSI는 높아지는 경우
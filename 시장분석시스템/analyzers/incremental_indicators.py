@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+"""
+증분 지표 상태 (종목별, 새 봉 1개당 O(1) 갱신)
+이동평균/볼린저 밴드는 이동 합계, MACD는 EMA 상태, RSI는 상승/하락폭 이동 합계로 유지하고
+TechnicalAnalyzer.analyze_all과 같은 형태의 결과를 만듭니다.
+
+- RSI는 기존 분석기와 같은 단순 이동평균 방식 (Wilder 평활 아님)
+- 상태는 JSON으로 저장/복원 (data/indicators/<종목키>.json)
+- 확정 봉은 update, 장중 미완성 봉은 peek (상태를 바꾸지 않고 미리보기)
+
+사용 예:
+    state = IncrementalIndicators.from_history(df)   # 최초 1회 전체 이력
+    result = state.update(new_bar)                   # 이후 새 봉마다 O(1)
+"""
+
+import copy
+import json
+import math
+import os
+import re
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import MA_PERIODS, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL
+from analyzers.technical_analyzer import TechnicalAnalyzer
+
+STATE_VERSION = 1
+
+# 봉 필드 → 한글 컬럼명 (수집기 원본 데이터 호환)
+BAR_FIELDS = {
+    'Open': '시가',
+    'High': '고가',
+    'Low': '저가',
+    'Close': '종가',
+    'Volume': '거래량'
+}
+
+
+class RollingSum:
+    """고정 길이 이동 합계 (링 버퍼, pandas rolling(window).sum()과 같은 NaN 규칙)"""
+
+    def __init__(self, size, offset=None):
+        """
+        Args:
+            size (int): 창 길이
+            offset (float): 제곱합 상쇄 오차를 줄이기 위한 기준값 (None이면 첫 유효값)
+        """
+        self.size = size
+        self.offset = offset
+        self.values = []
+        self.pos = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.nan_count = 0
+
+    def push(self, value):
+        """값 추가 (창이 차면 가장 오래된 값 제거)"""
+        if self.offset is None and not math.isnan(value):
+            self.offset = value
+
+        if len(self.values) == self.size:
+            self._remove(self.values[self.pos])
+            self.values[self.pos] = value
+        else:
+            self.values.append(value)
+        self._add(value)
+        self.pos = (self.pos + 1) % self.size
+
+        # 한 바퀴마다 다시 합산해 누적 오차 제거 (상각 O(1))
+        if self.pos == 0:
+            self._resum()
+
+    def _add(self, value):
+        if math.isnan(value):
+            self.nan_count += 1
+        else:
+            shifted = value - self.offset
+            self.total += shifted
+            self.total_sq += shifted * shifted
+
+    def _remove(self, value):
+        if math.isnan(value):
+            self.nan_count -= 1
+        else:
+            shifted = value - self.offset
+            self.total -= shifted
+            self.total_sq -= shifted * shifted
+
+    def _resum(self):
+        self.total = self.total_sq = 0.0
+        self.nan_count = 0
+        for value in self.values:
+            self._add(value)
+
+    @property
+    def ready(self):
+        """창이 가득 차고 NaN이 없는지"""
+        return len(self.values) == self.size and self.nan_count == 0
+
+    def mean(self):
+        """이동 평균 (창이 덜 찼으면 NaN)"""
+        if not self.ready:
+            return math.nan
+        return self.offset + self.total / self.size
+
+    def sum(self):
+        """이동 합계 (창이 덜 찼으면 NaN)"""
+        if not self.ready:
+            return math.nan
+        return self.total + self.offset * self.size
+
+    def std(self):
+        """이동 표본 표준편차 (ddof=1)"""
+        if not self.ready or self.size < 2:
+            return math.nan
+        variance = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self):
+        return {
+            'size': self.size,
+            'offset': self.offset,
+            # 링 버퍼를 오래된 값부터 저장
+            'values': self.values[self.pos:] + self.values[:self.pos] if len(self.values) == self.size else self.values
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        rolling = cls(data['size'], data['offset'])
+        for value in data['values']:
+            rolling.values.append(value)
+        rolling.pos = len(rolling.values) % rolling.size
+        rolling._resum()
+        return rolling
+
+
+class IncrementalIndicators:
+    """종목별 증분 지표 상태"""
+
+    def __init__(self, ma_periods=MA_PERIODS, rsi_period=RSI_PERIOD,
+                 macd_fast=MACD_FAST, macd_slow=MACD_SLOW, macd_signal=MACD_SIGNAL,
+                 bb_period=20, bb_std=2, volume_period=20, sr_window=20):
+        self.params = {
+            'ma_periods': list(ma_periods),
+            'rsi_period': rsi_period,
+            'macd_fast': macd_fast,
+            'macd_slow': macd_slow,
+            'macd_signal': macd_signal,
+            'bb_period': bb_period,
+            'bb_std': bb_std,
+            'volume_period': volume_period,
+            'sr_window': sr_window
+        }
+
+        self.ma = {period: RollingSum(period) for period in ma_periods}
+        self.bb = RollingSum(bb_period)
+        self.volume_ma = RollingSum(volume_period)
+        self.gains = RollingSum(rsi_period, offset=0.0)
+        self.losses = RollingSum(rsi_period, offset=0.0)
+        self.highs = deque(maxlen=sr_window)
+        self.lows = deque(maxlen=sr_window)
+
+        self.ema = {'fast': None, 'slow': None, 'signal': None}
+        self.prev_close = None
+        self.prev_ma = None  # 직전 봉 (MA20, MA60) - 크로스 판정용
+        self.last_bar = None
+        self.last_date = None
+        self.bars = 0
+
+    # ==================== 갱신 ====================
+
+    @staticmethod
+    def _field(bar, name):
+        """봉에서 필드 값 (영문/한글 컬럼 모두 지원)"""
+        for key in (name, BAR_FIELDS[name]):
+            if key in bar and bar[key] is not None:
+                return float(bar[key])
+        return math.nan
+
+    @staticmethod
+    def _ema_step(prev, value, span):
+        """EMA 1스텝 (pandas ewm(span, adjust=False)와 동일)"""
+        if prev is None:
+            return value
+        alpha = 2 / (span + 1)
+        return alpha * value + (1 - alpha) * prev
+
+    def update(self, bar, date=None):
+        """
+        확정 봉 1개 반영 (O(1))
+
+        Args:
+            bar (dict or Series): Open/High/Low/Close/Volume (한글 컬럼도 가능)
+            date: 봉 날짜 (Series의 name을 쓰거나 생략 가능)
+
+        Returns:
+            dict: analyze_all과 같은 형태의 지표 결과 ('data' 제외)
+        """
+        close = self._field(bar, 'Close')
+        high = self._field(bar, 'High')
+        low = self._field(bar, 'Low')
+        volume = self._field(bar, 'Volume')
+
+        # 크로스 판정용 직전 MA (첫 봉은 비교 대상 없음)
+        if self.bars:
+            self.prev_ma = (self.ma[20].mean(), self.ma[60].mean())
+
+        for rolling in self.ma.values():
+            rolling.push(close)
+        self.bb.push(close)
+        self.volume_ma.push(volume)
+
+        # RSI 상승/하락폭 (첫 봉은 0 - IndicatorFrame.rsi와 동일)
+        delta = close - self.prev_close if self.prev_close is not None else math.nan
+        self.gains.push(delta if delta > 0 else 0.0)
+        self.losses.push(-delta if delta < 0 else 0.0)
+        self.prev_close = close
+
+        self.ema['fast'] = self._ema_step(self.ema['fast'], close, self.params['macd_fast'])
+        self.ema['slow'] = self._ema_step(self.ema['slow'], close, self.params['macd_slow'])
+        self.ema['signal'] = self._ema_step(self.ema['signal'], self.ema['fast'] - self.ema['slow'],
+                                            self.params['macd_signal'])
+
+        self.highs.append(high)
+        self.lows.append(low)
+
+        self.last_bar = {'Close': close, 'High': high, 'Low': low, 'Volume': volume}
+        if date is None:
+            date = getattr(bar, 'name', None)
+        self.last_date = pd.Timestamp(date).isoformat() if date is not None else self.last_date
+        self.bars += 1
+
+        return self.snapshot()
+
+    def peek(self, bar, date=None):
+        """
+        미완성 봉(장중)을 반영한 결과 미리보기 - 상태는 바뀌지 않음
+
+        Returns:
+            dict: update와 같은 형태의 결과
+        """
+        return copy.deepcopy(self).update(bar, date)
+
+    @classmethod
+    def from_history(cls, df, **params):
+        """전체 이력으로 상태 생성 (최초 1회)"""
+        state = cls(**params)
+        state.extend(df)
+        return state
+
+    def extend(self, df):
+        """여러 봉 순서대로 반영"""
+        for date, row in df.iterrows():
+            self.update(row, date)
+        return self
+
+    # ==================== 결과 ====================
+
+    def _rsi(self):
+        avg_gain = self.gains.sum() / self.params['rsi_period']
+        avg_loss = self.losses.sum() / self.params['rsi_period']
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            return math.nan
+        if avg_loss == 0:
+            return math.nan if avg_gain == 0 else 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def snapshot(self):
+        """
+        현재 상태의 지표 결과 (TechnicalAnalyzer.analyze_all과 같은 값, 'data' 제외)
+
+        Returns:
+            dict: rsi, macd, bollinger, volume, support_resistance, trend, cross, signals
+        """
+        if not self.bars:
+            return None
+
+        current = self.last_bar['Close']
+        rsi = self._rsi()
+
+        macd_value = self.ema['fast'] - self.ema['slow']
+        macd = {
+            'macd': macd_value,
+            'signal': self.ema['signal'],
+            'histogram': macd_value - self.ema['signal']
+        }
+
+        middle = self.bb.mean()
+        std = self.bb.std()
+        upper = middle + std * self.params['bb_std']
+        lower = middle - std * self.params['bb_std']
+        band = upper - lower
+        bollinger = {
+            'upper': upper,
+            'middle': middle,
+            'lower': lower,
+            'position': (current - lower) / band if band else math.nan
+        }
+
+        avg_volume = self.volume_ma.mean()
+        volume_ratio = self.last_bar['Volume'] / avg_volume if avg_volume > 0 else 1.0
+        volume = {
+            'current': self.last_bar['Volume'],
+            'average': avg_volume,
+            'ratio': volume_ratio,
+            'spike': volume_ratio > 1.5
+        }
+
+        high_max = max(self.highs)
+        low_min = min(self.lows)
+        support_resistance = {
+            'resistance': high_max,
+            'support': low_min,
+            'current': current,
+            'near_resistance': (high_max - current) / current < 0.03,
+            'near_support': (current - low_min) / current < 0.03
+        }
+
+        ma20, ma60, ma120 = (self.ma[period].mean() for period in (20, 60, 120))
+        trend = TechnicalAnalyzer.classify_trend(current, ma20, ma60, ma120)
+        cross = TechnicalAnalyzer.classify_cross(*self.prev_ma, ma20, ma60) if self.prev_ma else None
+
+        return {
+            'rsi': rsi,
+            'macd': macd,
+            'bollinger': bollinger,
+            'volume': volume,
+            'support_resistance': support_resistance,
+            'trend': trend,
+            'cross': cross,
+            'signals': TechnicalAnalyzer.build_signals(rsi, macd, volume, support_resistance, trend, cross),
+            'moving_averages': {f'MA{period}': rolling.mean() for period, rolling in self.ma.items()},
+            'date': self.last_date,
+            'bars': self.bars
+        }
+
+    # ==================== 저장/복원 ====================
+
+    def to_dict(self):
+        """JSON 직렬화용 상태"""
+        return {
+            'version': STATE_VERSION,
+            'params': self.params,
+            'ma': {str(period): rolling.to_dict() for period, rolling in self.ma.items()},
+            'bb': self.bb.to_dict(),
+            'volume_ma': self.volume_ma.to_dict(),
+            'gains': self.gains.to_dict(),
+            'losses': self.losses.to_dict(),
+            'highs': list(self.highs),
+            'lows': list(self.lows),
+            'ema': self.ema,
+            'prev_close': self.prev_close,
+            'prev_ma': self.prev_ma,
+            'last_bar': self.last_bar,
+            'last_date': self.last_date,
+            'bars': self.bars
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """저장된 상태 복원"""
+        state = cls(**data['params'])
+        state.ma = {int(period): RollingSum.from_dict(rolling) for period, rolling in data['ma'].items()}
+        state.bb = RollingSum.from_dict(data['bb'])
+        state.volume_ma = RollingSum.from_dict(data['volume_ma'])
+        state.gains = RollingSum.from_dict(data['gains'])
+        state.losses = RollingSum.from_dict(data['losses'])
+        state.highs.extend(data['highs'])
+        state.lows.extend(data['lows'])
+        state.ema = data['ema']
+        state.prev_close = data['prev_close']
+        state.prev_ma = tuple(data['prev_ma']) if data['prev_ma'] else None
+        state.last_bar = data['last_bar']
+        state.last_date = data['last_date']
+        state.bars = data['bars']
+        return state
+
+    def save(self, path):
+        """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """상태 파일 로드 (없거나 형식이 다르면 None)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != STATE_VERSION:
+                return None
+            return cls.from_dict(data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ 지표 상태 로드 실패 ({path}): {e}")
+            return None
+
+
+class IndicatorStateStore:
+    """종목별 증분 지표 상태 저장소 (모니터링/장중 갱신용)"""
+
+    def __init__(self, base_dir=None):
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent / 'data' / 'indicators'
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        safe_key = re.sub(r'[^0-9A-Za-z._=-]', '_', key)
+        return self.base_dir / f'{safe_key}.json'
+
+    def get(self, key):
+        """메모리 → 디스크 순으로 상태 조회 (없으면 None)"""
+        with self._lock:
+            if key not in self._states:
+                self._states[key] = IncrementalIndicators.load(self._path(key))
+            return self._states[key]
+
+    def put(self, key, state):
+        """상태 저장 (메모리 + 디스크)"""
+        with self._lock:
+            self._states[key] = state
+        try:
+            state.save(self._path(key))
+        except Exception as e:
+            print(f"⚠️ 지표 상태 저장 실패 ({key}): {e}")
+
+    def sync(self, key, price_data, provisional_last=True):
+        """
+        가격 데이터의 새 봉만 상태에 반영하고 최신 지표 결과 반환
+
+        저장된 상태의 마지막 날짜 이후 봉만 update하므로 이력 전체를 다시 계산하지 않습니다.
+        이력이 끊겼거나 상태가 없으면 전달된 데이터로 새로 만듭니다.
+
+        Args:
+            key (str): 종목 키
+            price_data (DataFrame): OHLCV 데이터 (한글/영문 컬럼 모두 가능)
+            provisional_last (bool): 마지막 봉을 장중 미완성 봉으로 보고 상태에 확정하지 않을지
+
+        Returns:
+            dict: 최신 지표 결과 (데이터가 없으면 None)
+        """
+        if price_data is None or price_data.empty:
+            return None
+
+        index = pd.DatetimeIndex(price_data.index)
+        final_count = len(price_data) - 1 if provisional_last else len(price_data)
+        state = self.get(key)
+
+        if state is not None and state.last_date is not None:
+            last_date = pd.Timestamp(state.last_date)
+            if len(index) and index[0] > last_date:
+                state = None  # 저장된 상태와 이력 사이에 빈 구간
+            else:
+                new_rows = price_data.iloc[:final_count][index[:final_count] > last_date]
+                if len(new_rows):
+                    state.extend(new_rows)
+                    self.put(key, state)
+        else:
+            state = None
+
+        if state is None:
+            state = IncrementalIndicators.from_history(price_data.iloc[:final_count])
+            self.put(key, state)
+
+        if provisional_last:
+            last_row = price_data.iloc[-1]
+            if state.last_date is None or index[-1] > pd.Timestamp(state.last_date):
+                return state.peek(last_row, index[-1])
+        return state.snapshot()
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_indicator_state_store = None
+_indicator_state_store_lock = threading.Lock()
+
+
+def get_indicator_state_store():
+    """전역 증분 지표 상태 저장소"""
+    global _indicator_state_store
+    if _indicator_state_store is None:
+        with _indicator_state_store_lock:
+            if _indicator_state_store is None:
+                _indicator_state_store = IndicatorStateStore()
+    return _indicator_state_store
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+공용 지표 엔진 (IndicatorFrame)
+요청당 한 번 가격 데이터를 NumPy 배열로 변환하고, 지표를 (지표, 파라미터) 단위로 메모이즈
+
+TechnicalAnalyzer, BollingerRSIAnalyzer, MovingAverageCrossAnalyzer, VolumeAnalyzer가
+같은 인스턴스를 공유하면 MA20/60/120, RSI, 볼린저 밴드, 거래량 MA를 한 번만 계산합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class IndicatorFrame:
+    """요청 단위 지표 캐시 (NumPy 배열 기반)"""
+
+    def __init__(self, df):
+        """
+        Args:
+            df (DataFrame): OHLCV 데이터 (columns: Open, High, Low, Close, Volume)
+        """
+        self.df = df
+        self.index = df.index
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    @classmethod
+    def of(cls, df, indicators=None):
+        """전달된 IndicatorFrame을 재사용하고, 없으면 새로 생성"""
+        if indicators is not None:
+            return indicators
+        return cls(df)
+
+    def _memo(self, key, compute):
+        """(지표, 파라미터) 키로 계산 결과 메모이즈"""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    # ==================== 원본 컬럼 ====================
+
+    def column(self, name):
+        """원본 컬럼을 float64 배열로 (복사는 최초 1회)"""
+        return self._memo(('column', name), lambda: self.df[name].to_numpy(dtype='float64'))
+
+    def series(self, values, name=None):
+        """배열을 원본 인덱스의 Series로 변환 (결과 출력용)"""
+        return pd.Series(values, index=self.index, name=name)
+
+    # ==================== 기본 연산 ====================
+
+    @staticmethod
+    def _rolling_sum(values, window):
+        """
+        이동 합계 (pandas rolling(window).sum()과 동일한 NaN 규칙)
+        창 안에 NaN이 하나라도 있으면 NaN
+        """
+        n = len(values)
+        result = np.full(n, np.nan)
+        if window <= 0 or n < window:
+            return result
+
+        is_nan = np.isnan(values)
+        filled = np.where(is_nan, 0.0, values)
+
+        csum = np.concatenate(([0.0], np.cumsum(filled)))
+        cnan = np.concatenate(([0], np.cumsum(is_nan)))
+
+        window_sum = csum[window:] - csum[:-window]
+        window_nan = cnan[window:] - cnan[:-window]
+
+        result[window - 1:] = np.where(window_nan == 0, window_sum, np.nan)
+        return result
+
+    @staticmethod
+    def _ema(values, span):
+        """지수 이동평균 (pandas ewm(span, adjust=False)와 동일)"""
+        return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+
+    # ==================== 이동평균/표준편차 ====================
+
+    def sma(self, period, column='Close'):
+        """단순 이동평균"""
+        def compute():
+            return self._rolling_sum(self.column(column), period) / period
+        return self._memo(('sma', column, period), compute)
+
+    def rolling_std(self, period, column='Close'):
+        """이동 표준편차 (표본 표준편차, ddof=1 - pandas 기본값과 동일)"""
+        def compute():
+            values = self.column(column)
+            if period < 2:
+                return np.full(len(values), np.nan)
+
+            # 큰 가격대에서 제곱합 상쇄 오차를 줄이기 위해 평균 기준으로 이동
+            valid = values[~np.isnan(values)]
+            offset = valid.mean() if len(valid) else 0.0
+            centered = values - offset
+
+            window_sum = self._rolling_sum(centered, period)
+            window_sq = self._rolling_sum(centered * centered, period)
+            variance = (window_sq - window_sum * window_sum / period) / (period - 1)
+            return np.sqrt(np.maximum(variance, 0.0))
+        return self._memo(('std', column, period), compute)
+
+    def ema(self, span, column='Close'):
+        """지수 이동평균"""
+        return self._memo(('ema', column, span), lambda: self._ema(self.column(column), span))
+
+    # ==================== 복합 지표 ====================
+
+    def rsi(self, period=14):
+        """RSI (단순 이동평균 방식, 기존 분석기와 동일한 정의)"""
+        def compute():
+            close = self.column('Close')
+            delta = np.diff(close, prepend=np.nan)
+            gain = np.where(delta > 0, delta, 0.0)
+            loss = np.where(delta < 0, -delta, 0.0)
+
+            avg_gain = self._rolling_sum(gain, period) / period
+            avg_loss = self._rolling_sum(loss, period) / period
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rs = avg_gain / avg_loss
+                return 100 - (100 / (1 + rs))
+        return self._memo(('rsi', period), compute)
+
+    def macd(self, fast=12, slow=26, signal=9):
+        """MACD (macd, signal, histogram 배열)"""
+        def compute():
+            macd_line = self.ema(fast) - self.ema(slow)
+            signal_line = self._ema(macd_line, signal)
+            return {
+                'macd': macd_line,
+                'signal': signal_line,
+                'histogram': macd_line - signal_line
+            }
+        return self._memo(('macd', fast, slow, signal), compute)
+
+    def bollinger(self, period=20, std_dev=2):
+        """볼린저 밴드 (upper, middle, lower, percent_b, width 배열)"""
+        def compute():
+            middle = self.sma(period)
+            std = self.rolling_std(period)
+            upper = middle + std * std_dev
+            lower = middle - std * std_dev
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                percent_b = (self.column('Close') - lower) / (upper - lower)
+                width = (upper - lower) / middle
+
+            return {
+                'upper': upper,
+                'middle': middle,
+                'lower': lower,
+                'percent_b': percent_b,
+                'width': width
+            }
+        return self._memo(('bollinger', period, std_dev), compute)
@@ -19,6 +19,11 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analyzers.indicator_frame import IndicatorFrame
 
 
 class MovingAverageCrossAnalyzer:
@@ -39,12 +44,13 @@ class MovingAverageCrossAnalyzer:
         self.long_period = long_period
         self.super_long_period = super_long_period
 
-    def analyze(self, df):
+    def analyze(self, df, indicators=None):
         """
         이동평균선 종합 분석
 
         Args:
             df: OHLCV 데이터프레임 (columns: Open, High, Low, Close, Volume)
+            indicators: 공유 지표 캐시 (IndicatorFrame, 없으면 새로 생성)
 
         Returns:
             dict: 분석 결과
@@ -60,11 +66,13 @@ class MovingAverageCrossAnalyzer:
                 'recommendations': []
             }
 
+        indicators = IndicatorFrame.of(df, indicators)
+
         # 1. 이동평균선 계산
-        ma_data = self._calculate_moving_averages(df)
+        ma_data = self._calculate_moving_averages(indicators)
 
         # 2. 골든크로스/데드크로스 감지
-        crosses = self._detect_crosses(df, ma_data)
+        crosses = self._detect_crosses(indicators)
 
         # 3. 이동평균선 배열 분석
         alignment = self._analyze_alignment(ma_data)
@@ -90,41 +98,45 @@ class MovingAverageCrossAnalyzer:
 
     # ==================== 이동평균선 계산 ====================
 
-    def _calculate_moving_averages(self, df):
-        """이동평균선 계산"""
-        df_copy = df.copy()
+    def _moving_average_lines(self, indicators):
+        """각 기간의 이동평균선 (공유 캐시에서 조회)"""
+        return {
+            'MA5': indicators.sma(self.short_period),
+            'MA20': indicators.sma(self.medium_period),
+            'MA60': indicators.sma(self.long_period),
+            'MA120': indicators.sma(self.super_long_period)
+        }
 
-        # 각 기간의 이동평균선 계산
-        df_copy['MA5'] = df_copy['Close'].rolling(window=self.short_period).mean()
-        df_copy['MA20'] = df_copy['Close'].rolling(window=self.medium_period).mean()
-        df_copy['MA60'] = df_copy['Close'].rolling(window=self.long_period).mean()
-        df_copy['MA120'] = df_copy['Close'].rolling(window=self.super_long_period).mean()
+    def _calculate_moving_averages(self, indicators):
+        """이동평균선 계산"""
+        lines = self._moving_average_lines(indicators)
 
         # 최근 데이터
-        latest = df_copy.iloc[-1]
-        current_price = latest['Close']
+        current_price = indicators.column('Close')[-1]
+        latest = {name: values[-1] for name, values in lines.items()}
 
         return {
             'current_price': float(current_price),
             'ma5': float(latest['MA5']) if not pd.isna(latest['MA5']) else None,
             'ma20': float(latest['MA20']) if not pd.isna(latest['MA20']) else None,
             'ma60': float(latest['MA60']) if not pd.isna(latest['MA60']) else None,
-            'ma120': float(latest['MA120']) if not pd.isna(latest['MA120']) else None,
-            'df_with_ma': df_copy  # 크로스 감지용
+            'ma120': float(latest['MA120']) if not pd.isna(latest['MA120']) else None
         }
 
     # ==================== 골든크로스/데드크로스 감지 ====================
 
-    def _detect_crosses(self, df, ma_data):
+    def _detect_crosses(self, indicators):
         """골든크로스/데드크로스 감지"""
         crosses = []
-        df_ma = ma_data['df_with_ma']
 
         # 최근 데이터만 확인 (최근 5일)
-        if len(df_ma) < 5:
+        if len(indicators) < 5:
             return crosses
 
-        recent_df = df_ma.tail(5)
+        lines = self._moving_average_lines(indicators)
+        recent_df = {name: values[-5:] for name, values in lines.items()}
+        recent_df['Close'] = indicators.column('Close')[-5:]
+        recent_df['date'] = indicators.index[-5:]
 
         # 1. MA5 x MA20 크로스 (단기)
         cross_5_20 = self._check_cross(recent_df, 'MA5', 'MA20')
@@ -188,34 +200,34 @@ class MovingAverageCrossAnalyzer:
 
         return crosses
 
-    def _check_cross(self, df, short_ma, long_ma):
-        """두 이동평균선의 크로스 체크"""
-        if len(df) < 2:
+    def _check_cross(self, recent, short_ma, long_ma):
+        """두 이동평균선의 크로스 체크 (recent: 최근 구간 배열 딕셔너리)"""
+        if len(recent['Close']) < 2:
             return None
 
         # 현재와 이전 데이터
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
+        short_now, short_prev = recent[short_ma][-1], recent[short_ma][-2]
+        long_now, long_prev = recent[long_ma][-1], recent[long_ma][-2]
 
         # NaN 체크
-        if pd.isna(current[short_ma]) or pd.isna(current[long_ma]) or \
-           pd.isna(previous[short_ma]) or pd.isna(previous[long_ma]):
+        if pd.isna(short_now) or pd.isna(long_now) or \
+           pd.isna(short_prev) or pd.isna(long_prev):
             return None
 
         # 골든크로스: 단기선이 장기선을 아래→위로 돌파
-        if previous[short_ma] <= previous[long_ma] and current[short_ma] > current[long_ma]:
+        if short_prev <= long_prev and short_now > long_now:
             return {
                 'type': 'golden',
-                'date': current.name,
-                'price': current['Close']
+                'date': recent['date'][-1],
+                'price': recent['Close'][-1]
             }
 
         # 데드크로스: 단기선이 장기선을 위→아래로 돌파
-        if previous[short_ma] >= previous[long_ma] and current[short_ma] < current[long_ma]:
+        if short_prev >= long_prev and short_now < long_now:
             return {
                 'type': 'dead',
-                'date': current.name,
-                'price': current['Close']
+                'date': recent['date'][-1],
+                'price': recent['Close'][-1]
             }
 
         return None
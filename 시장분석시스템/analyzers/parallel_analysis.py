@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 풀 분석 단계 (CPU 병렬화)
+
+기술적 분석/신뢰도 계산/Phase 3 분석기는 GIL을 잡는 pandas 연산이라
+스레드로는 코어 하나만 씁니다. 이 모듈은 가격 배열을 공유 메모리에 올리고
+워커 프로세스가 읽어 분석한 뒤 작은 결과 딕셔너리만 돌려줍니다.
+(DataFrame 자체는 피클링하지 않음)
+
+공유 메모리 레이아웃 (float64, shape=(6, n)):
+    0행: 날짜 (datetime64[ns] → int64 비트 그대로)
+    1~5행: Open, High, Low, Close, Volume
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ANALYSIS_MAX_WORKERS, ANALYSIS_TIMEOUT
+from utils.data_normalizer import normalize_dataframe
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def default_workers():
+    """
+    기본 워커 프로세스 수 (CPU 코어 수 ÷ 웹 워커 수)
+
+    gunicorn 워커마다 풀을 하나씩 만들므로 WEB_CONCURRENCY(gunicorn 워커 수)로 나눠
+    코어를 초과 배정하지 않습니다.
+    """
+    web_workers = max(1, int(os.environ.get('WEB_CONCURRENCY', '1') or 1))
+    return max(1, (os.cpu_count() or 1) // web_workers)
+
+
+def pool_context():
+    """
+    워커 생성 방식 (forkserver, 지원하지 않으면 spawn)
+
+    웹 워커에는 조회/이벤트 루프/갱신 스레드가 돌고 있어 fork하면 그 스레드가 잡고 있던
+    임포트·출력 잠금이 자식에 잠긴 채 복사될 수 있으므로 fork는 쓰지 않습니다.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+# ==================== 공유 메모리 변환 ====================
+
+def _to_shared(price_data):
+    """가격 데이터 → 공유 메모리 블록 (호출한 쪽이 해제 책임)"""
+    df = normalize_dataframe(price_data)
+    n = len(df)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 6 * n * 8))
+    block = np.ndarray((6, n), dtype='float64', buffer=shm.buf)
+    block[0].view('int64')[:] = pd.DatetimeIndex(df.index).values.astype('datetime64[ns]').view('int64')
+    for i, col in enumerate(OHLCV_COLUMNS, start=1):
+        block[i] = df[col].to_numpy(dtype='float64')
+
+    return shm, n
+
+
+def _from_shared(shm_name, n):
+    """공유 메모리 블록 → DataFrame (워커 쪽, 값은 복사해 블록과 분리)"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray((6, n), dtype='float64', buffer=shm.buf)
+        index = pd.DatetimeIndex(block[0].view('int64').copy().view('datetime64[ns]'))
+        df = pd.DataFrame({col: block[i].copy() for i, col in enumerate(OHLCV_COLUMNS, start=1)}, index=index)
+        del block
+        return df
+    finally:
+        shm.close()
+
+
+def _release(shm):
+    """공유 메모리 블록 해제"""
+    try:
+        shm.close()
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+# ==================== 워커 ====================
+
+def analyze_price_data(df, sentiment_result=None, include_phase3=False):
+    """
+    가격 데이터 분석 (워커 프로세스 또는 현재 프로세스에서 실행)
+
+    Args:
+        df (DataFrame): 정규화된 OHLCV 데이터 (Open, High, Low, Close, Volume)
+        sentiment_result (dict): 감성 분석 결과 (없으면 중립)
+        include_phase3 (bool): 패턴/볼린저&RSI/이동평균 크로스/거래량 분석 포함 여부
+
+    Returns:
+        dict: technical (DataFrame 제외), confidence, current_price [, phase3 요약]
+    """
+    from analyzers.indicator_frame import IndicatorFrame
+    from analyzers.technical_analyzer import TechnicalAnalyzer
+    from analyzers.confidence_calculator import ConfidenceCalculator
+
+    if sentiment_result is None:
+        sentiment_result = {
+            'overall_sentiment': 'neutral',
+            'overall_score': 0.5,
+            'positive_count': 0,
+            'negative_count': 0
+        }
+
+    indicators = IndicatorFrame(df)
+    technical_result = TechnicalAnalyzer(df, indicators).analyze_all()
+    technical_result.pop('data', None)
+
+    confidence = ConfidenceCalculator().calculate_confidence(technical_result, sentiment_result)
+
+    result = {
+        'technical': technical_result,
+        'confidence': confidence,
+        'current_price': float(df['Close'].iloc[-1])
+    }
+
+    if include_phase3:
+        from analyzers.pattern_analyzer import PatternAnalyzer
+        from analyzers.bollinger_rsi_analyzer import BollingerRSIAnalyzer
+        from analyzers.ma_cross_analyzer import MovingAverageCrossAnalyzer
+        from analyzers.volume_analyzer import VolumeAnalyzer
+
+        pattern_result = PatternAnalyzer().analyze_patterns(df)
+        result['patterns'] = {
+            'signal': pattern_result['pattern_signal'],
+            'score': pattern_result['pattern_score'],
+            'total_patterns': pattern_result['total_patterns']
+        }
+
+        bb_rsi_result = BollingerRSIAnalyzer().analyze(df, indicators)
+        result['bollinger_rsi'] = {
+            'signal': bb_rsi_result['combined_signal'],
+            'score': bb_rsi_result['combined_score']
+        }
+
+        for key, analyzer in (('ma_cross', MovingAverageCrossAnalyzer()), ('volume', VolumeAnalyzer())):
+            phase3_result = analyzer.analyze(df, indicators)
+            result[key] = {'signal': phase3_result['signal'], 'score': phase3_result['score']}
+
+    return result
+
+
+def _analyze_shared(shm_name, n, sentiment_result, include_phase3):
+    """워커 진입점: 공유 메모리에서 가격 배열을 읽어 분석"""
+    return analyze_price_data(_from_shared(shm_name, n), sentiment_result, include_phase3)
+
+
+# ==================== 프로세스 풀 ====================
+
+class AnalysisPool:
+    """분석 전용 프로세스 풀 (첫 작업 제출 시 생성)"""
+
+    def __init__(self, max_workers=None):
+        """
+        Args:
+            max_workers (int): 워커 프로세스 수 (기본값: config.ANALYSIS_MAX_WORKERS 또는 default_workers())
+        """
+        self.max_workers = max_workers or ANALYSIS_MAX_WORKERS or default_workers()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=pool_context())
+                print(f"⚙️ 분석 프로세스 풀 시작 (워커 {self.max_workers}개)")
+            return self._executor
+
+    def submit(self, price_data, sentiment_result=None, include_phase3=False):
+        """
+        분석 작업 제출
+
+        Args:
+            price_data (DataFrame): OHLCV 데이터 (한글/영문 컬럼 모두 가능)
+            sentiment_result (dict): 감성 분석 결과
+            include_phase3 (bool): Phase 3 분석기 포함 여부
+
+        Returns:
+            Future: analyze_price_data 결과 딕셔너리
+        """
+        shm, n = _to_shared(price_data)
+        try:
+            future = self._get_executor().submit(_analyze_shared, shm.name, n, sentiment_result, include_phase3)
+        except Exception:
+            _release(shm)
+            raise
+
+        # 워커가 읽고 나면 (성공/실패 무관) 블록 해제
+        future.add_done_callback(lambda _: _release(shm))
+        return future
+
+    def analyze(self, price_data, sentiment_result=None, include_phase3=False, timeout=None):
+        """
+        분석 작업 제출 후 결과 대기
+
+        Args:
+            timeout (float): 최대 대기 시간 (초, 기본값: config.ANALYSIS_TIMEOUT)
+
+        Raises:
+            concurrent.futures.TimeoutError: 시간 초과 (작업은 취소 시도)
+        """
+        return wait_result(self.submit(price_data, sentiment_result, include_phase3), timeout)
+
+    def map(self, items, include_phase3=False):
+        """
+        여러 종목 분석 (끝나는 순서대로 반환)
+
+        Args:
+            items (iterable): (키, 가격 데이터, 감성 분석 결과) 튜플
+
+        Yields:
+            tuple: (키, 결과 딕셔너리 또는 None)
+        """
+        futures = {}
+        for key, price_data, sentiment_result in items:
+            futures[self.submit(price_data, sentiment_result, include_phase3)] = key
+
+        try:
+            for future in as_completed(futures, timeout=ANALYSIS_TIMEOUT * max(1, len(futures) / self.max_workers)):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    print(f"⚠️ {futures[future]} 분석 실패: {e}")
+                    yield futures[future], None
+        except FutureTimeoutError:
+            # 남은 작업은 취소하고 실패로 반환
+            for future, key in futures.items():
+                if not future.done():
+                    future.cancel()
+                    print(f"⚠️ {key} 분석 시간 초과")
+                    yield key, None
+
+    def shutdown(self, wait=True):
+        """워커 프로세스 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+def wait_result(future, timeout=None):
+    """
+    분석 결과 대기 (시간 초과 시 작업 취소 후 TimeoutError)
+
+    Args:
+        future: AnalysisPool.submit 결과
+        timeout (float): 최대 대기 시간 (초, 기본값: config.ANALYSIS_TIMEOUT)
+    """
+    try:
+        return future.result(timeout=ANALYSIS_TIMEOUT if timeout is None else timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_analysis_pool = None
+_analysis_pool_lock = threading.Lock()
+
+
+def get_analysis_pool():
+    """전역 분석 프로세스 풀"""
+    global _analysis_pool
+    if _analysis_pool is None:
+        with _analysis_pool_lock:
+            if _analysis_pool is None:
+                _analysis_pool = AnalysisPool()
+    return _analysis_pool
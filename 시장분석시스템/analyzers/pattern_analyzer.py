@@ -9,11 +9,88 @@ import numpy as np
 from datetime import datetime, timedelta
 
 
+# 캔들스틱 패턴 정의 (키 → 표시 정보), 결과 정렬 순서도 이 순서를 따름
+CANDLESTICK_PATTERNS = {
+    'doji': {
+        'name': '도지 (Doji)',
+        'signal': 'neutral',
+        'reliability': 60,
+        'description': '시장의 우유부단함을 나타내며, 추세 전환 가능성',
+        'icon': '🔄'
+    },
+    'hammer': {
+        'name': '망치형 (Hammer)',
+        'signal': 'buy',
+        'reliability': 75,
+        'description': '하락 추세 후 나타나면 강력한 반등 신호',
+        'icon': '🔨'
+    },
+    'inverted_hammer': {
+        'name': '역망치형 (Inverted Hammer)',
+        'signal': 'buy',
+        'reliability': 70,
+        'description': '하락 후 매수 세력의 등장을 암시',
+        'icon': '🔨'
+    },
+    'shooting_star': {
+        'name': '유성형 (Shooting Star)',
+        'signal': 'sell',
+        'reliability': 75,
+        'description': '상승 추세 후 나타나면 하락 전환 경고',
+        'icon': '⭐'
+    },
+    'hanging_man': {
+        'name': '교수형 (Hanging Man)',
+        'signal': 'sell',
+        'reliability': 70,
+        'description': '상승 추세 후 나타나면 하락 전환 가능성',
+        'icon': '⚠️'
+    },
+    'bullish_engulfing': {
+        'name': '강세 잉걸핑 (Bullish Engulfing)',
+        'signal': 'buy',
+        'reliability': 80,
+        'description': '전일 음봉을 완전히 감싸는 큰 양봉, 강력한 매수 신호',
+        'icon': '📈'
+    },
+    'bearish_engulfing': {
+        'name': '약세 잉걸핑 (Bearish Engulfing)',
+        'signal': 'sell',
+        'reliability': 80,
+        'description': '전일 양봉을 완전히 감싸는 큰 음봉, 강력한 매도 신호',
+        'icon': '📉'
+    },
+    'morning_star': {
+        'name': '샛별형 (Morning Star)',
+        'signal': 'buy',
+        'reliability': 85,
+        'description': '하락 후 나타나는 3일 반등 패턴, 매우 강력한 매수 신호',
+        'icon': '🌟'
+    },
+    'evening_star': {
+        'name': '저녁별형 (Evening Star)',
+        'signal': 'sell',
+        'reliability': 85,
+        'description': '상승 후 나타나는 3일 하락 패턴, 매우 강력한 매도 신호',
+        'icon': '🌙'
+    },
+}
+
+# 1일 패턴 / 2~3일 패턴 구분
+SINGLE_CANDLE_PATTERNS = ['doji', 'hammer', 'inverted_hammer', 'shooting_star', 'hanging_man']
+MULTI_CANDLE_PATTERNS = ['bullish_engulfing', 'bearish_engulfing', 'morning_star', 'evening_star']
+
+
 class PatternAnalyzer:
     """차트 패턴 및 캔들스틱 패턴 인식기"""
 
-    def __init__(self):
+    def __init__(self, extrema_window=3):
+        """
+        Args:
+            extrema_window (int): 고점/저점 판단 시 좌우로 비교할 봉 개수
+        """
         self.patterns_found = []
+        self.extrema_window = extrema_window
 
     def analyze_patterns(self, df):
         """
@@ -71,83 +148,119 @@ class PatternAnalyzer:
         print("\n📈 캔들스틱 패턴 분석 중...")
 
         # 최근 5일 데이터만 분석 (패턴은 최근에 형성되어야 의미 있음)
-        recent_df = df.tail(5).copy()
+        recent_df = df.tail(5)
 
-        for i in range(len(recent_df)):
-            idx = recent_df.index[i]
-            row = recent_df.iloc[i]
-
-            # 도지 (Doji) - 시가와 종가가 거의 같음
-            if self._is_doji(row):
-                patterns.append({
-                    'name': '도지 (Doji)',
-                    'type': 'candlestick',
-                    'signal': 'neutral',
-                    'reliability': 60,
-                    'description': '시장의 우유부단함을 나타내며, 추세 전환 가능성',
-                    'date': idx,
-                    'icon': '🔄'
-                })
-
-            # 망치형 (Hammer) - 하락 추세에서 반등 신호
-            if self._is_hammer(row, df):
-                patterns.append({
-                    'name': '망치형 (Hammer)',
-                    'type': 'candlestick',
-                    'signal': 'buy',
-                    'reliability': 75,
-                    'description': '하락 추세 후 나타나면 강력한 반등 신호',
-                    'date': idx,
-                    'icon': '🔨'
-                })
-
-            # 역망치형 (Inverted Hammer)
-            if self._is_inverted_hammer(row, df):
-                patterns.append({
-                    'name': '역망치형 (Inverted Hammer)',
-                    'type': 'candlestick',
-                    'signal': 'buy',
-                    'reliability': 70,
-                    'description': '하락 후 매수 세력의 등장을 암시',
-                    'date': idx,
-                    'icon': '🔨'
-                })
-
-            # 유성형 (Shooting Star) - 상승 추세에서 하락 전환 신호
-            if self._is_shooting_star(row, df):
-                patterns.append({
-                    'name': '유성형 (Shooting Star)',
-                    'type': 'candlestick',
-                    'signal': 'sell',
-                    'reliability': 75,
-                    'description': '상승 추세 후 나타나면 하락 전환 경고',
-                    'date': idx,
-                    'icon': '⭐'
-                })
-
-            # 교수형 (Hanging Man) - 상승 후 하락 신호
-            if self._is_hanging_man(row, df):
-                patterns.append({
-                    'name': '교수형 (Hanging Man)',
-                    'type': 'candlestick',
-                    'signal': 'sell',
-                    'reliability': 70,
-                    'description': '상승 추세 후 나타나면 하락 전환 가능성',
-                    'date': idx,
-                    'icon': '⚠️'
-                })
+        # 추세 문맥은 전체 데이터의 최근 5일 추세 하나로 판단
+        masks = self.candlestick_masks(recent_df, trend=self._get_recent_trend(df, 5))
 
-        # 2일 패턴 분석
-        if len(recent_df) >= 2:
-            patterns.extend(self._analyze_two_candle_patterns(recent_df))
+        # 1일 패턴: 최근 5일 각각
+        for i in range(len(recent_df)):
+            for key in SINGLE_CANDLE_PATTERNS:
+                if masks[key][i]:
+                    patterns.append(self._candlestick_hit(key, recent_df.index[i]))
 
-        # 3일 패턴 분석
-        if len(recent_df) >= 3:
-            patterns.extend(self._analyze_three_candle_patterns(recent_df))
+        # 2일/3일 패턴: 마지막 날 기준
+        last = len(recent_df) - 1
+        for key in MULTI_CANDLE_PATTERNS:
+            if masks[key][last]:
+                patterns.append(self._candlestick_hit(key, recent_df.index[last]))
 
         print(f"   ✅ {len(patterns)}개 캔들스틱 패턴 발견")
         return patterns
 
+    def scan_candlestick_patterns(self, df, lookback=None):
+        """
+        캔들스틱 패턴 전체 이력 스캔 (벡터화)
+
+        모든 봉에 대해 패턴 조건을 배열 연산으로 한 번에 평가합니다.
+        추세 문맥은 각 봉까지의 최근 5일 추세를 사용합니다.
+
+        Args:
+            df (DataFrame): OHLCV 데이터 (Open, High, Low, Close)
+            lookback (int): 최근 N개 봉만 반환 (None이면 전체 이력)
+
+        Returns:
+            list: 패턴 목록 (날짜순, 같은 날짜는 패턴 정의 순서)
+        """
+        if df is None or len(df) == 0:
+            return []
+
+        masks = self.candlestick_masks(df)
+        first = max(0, len(df) - lookback) if lookback else 0
+
+        hits = []
+        for order, key in enumerate(CANDLESTICK_PATTERNS):
+            for pos in np.flatnonzero(masks[key][first:]) + first:
+                hits.append((pos, order, key))
+        hits.sort()
+
+        return [self._candlestick_hit(key, df.index[pos]) for pos, _, key in hits]
+
+    def candlestick_masks(self, df, trend=None):
+        """
+        캔들스틱 패턴별 불리언 마스크 계산
+
+        Args:
+            df (DataFrame): OHLCV 데이터 (Open, High, Low, Close)
+            trend (str): 추세 문맥 고정값 ('uptrend', 'downtrend', 'neutral').
+                None이면 봉마다 직전 5일 추세를 사용
+
+        Returns:
+            dict: {패턴 키: np.ndarray(bool)} - 각 봉에서 패턴이 완성되었는지
+        """
+        o = df['Open'].to_numpy(dtype='float64')
+        h = df['High'].to_numpy(dtype='float64')
+        l = df['Low'].to_numpy(dtype='float64')
+        c = df['Close'].to_numpy(dtype='float64')
+
+        body = np.abs(c - o)
+        range_val = h - l
+        lower_shadow = np.minimum(c, o) - l
+        upper_shadow = h - np.maximum(c, o)
+        has_range = range_val != 0
+        bearish = c < o
+
+        long_lower = has_range & (lower_shadow > body * 2) & (upper_shadow < body * 0.3)
+        long_upper = has_range & (upper_shadow > body * 2) & (lower_shadow < body * 0.3)
+        small_body = body < range_val * 0.3
+
+        uptrend, downtrend = self._trend_masks(c, trend)
+
+        # 전일/전전일 값 (앞쪽은 NaN → 비교 결과 False)
+        o1, c1 = self._shift(o, 1), self._shift(c, 1)
+        o2, c2 = self._shift(o, 2), self._shift(c, 2)
+
+        return {
+            'doji': (range_val > 0) & (body <= range_val * 0.1),
+            'hammer': long_lower & small_body & downtrend,
+            'inverted_hammer': long_upper & small_body & downtrend,
+            'shooting_star': long_upper & bearish & uptrend,
+            'hanging_man': long_lower & bearish & uptrend,
+            # 강세 잉걸핑: 전일 음봉을 당일 양봉이 감쌈
+            'bullish_engulfing': (c1 < o1) & (c > o) & (o < c1) & (c > o1),
+            # 약세 잉걸핑: 전일 양봉을 당일 음봉이 감쌈
+            'bearish_engulfing': (c1 > o1) & (c < o) & (o > c1) & (c < o1),
+            # 샛별형: 큰 음봉 → 작은 몸통 → 첫째날 중간 이상 마감하는 양봉
+            'morning_star': (c2 < o2) & (np.abs(c1 - o1) < np.abs(c2 - o2) * 0.5) &
+                            (c > o) & (c > (o2 + c2) / 2),
+            # 저녁별형: 큰 양봉 → 작은 몸통 → 첫째날 중간 이하 마감하는 음봉
+            'evening_star': (c2 > o2) & (np.abs(c1 - o1) < np.abs(c2 - o2) * 0.5) &
+                            (c < o) & (c < (o2 + c2) / 2),
+        }
+
+    def _candlestick_hit(self, key, date):
+        """패턴 키 → 결과 딕셔너리"""
+        meta = CANDLESTICK_PATTERNS[key]
+        return {
+            'name': meta['name'],
+            'type': 'candlestick',
+            'signal': meta['signal'],
+            'reliability': meta['reliability'],
+            'description': meta['description'],
+            'date': date,
+            'icon': meta['icon']
+        }
+
     def _analyze_chart_patterns(self, df):
         """차트 패턴 인식 (헤드앤숄더, 삼각수렴 등)"""
         patterns = []
@@ -157,13 +270,16 @@ class PatternAnalyzer:
         # 최근 20일 데이터로 패턴 분석
         recent_df = df.tail(20).copy()
 
+        # 고점/저점은 한 번만 계산해 패턴 감지기들이 공유
+        extrema = self.find_extrema(recent_df)
+
         # 헤드앤숄더 (Head and Shoulders)
-        head_shoulders = self._detect_head_and_shoulders(recent_df)
+        head_shoulders = self._detect_head_and_shoulders(recent_df, extrema)
         if head_shoulders:
             patterns.append(head_shoulders)
 
         # 역헤드앤숄더 (Inverse Head and Shoulders)
-        inv_head_shoulders = self._detect_inverse_head_and_shoulders(recent_df)
+        inv_head_shoulders = self._detect_inverse_head_and_shoulders(recent_df, extrema)
         if inv_head_shoulders:
             patterns.append(inv_head_shoulders)
 
@@ -173,7 +289,7 @@ class PatternAnalyzer:
             patterns.append(triangle)
 
         # 이중 천정/바닥 (Double Top/Bottom)
-        double_pattern = self._detect_double_pattern(recent_df)
+        double_pattern = self._detect_double_pattern(recent_df, extrema)
         if double_pattern:
             patterns.append(double_pattern)
 
@@ -185,184 +301,15 @@ class PatternAnalyzer:
         print(f"   ✅ {len(patterns)}개 차트 패턴 발견")
         return patterns
 
-    # ==================== 캔들스틱 패턴 판별 함수 ====================
-
-    def _is_doji(self, row):
-        """도지 패턴 (시가와 종가가 거의 같음)"""
-        body = abs(row['Close'] - row['Open'])
-        range_val = row['High'] - row['Low']
-        return body <= range_val * 0.1 if range_val > 0 else False
-
-    def _is_hammer(self, row, df):
-        """망치형 패턴 (긴 아래꼬리 + 짧은 몸통)"""
-        body = abs(row['Close'] - row['Open'])
-        lower_shadow = min(row['Close'], row['Open']) - row['Low']
-        upper_shadow = row['High'] - max(row['Close'], row['Open'])
-        range_val = row['High'] - row['Low']
-
-        # 망치형 조건: 아래꼬리가 몸통의 2배 이상, 위꼬리는 짧음
-        if range_val == 0:
-            return False
-
-        is_hammer_shape = (
-            lower_shadow > body * 2 and
-            upper_shadow < body * 0.3 and
-            body < range_val * 0.3
-        )
-
-        # 하락 추세 후에 나타나야 의미 있음
-        recent_trend = self._get_recent_trend(df, 5)
-        return is_hammer_shape and recent_trend == 'downtrend'
-
-    def _is_inverted_hammer(self, row, df):
-        """역망치형 패턴 (긴 위꼬리 + 짧은 몸통)"""
-        body = abs(row['Close'] - row['Open'])
-        lower_shadow = min(row['Close'], row['Open']) - row['Low']
-        upper_shadow = row['High'] - max(row['Close'], row['Open'])
-        range_val = row['High'] - row['Low']
-
-        if range_val == 0:
-            return False
-
-        is_inv_hammer_shape = (
-            upper_shadow > body * 2 and
-            lower_shadow < body * 0.3 and
-            body < range_val * 0.3
-        )
-
-        recent_trend = self._get_recent_trend(df, 5)
-        return is_inv_hammer_shape and recent_trend == 'downtrend'
-
-    def _is_shooting_star(self, row, df):
-        """유성형 패턴 (상승 후 긴 위꼬리)"""
-        body = abs(row['Close'] - row['Open'])
-        lower_shadow = min(row['Close'], row['Open']) - row['Low']
-        upper_shadow = row['High'] - max(row['Close'], row['Open'])
-        range_val = row['High'] - row['Low']
-
-        if range_val == 0:
-            return False
-
-        is_star_shape = (
-            upper_shadow > body * 2 and
-            lower_shadow < body * 0.3 and
-            row['Close'] < row['Open']  # 음봉
-        )
-
-        recent_trend = self._get_recent_trend(df, 5)
-        return is_star_shape and recent_trend == 'uptrend'
-
-    def _is_hanging_man(self, row, df):
-        """교수형 패턴 (상승 후 긴 아래꼬리)"""
-        body = abs(row['Close'] - row['Open'])
-        lower_shadow = min(row['Close'], row['Open']) - row['Low']
-        upper_shadow = row['High'] - max(row['Close'], row['Open'])
-        range_val = row['High'] - row['Low']
-
-        if range_val == 0:
-            return False
-
-        is_hanging_shape = (
-            lower_shadow > body * 2 and
-            upper_shadow < body * 0.3 and
-            row['Close'] < row['Open']  # 음봉
-        )
-
-        recent_trend = self._get_recent_trend(df, 5)
-        return is_hanging_shape and recent_trend == 'uptrend'
-
-    def _analyze_two_candle_patterns(self, df):
-        """2개 캔들 패턴 (Engulfing, Piercing 등)"""
-        patterns = []
-        if len(df) < 2:
-            return patterns
-
-        prev = df.iloc[-2]
-        curr = df.iloc[-1]
-
-        # 강세 잉걸핑 (Bullish Engulfing)
-        if (prev['Close'] < prev['Open'] and  # 전일 음봉
-            curr['Close'] > curr['Open'] and  # 당일 양봉
-            curr['Open'] < prev['Close'] and  # 당일 시가가 전일 종가보다 낮음
-            curr['Close'] > prev['Open']):    # 당일 종가가 전일 시가보다 높음
-            patterns.append({
-                'name': '강세 잉걸핑 (Bullish Engulfing)',
-                'type': 'candlestick',
-                'signal': 'buy',
-                'reliability': 80,
-                'description': '전일 음봉을 완전히 감싸는 큰 양봉, 강력한 매수 신호',
-                'date': df.index[-1],
-                'icon': '📈'
-            })
-
-        # 약세 잉걸핑 (Bearish Engulfing)
-        if (prev['Close'] > prev['Open'] and  # 전일 양봉
-            curr['Close'] < curr['Open'] and  # 당일 음봉
-            curr['Open'] > prev['Close'] and  # 당일 시가가 전일 종가보다 높음
-            curr['Close'] < prev['Open']):    # 당일 종가가 전일 시가보다 낮음
-            patterns.append({
-                'name': '약세 잉걸핑 (Bearish Engulfing)',
-                'type': 'candlestick',
-                'signal': 'sell',
-                'reliability': 80,
-                'description': '전일 양봉을 완전히 감싸는 큰 음봉, 강력한 매도 신호',
-                'date': df.index[-1],
-                'icon': '📉'
-            })
-
-        return patterns
-
-    def _analyze_three_candle_patterns(self, df):
-        """3개 캔들 패턴 (Morning/Evening Star 등)"""
-        patterns = []
-        if len(df) < 3:
-            return patterns
-
-        first = df.iloc[-3]
-        second = df.iloc[-2]
-        third = df.iloc[-1]
-
-        # 샛별형 (Morning Star) - 하락 후 반등
-        if (first['Close'] < first['Open'] and  # 첫째날: 큰 음봉
-            abs(second['Close'] - second['Open']) < abs(first['Close'] - first['Open']) * 0.5 and  # 둘째날: 작은 몸통
-            third['Close'] > third['Open'] and  # 셋째날: 양봉
-            third['Close'] > (first['Open'] + first['Close']) / 2):  # 셋째날 종가가 첫째날 중간 이상
-            patterns.append({
-                'name': '샛별형 (Morning Star)',
-                'type': 'candlestick',
-                'signal': 'buy',
-                'reliability': 85,
-                'description': '하락 후 나타나는 3일 반등 패턴, 매우 강력한 매수 신호',
-                'date': df.index[-1],
-                'icon': '🌟'
-            })
-
-        # 저녁별형 (Evening Star) - 상승 후 하락
-        if (first['Close'] > first['Open'] and  # 첫째날: 큰 양봉
-            abs(second['Close'] - second['Open']) < abs(first['Close'] - first['Open']) * 0.5 and  # 둘째날: 작은 몸통
-            third['Close'] < third['Open'] and  # 셋째날: 음봉
-            third['Close'] < (first['Open'] + first['Close']) / 2):  # 셋째날 종가가 첫째날 중간 이하
-            patterns.append({
-                'name': '저녁별형 (Evening Star)',
-                'type': 'candlestick',
-                'signal': 'sell',
-                'reliability': 85,
-                'description': '상승 후 나타나는 3일 하락 패턴, 매우 강력한 매도 신호',
-                'date': df.index[-1],
-                'icon': '🌙'
-            })
-
-        return patterns
-
     # ==================== 차트 패턴 판별 함수 ====================
 
-    def _detect_head_and_shoulders(self, df):
+    def _detect_head_and_shoulders(self, df, extrema=None):
         """헤드앤숄더 패턴 (하락 전환 신호)"""
         if len(df) < 15:
             return None
 
         # 고점 3개 찾기
-        peaks = self._find_peaks(df['High'], min_distance=3)
+        peaks = (extrema or self.find_extrema(df))['peaks']
         if len(peaks) < 3:
             return None
 
@@ -387,13 +334,13 @@ class PatternAnalyzer:
             }
         return None
 
-    def _detect_inverse_head_and_shoulders(self, df):
+    def _detect_inverse_head_and_shoulders(self, df, extrema=None):
         """역헤드앤숄더 패턴 (상승 전환 신호)"""
         if len(df) < 15:
             return None
 
         # 저점 3개 찾기
-        troughs = self._find_troughs(df['Low'], min_distance=3)
+        troughs = (extrema or self.find_extrema(df))['troughs']
         if len(troughs) < 3:
             return None
 
@@ -470,13 +417,15 @@ class PatternAnalyzer:
 
         return None
 
-    def _detect_double_pattern(self, df):
+    def _detect_double_pattern(self, df, extrema=None):
         """이중 천정/바닥 패턴"""
         if len(df) < 10:
             return None
 
+        extrema = extrema or self.find_extrema(df)
+
         # 고점 찾기
-        peaks = self._find_peaks(df['High'], min_distance=3)
+        peaks = extrema['peaks']
         if len(peaks) >= 2:
             last_two_peaks = peaks[-2:]
             peak1 = df['High'].iloc[last_two_peaks[0]]
@@ -495,7 +444,7 @@ class PatternAnalyzer:
                 }
 
         # 저점 찾기
-        troughs = self._find_troughs(df['Low'], min_distance=3)
+        troughs = extrema['troughs']
         if len(troughs) >= 2:
             last_two_troughs = troughs[-2:]
             trough1 = df['Low'].iloc[last_two_troughs[0]]
@@ -566,23 +515,68 @@ class PatternAnalyzer:
         else:
             return 'neutral'
 
+    def _trend_masks(self, close, trend=None, periods=5):
+        """봉별 상승/하락 추세 마스크 (_get_recent_trend와 같은 ±3% 기준)"""
+        n = len(close)
+        if trend is not None:
+            return np.full(n, trend == 'uptrend'), np.full(n, trend == 'downtrend')
+
+        # 각 봉까지 최근 periods일의 첫 종가 대비 변화율
+        first_close = self._shift(close, periods - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = (close - first_close) / first_close
+
+        return change > 0.03, change < -0.03
+
+    @staticmethod
+    def _shift(values, periods):
+        """배열을 뒤로 밀기 (앞쪽은 NaN)"""
+        shifted = np.full(len(values), np.nan)
+        if periods < len(values):
+            shifted[periods:] = values[:len(values) - periods]
+        return shifted
+
+    def find_extrema(self, df, window=None):
+        """
+        고점(High)/저점(Low) 위치를 한 번에 계산
+
+        Args:
+            df (DataFrame): OHLCV 데이터 (High, Low)
+            window (int): 좌우 비교 봉 개수 (None이면 extrema_window)
+
+        Returns:
+            dict: {'peaks': 고점 위치 배열, 'troughs': 저점 위치 배열}
+        """
+        window = self.extrema_window if window is None else window
+        return {
+            'peaks': self._find_peaks(df['High'], min_distance=window),
+            'troughs': self._find_troughs(df['Low'], min_distance=window)
+        }
+
     def _find_peaks(self, series, min_distance=3):
-        """고점 찾기"""
-        peaks = []
-        for i in range(min_distance, len(series) - min_distance):
-            if all(series.iloc[i] >= series.iloc[i - j] for j in range(1, min_distance + 1)):
-                if all(series.iloc[i] >= series.iloc[i + j] for j in range(1, min_distance + 1)):
-                    peaks.append(i)
-        return peaks
+        """고점 찾기 (좌우 min_distance개 봉보다 낮지 않은 위치)"""
+        return self._rolling_extrema(series, min_distance, 'max')
 
     def _find_troughs(self, series, min_distance=3):
-        """저점 찾기"""
-        troughs = []
-        for i in range(min_distance, len(series) - min_distance):
-            if all(series.iloc[i] <= series.iloc[i - j] for j in range(1, min_distance + 1)):
-                if all(series.iloc[i] <= series.iloc[i + j] for j in range(1, min_distance + 1)):
-                    troughs.append(i)
-        return troughs
+        """저점 찾기 (좌우 min_distance개 봉보다 높지 않은 위치)"""
+        return self._rolling_extrema(series, min_distance, 'min')
+
+    def _rolling_extrema(self, series, min_distance, how):
+        """
+        중심 이동 최대/최소와 같은 값인 위치 (O(n))
+
+        창(좌우 min_distance개 + 자신)이 다 차지 않는 양 끝과
+        창 안에 NaN이 있는 위치는 제외됩니다.
+        """
+        values = pd.Series(np.asarray(series, dtype='float64'))
+        rolling = values.rolling(window=2 * min_distance + 1, center=True)
+
+        if how == 'max':
+            is_extreme = values >= rolling.max()
+        else:
+            is_extreme = values <= rolling.min()
+
+        return np.flatnonzero(is_extreme.to_numpy())
 
     def _calculate_slope(self, values):
         """추세선 기울기 계산"""
@@ -4,8 +4,11 @@ AI 감성 분석 모듈
 뉴스 제목/내용의 긍정/부정 감성 분석
 """
 
+import hashlib
+import os
 import re
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 
 
 class SentimentAnalyzer:
@@ -81,6 +84,73 @@ class SentimentAnalyzer:
             '발표', '공시', '보고', '설명', '회의', '결정', '유지', '동결'
         ]
 
+        # 긍정/부정 키워드를 하나의 정규식으로 미리 컴파일 (텍스트당 1회 스캔)
+        self._keyword_polarity, self._keyword_pattern = self._compile_keywords()
+
+    def _compile_keywords(self):
+        """
+        긍정/부정 키워드 매처 생성
+
+        Returns:
+            tuple: (키워드 → 'positive'/'negative' 딕셔너리, 컴파일된 정규식)
+        """
+        polarity = {}
+        for keyword in self.positive_keywords:
+            polarity.setdefault(keyword.lower(), 'positive')
+        for keyword in self.negative_keywords:
+            polarity.setdefault(keyword.lower(), 'negative')
+
+        return polarity, re.compile(self._trie_pattern(polarity))
+
+    @staticmethod
+    def _trie_pattern(keywords):
+        """
+        키워드 목록 → 접두사 트리 형태 정규식
+
+        공통 접두사를 묶어 한 위치에서 후보를 한 번에 좁히고,
+        긴 키워드를 먼저 시도해 겹치는 키워드('하락'/'하락세')는 가장 긴 것 하나만 매칭합니다.
+        """
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[''] = True
+
+        def build(node):
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches:
+                return ''
+            if '' in node:
+                return '(?:' + '|'.join(branches) + ')?'
+            if len(branches) == 1:
+                return branches[0]
+            return '(?:' + '|'.join(branches) + ')'
+
+        return build(trie)
+
+    def match_keywords(self, text):
+        """
+        텍스트에서 긍정/부정 키워드 매칭 (한 번의 스캔)
+
+        Args:
+            text (str): 분석할 텍스트
+
+        Returns:
+            dict: {'positive': [키워드], 'negative': [키워드]} (등장 순서, 중복 제거)
+        """
+        matched = {'positive': [], 'negative': []}
+        if not text:
+            return matched
+
+        seen = set()
+        for keyword in self._keyword_pattern.findall(text.lower()):
+            if keyword not in seen:
+                seen.add(keyword)
+                matched[self._keyword_polarity[keyword]].append(keyword)
+
+        return matched
+
     def analyze_text(self, text):
         """
         텍스트 감성 분석
@@ -98,11 +168,10 @@ class SentimentAnalyzer:
                 'confidence': 0
             }
 
-        text = text.lower()
-
         # 키워드 카운트
-        positive_count = sum(1 for keyword in self.positive_keywords if keyword in text)
-        negative_count = sum(1 for keyword in self.negative_keywords if keyword in text)
+        matched = self.match_keywords(text)
+        positive_count = len(matched['positive'])
+        negative_count = len(matched['negative'])
         total_count = positive_count + negative_count
 
         if total_count == 0:
@@ -133,7 +202,8 @@ class SentimentAnalyzer:
             'sentiment': sentiment,
             'confidence': confidence,
             'positive_count': positive_count,
-            'negative_count': negative_count
+            'negative_count': negative_count,
+            'matched_keywords': matched
         }
 
     def analyze_news_list(self, news_list):
@@ -253,13 +323,29 @@ class AdvancedSentimentAnalyzer:
     """
     Transformer 기반 고급 감성 분석
     초기 로딩에 시간이 걸리므로 선택적 사용
+
+    CPU 서버용: 여러 텍스트를 배치로 추론하고, 같은 텍스트 결과는 캐시에서 재사용
     """
 
-    def __init__(self):
+    LABELS = ['negative', 'neutral', 'positive']  # 모델 레이블 순서
+
+    def __init__(self, batch_size=16, num_threads=None, cache_size=5000):
+        """
+        Args:
+            batch_size (int): 한 번에 추론할 텍스트 수
+            num_threads (int): torch CPU 스레드 수 (기본값: min(4, CPU 코어 수))
+            cache_size (int): 결과 캐시 최대 개수 (오래된 것부터 제거)
+        """
         self.model = None
         self.tokenizer = None
         self.loaded = False
 
+        self.batch_size = batch_size
+        self.num_threads = num_threads or min(4, os.cpu_count() or 1)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # 텍스트 해시 → 결과
+        self._lock = threading.Lock()
+
     def load_model(self):
         """모델 로드 (처음 한 번만)"""
         try:
@@ -268,12 +354,15 @@ class AdvancedSentimentAnalyzer:
 
             print("🤖 AI 감성 분석 모델 로딩 중... (최초 1회, 수 분 소요)")
 
+            torch.set_num_threads(self.num_threads)
+
             model_name = "cardiffnlp/twitter-roberta-base-sentiment"
             self.tokenizer = AutoTokenizer.from_pretrained(model_name)
             self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            self.model.eval()
 
             self.loaded = True
-            print("✅ AI 모델 로드 완료")
+            print(f"✅ AI 모델 로드 완료 (CPU 스레드: {self.num_threads})")
             return True
 
         except ImportError:
@@ -285,34 +374,87 @@ class AdvancedSentimentAnalyzer:
 
     def analyze_text(self, text):
         """AI 기반 감성 분석"""
-        if not self.loaded:
-            if not self.load_model():
-                return None
+        return self.analyze_batch([text])[0]
 
+    def analyze_batch(self, texts):
+        """
+        여러 텍스트 배치 감성 분석
+
+        캐시에 없는 텍스트만 중복 제거 후 batch_size 단위로 패딩해 추론합니다.
+
+        Args:
+            texts (list): 분석할 텍스트 리스트
+
+        Returns:
+            list: 입력 순서대로 결과 딕셔너리 (실패한 항목은 None)
+        """
+        if not texts:
+            return []
+
+        keys = [self._cache_key(text) for text in texts]
+
+        # 캐시 미스 텍스트 (중복 제거)
+        pending = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                elif key not in pending:
+                    pending[key] = text
+
+        if pending:
+            if not self.loaded and not self.load_model():
+                return [None] * len(texts)
+
+            pending_keys = list(pending)
+            for i in range(0, len(pending_keys), self.batch_size):
+                chunk = pending_keys[i:i + self.batch_size]
+                results = self._infer([pending[key] for key in chunk])
+                if results is None:
+                    continue
+                with self._lock:
+                    for key, result in zip(chunk, results):
+                        self._cache[key] = result
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        with self._lock:
+            return [dict(self._cache[key]) if key in self._cache else None for key in keys]
+
+    def _infer(self, texts):
+        """한 배치 추론 (실패 시 None)"""
         try:
             import torch
 
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-            outputs = self.model(**inputs)
-            scores = torch.nn.functional.softmax(outputs.logits, dim=1)
+            inputs = self.tokenizer(texts, return_tensors="pt", padding=True,
+                                    truncation=True, max_length=512)
+            with torch.inference_mode():
+                outputs = self.model(**inputs)
+                scores = torch.nn.functional.softmax(outputs.logits, dim=1).tolist()
 
-            # 레이블: 0=negative, 1=neutral, 2=positive
-            labels = ['negative', 'neutral', 'positive']
-            scores_dict = {labels[i]: scores[0][i].item() for i in range(3)}
+            results = []
+            for row in scores:
+                scores_dict = {label: row[i] for i, label in enumerate(self.LABELS)}
 
-            # 최고 점수 레이블
-            max_label = max(scores_dict, key=scores_dict.get)
+                # 최고 점수 레이블
+                max_label = max(scores_dict, key=scores_dict.get)
 
-            return {
-                'sentiment': max_label,
-                'scores': scores_dict,
-                'confidence': scores_dict[max_label]
-            }
+                results.append({
+                    'sentiment': max_label,
+                    'scores': scores_dict,
+                    'confidence': scores_dict[max_label]
+                })
+            return results
 
         except Exception as e:
             print(f"❌ AI 분석 실패: {str(e)}")
             return None
 
+    @staticmethod
+    def _cache_key(text):
+        """텍스트 해시 (캐시 키)"""
+        return hashlib.sha1((text or '').strip().encode('utf-8')).hexdigest()
+
 
 # 테스트 코드
 if __name__ == "__main__":
@@ -11,24 +11,27 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import MA_PERIODS, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL
+from analyzers.indicator_frame import IndicatorFrame
 
 
 class TechnicalAnalyzer:
     """기술적 지표 분석기"""
 
-    def __init__(self, data):
+    def __init__(self, data, indicators=None):
         """
         Args:
             data (DataFrame): OHLCV 데이터 (종가, 고가, 저가, 거래량)
+            indicators (IndicatorFrame): 다른 분석기와 공유할 지표 캐시 (없으면 새로 생성)
         """
         self.data = data.copy()
+        self.indicators = IndicatorFrame.of(data, indicators)
         self.signals = {}
 
     def calculate_ma(self, periods=MA_PERIODS):
         """이동평균선 계산"""
         for period in periods:
             col_name = f'MA{period}'
-            self.data[col_name] = self.data['Close'].rolling(window=period).mean()
+            self.data[col_name] = self.indicators.sma(period)
 
         return self.data
 
@@ -37,44 +40,36 @@ class TechnicalAnalyzer:
         RSI (Relative Strength Index) 계산
         0-100 범위, 70 이상 과매수, 30 이하 과매도
         """
-        delta = self.data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        rsi = self.indicators.rsi(period)
 
         self.data['RSI'] = rsi
-        return rsi.iloc[-1]
+        return rsi[-1]
 
     def calculate_macd(self, fast=MACD_FAST, slow=MACD_SLOW, signal=MACD_SIGNAL):
         """
         MACD (Moving Average Convergence Divergence) 계산
         """
-        exp1 = self.data['Close'].ewm(span=fast, adjust=False).mean()
-        exp2 = self.data['Close'].ewm(span=slow, adjust=False).mean()
-
-        macd = exp1 - exp2
-        macd_signal = macd.ewm(span=signal, adjust=False).mean()
-        macd_hist = macd - macd_signal
+        macd_result = self.indicators.macd(fast, slow, signal)
+        macd = macd_result['macd']
+        macd_signal = macd_result['signal']
+        macd_hist = macd_result['histogram']
 
         self.data['MACD'] = macd
         self.data['MACD_Signal'] = macd_signal
         self.data['MACD_Hist'] = macd_hist
 
         return {
-            'macd': macd.iloc[-1],
-            'signal': macd_signal.iloc[-1],
-            'histogram': macd_hist.iloc[-1]
+            'macd': macd[-1],
+            'signal': macd_signal[-1],
+            'histogram': macd_hist[-1]
         }
 
     def calculate_bollinger_bands(self, period=20, std_dev=2):
         """볼린저 밴드 계산"""
-        sma = self.data['Close'].rolling(window=period).mean()
-        std = self.data['Close'].rolling(window=period).std()
-
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
+        bands = self.indicators.bollinger(period, std_dev)
+        sma = bands['middle']
+        upper_band = bands['upper']
+        lower_band = bands['lower']
 
         self.data['BB_Upper'] = upper_band
         self.data['BB_Middle'] = sma
@@ -82,17 +77,17 @@ class TechnicalAnalyzer:
 
         current_price = self.data['Close'].iloc[-1]
         return {
-            'upper': upper_band.iloc[-1],
-            'middle': sma.iloc[-1],
-            'lower': lower_band.iloc[-1],
-            'position': (current_price - lower_band.iloc[-1]) / (upper_band.iloc[-1] - lower_band.iloc[-1])
+            'upper': upper_band[-1],
+            'middle': sma[-1],
+            'lower': lower_band[-1],
+            'position': (current_price - lower_band[-1]) / (upper_band[-1] - lower_band[-1])
         }
 
     def calculate_volume_analysis(self):
         """거래량 분석"""
-        avg_volume = self.data['Volume'].rolling(window=20).mean()
+        avg_volume = self.indicators.sma(20, 'Volume')
         current_volume = self.data['Volume'].iloc[-1]
-        avg_volume_20 = avg_volume.iloc[-1]
+        avg_volume_20 = avg_volume[-1]
 
         volume_ratio = current_volume / avg_volume_20 if avg_volume_20 > 0 else 1.0
 
@@ -129,11 +124,16 @@ class TechnicalAnalyzer:
 
     def analyze_trend(self):
         """추세 분석 (이동평균선 정배열/역배열)"""
-        ma20 = self.data['MA20'].iloc[-1]
-        ma60 = self.data['MA60'].iloc[-1]
-        ma120 = self.data['MA120'].iloc[-1]
-        current = self.data['Close'].iloc[-1]
-
+        return self.classify_trend(
+            self.data['Close'].iloc[-1],
+            self.data['MA20'].iloc[-1],
+            self.data['MA60'].iloc[-1],
+            self.data['MA120'].iloc[-1]
+        )
+
+    @staticmethod
+    def classify_trend(current, ma20, ma60, ma120):
+        """현재가/이동평균 값으로 추세 판정 (증분 지표와 공용)"""
         # 정배열: 단기 > 중기 > 장기
         if current > ma20 > ma60 > ma120:
             return {
@@ -174,8 +174,13 @@ class TechnicalAnalyzer:
         if len(ma20) < 2 or len(ma60) < 2:
             return None
 
+        return self.classify_cross(ma20[0], ma60[0], ma20[1], ma60[1])
+
+    @staticmethod
+    def classify_cross(prev_ma20, prev_ma60, ma20, ma60):
+        """직전/현재 MA20·MA60으로 크로스 판정 (증분 지표와 공용)"""
         # 골든크로스: MA20이 MA60을 상향 돌파
-        if ma20[0] <= ma60[0] and ma20[1] > ma60[1]:
+        if prev_ma20 <= prev_ma60 and ma20 > ma60:
             return {
                 'type': 'golden_cross',
                 'description': '골든크로스 발생 (매수 신호)',
@@ -184,7 +189,7 @@ class TechnicalAnalyzer:
             }
 
         # 데드크로스: MA20이 MA60을 하향 돌파
-        if ma20[0] >= ma60[0] and ma20[1] < ma60[1]:
+        if prev_ma20 >= prev_ma60 and ma20 < ma60:
             return {
                 'type': 'dead_cross',
                 'description': '데드크로스 발생 (매도 신호)',
@@ -194,21 +199,9 @@ class TechnicalAnalyzer:
 
         return None
 
-    def analyze_all(self):
-        """모든 기술적 지표 종합 분석"""
-        print("📊 기술적 지표 분석 중...")
-
-        # 모든 지표 계산
-        self.calculate_ma()
-        rsi = self.calculate_rsi()
-        macd = self.calculate_macd()
-        bb = self.calculate_bollinger_bands()
-        volume = self.calculate_volume_analysis()
-        sr = self.find_support_resistance()
-        trend = self.analyze_trend()
-        cross = self.detect_golden_cross()
-
-        # 신호 판단
+    @staticmethod
+    def build_signals(rsi, macd, volume, sr, trend, cross):
+        """지표 값으로 매수/매도 신호 목록 생성 (증분 지표와 공용)"""
         signals = []
 
         # RSI 신호
@@ -304,6 +297,25 @@ class TechnicalAnalyzer:
                 'score': score
             })
 
+        return signals
+
+    def analyze_all(self):
+        """모든 기술적 지표 종합 분석"""
+        print("📊 기술적 지표 분석 중...")
+
+        # 모든 지표 계산
+        self.calculate_ma()
+        rsi = self.calculate_rsi()
+        macd = self.calculate_macd()
+        bb = self.calculate_bollinger_bands()
+        volume = self.calculate_volume_analysis()
+        sr = self.find_support_resistance()
+        trend = self.analyze_trend()
+        cross = self.detect_golden_cross()
+
+        # 신호 판단
+        signals = self.build_signals(rsi, macd, volume, sr, trend, cross)
+
         result = {
             'rsi': rsi,
             'macd': macd,
@@ -25,6 +25,11 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analyzers.indicator_frame import IndicatorFrame
 
 
 class VolumeAnalyzer:
@@ -43,12 +48,13 @@ class VolumeAnalyzer:
         self.medium_period = medium_period
         self.long_period = long_period
 
-    def analyze(self, df):
+    def analyze(self, df, indicators=None):
         """
         거래량 종합 분석
 
         Args:
             df: OHLCV 데이터프레임 (columns: Open, High, Low, Close, Volume)
+            indicators: 공유 지표 캐시 (IndicatorFrame, 없으면 새로 생성)
 
         Returns:
             dict: 분석 결과
@@ -69,7 +75,7 @@ class VolumeAnalyzer:
         current_volume = self._analyze_current_volume(df)
 
         # 2. 거래량 이동평균 분석
-        volume_ma = self._analyze_volume_ma(df)
+        volume_ma = self._analyze_volume_ma(df, IndicatorFrame.of(df, indicators))
 
         # 3. 거래량 급등/급락 감지
         volume_surge = self._detect_volume_surge(df, volume_ma)
@@ -170,22 +176,20 @@ class VolumeAnalyzer:
 
     # ==================== 거래량 이동평균 분석 ====================
 
-    def _analyze_volume_ma(self, df):
+    def _analyze_volume_ma(self, df, indicators):
         """거래량 이동평균 분석"""
-        df_copy = df.copy()
-
-        # 거래량 이동평균 계산
-        df_copy['Volume_MA5'] = df_copy['Volume'].rolling(window=self.short_period).mean()
-        df_copy['Volume_MA20'] = df_copy['Volume'].rolling(window=self.medium_period).mean()
-        df_copy['Volume_MA60'] = df_copy['Volume'].rolling(window=self.long_period).mean()
-
-        latest = df_copy.iloc[-1]
+        # 거래량 이동평균 계산 (공유 캐시에서 조회)
+        latest = {
+            'Volume_MA5': indicators.sma(self.short_period, 'Volume')[-1],
+            'Volume_MA20': indicators.sma(self.medium_period, 'Volume')[-1],
+            'Volume_MA60': indicators.sma(self.long_period, 'Volume')[-1]
+        }
 
         return {
             'ma5': int(latest['Volume_MA5']) if not pd.isna(latest['Volume_MA5']) else None,
             'ma20': int(latest['Volume_MA20']) if not pd.isna(latest['Volume_MA20']) else None,
             'ma60': int(latest['Volume_MA60']) if not pd.isna(latest['Volume_MA60']) else None,
-            'trend': self._get_volume_trend(df_copy)
+            'trend': self._get_volume_trend(df)
         }
 
     def _get_volume_trend(self, df):
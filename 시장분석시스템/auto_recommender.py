@@ -6,7 +6,8 @@
 import sys
 import io
 from datetime import datetime
-import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
 import pandas as pd
 
 # Windows 한글 출력 문제 해결 (__main__일 때만)
@@ -21,15 +22,55 @@ from collectors.crypto_collector import CryptoCollector
 from collectors.naver_news_collector import NaverNewsCollector
 from collectors.google_news_collector import GoogleNewsCollector
 from collectors.economic_event_collector import EconomicEventCollector
+from collectors.krx_stock_list import get_krx_list
 from analyzers.technical_analyzer import TechnicalAnalyzer
 from analyzers.sentiment_analyzer import SentimentAnalyzer
 from analyzers.confidence_calculator import ConfidenceCalculator
+from utils.data_normalizer import normalize_dataframe
+from config import SCAN_MAX_WORKERS
 
 
 class AutoRecommender:
     """자동 종목 추천기 (Phase 2-2, 2-3 통합)"""
 
-    def __init__(self):
+    # 기본 스캔 대상 (주요 종목 + 중소형주)
+    DEFAULT_KOREAN_STOCKS = [
+        # 대형주
+        ('005930.KS', '삼성전자'),
+        ('000660.KS', 'SK하이닉스'),
+        ('035420.KS', 'NAVER'),
+        ('035720.KQ', '카카오'),
+        ('373220.KS', 'LG에너지솔루션'),
+        ('005380.KS', '현대차'),
+        ('207940.KS', '삼성바이오로직스'),
+        ('006400.KS', '삼성SDI'),
+        ('051910.KS', 'LG화학'),
+        ('068270.KS', '셀트리온'),
+        # 중형주
+        ('003670.KS', '포스코퓨처엠'),
+        ('096770.KS', 'SK이노베이션'),
+        ('086520.KS', '에코프로'),
+        ('247540.KS', '에코프로비엠'),
+        ('042700.KS', '한미반도체'),
+        ('058470.KS', '리노공업'),
+        ('000270.KS', '기아'),
+        ('012330.KS', '현대모비스'),
+        ('066570.KS', 'LG전자'),
+        ('028260.KS', '삼성물산'),
+        # 테마주 (2차전지, AI, 반도체)
+        ('091990.KS', '셀트리온헬스케어'),
+        ('326030.KS', 'SK바이오팜'),
+        ('348210.KQ', '넥스틴'),
+        ('357780.KS', '솔브레인'),
+        ('361610.KS', 'SK아이이테크놀로지')
+    ]
+
+    def __init__(self, analysis_pool=None):
+        """
+        Args:
+            analysis_pool (AnalysisPool): CPU 분석을 맡길 프로세스 풀 (없으면 스캔 스레드에서 직접 분석)
+        """
+        self.analysis_pool = analysis_pool
         self.stock_collector = StockCollector()
         self.crypto_collector = CryptoCollector()
         self.news_collector = NaverNewsCollector()
@@ -181,53 +222,42 @@ class AutoRecommender:
         # 0-100 범위 제한
         return max(0, min(100, int(hot_score)))
 
-    def scan_korean_stocks(self, stock_list=None):
+    def scan_korean_stocks(self, stock_list=None, max_workers=None):
         """
         한국 주식 스캔
 
         Args:
             stock_list (list): 스캔할 종목 리스트 (None이면 기본 종목)
+            max_workers (int): 동시 분석 종목 수 (기본값: config.SCAN_MAX_WORKERS)
 
         Returns:
             list: 추천 종목 리스트
         """
+        return list(self.iter_scan_korean_stocks(stock_list, max_workers))
+
+    def iter_scan_korean_stocks(self, stock_list=None, max_workers=None):
+        """
+        한국 주식 동시 스캔 (추천 종목을 분석이 끝나는 순서대로 반환)
+
+        워커 풀에서 종목별 수집/분석을 동시에 실행하고, 외부 요청 속도는
+        수집기의 호스트별 토큰 버킷(utils.rate_limiter)이 조절합니다.
+        대기 작업은 워커 수의 2배까지만 만들어 전체 종목(약 2,700개) 스캔도 메모리가 일정합니다.
+
+        Args:
+            stock_list (list): 스캔할 (티커, 종목명) 리스트 (None이면 기본 종목)
+            max_workers (int): 동시 분석 종목 수 (기본값: config.SCAN_MAX_WORKERS)
+
+        Yields:
+            dict: 추천 종목
+        """
         if stock_list is None:
-            # 기본 스캔 대상 (주요 종목 + 중소형주)
-            stock_list = [
-                # 대형주
-                ('005930.KS', '삼성전자'),
-                ('000660.KS', 'SK하이닉스'),
-                ('035420.KS', 'NAVER'),
-                ('035720.KQ', '카카오'),
-                ('373220.KS', 'LG에너지솔루션'),
-                ('005380.KS', '현대차'),
-                ('207940.KS', '삼성바이오로직스'),
-                ('006400.KS', '삼성SDI'),
-                ('051910.KS', 'LG화학'),
-                ('068270.KS', '셀트리온'),
-                # 중형주
-                ('003670.KS', '포스코퓨처엠'),
-                ('096770.KS', 'SK이노베이션'),
-                ('086520.KS', '에코프로'),
-                ('247540.KS', '에코프로비엠'),
-                ('042700.KS', '한미반도체'),
-                ('058470.KS', '리노공업'),
-                ('000270.KS', '기아'),
-                ('012330.KS', '현대모비스'),
-                ('066570.KS', 'LG전자'),
-                ('028260.KS', '삼성물산'),
-                # 테마주 (2차전지, AI, 반도체)
-                ('091990.KS', '셀트리온헬스케어'),
-                ('326030.KS', 'SK바이오팜'),
-                ('348210.KQ', '넥스틴'),
-                ('357780.KS', '솔브레인'),
-                ('361610.KS', 'SK아이이테크놀로지')
-            ]
+            stock_list = self.DEFAULT_KOREAN_STOCKS
 
-        recommendations = []
+        max_workers = max_workers or SCAN_MAX_WORKERS
+        recommended = 0
 
         print(f"\n{'='*60}")
-        print(f"📊 한국 주식 스캔 시작 ({len(stock_list)}개 종목)")
+        print(f"📊 한국 주식 스캔 시작 ({len(stock_list)}개 종목, 동시 {max_workers}개)")
         print(f"{'='*60}\n")
 
         # Phase 2-3: 향후 30일간의 경제 이벤트 조회
@@ -239,138 +269,185 @@ class AutoRecommender:
             print(f"   ⚠️ 경제 이벤트 로딩 실패: {str(e)}")
             all_events = []
 
-        for ticker, name in stock_list:
-            try:
-                print(f"🔍 {name} ({ticker}) 분석 중...")
+        stocks = iter(stock_list)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scan') as executor:
+            pending = {
+                executor.submit(self._scan_korean_stock, ticker, name, all_events)
+                for ticker, name in islice(stocks, max_workers * 2)
+            }
 
-                # 데이터 수집
-                price_data = self.stock_collector.get_stock_data(ticker, period='3mo')
-                if price_data is None or price_data.empty:
-                    print(f"   ⚠️ 데이터 없음")
-                    continue
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
 
-                # 기술적 분석
-                tech_analyzer = TechnicalAnalyzer(price_data)
-                technical_result = tech_analyzer.analyze_all()
+                # 끝난 만큼 다음 종목 투입
+                for ticker, name in islice(stocks, len(done)):
+                    pending.add(executor.submit(self._scan_korean_stock, ticker, name, all_events))
 
-                rsi = technical_result.get('rsi', 50)
-
-                # 거래량 급증 감지
-                is_surge, surge_pct, volume_score = self.detect_volume_surge(price_data)
-
-                # 가격 모멘텀 감지
-                momentum_type, momentum_score, momentum_desc = self.detect_price_momentum(price_data)
-
-                # 다중 소스 뉴스 수집 (Phase 2-2)
-                naver_news = self.news_collector.get_news(name, max_count=10)
-                # Google News는 시간이 오래 걸릴 수 있으므로 옵션으로 처리
-                # google_news = self.google_news_collector.get_news(name, max_count=5, language='ko')
-                # all_news = naver_news + google_news
-                news_list = naver_news  # 일단 네이버만 사용 (속도 우선)
-
-                sentiment_result = self.sentiment_analyzer.analyze_news_list(news_list)
-
-                # Phase 2-3: 종목 관련 경제 이벤트 필터링
-                event_impact_score = 0
-                relevant_events = []
-                try:
-                    if all_events:
-                        relevant_events = self.event_collector.filter_events_by_stock(
-                            all_events, name, ticker
-                        )
-
-                        if relevant_events:
-                            # 가장 중요한 이벤트의 영향도 계산
-                            top_event = max(relevant_events,
-                                          key=lambda e: self.event_collector.get_event_impact_score(e))
-                            impact_score = self.event_collector.get_event_impact_score(top_event)
-                            # 최대 +20점으로 제한 (영향도 100점 → 20점으로 스케일링)
-                            event_impact_score = min(20, impact_score / 5)
-                except Exception as e:
-                    print(f"   ⚠️ 이벤트 필터링 오류: {str(e)}")
+                for future in done:
+                    recommendation = future.result()
+                    if recommendation:
+                        recommended += 1
+                        yield recommendation
 
-                # 신뢰도 계산
-                calculator = ConfidenceCalculator()
-                confidence = calculator.calculate_confidence(technical_result, sentiment_result)
+        print(f"\n{'='*60}")
+        print(f"✅ 스캔 완료: {recommended}개 종목 추천")
+        print(f"{'='*60}\n")
 
-                # 핫 점수 계산 (Phase 2-3: 이벤트 영향 반영)
-                hot_score = self.calculate_hot_score(
-                    technical_result,
-                    sentiment_result,
-                    volume_score,
-                    momentum_score,
-                    confidence['score'],
-                    event_impact_score  # Phase 2-3
-                )
-
-                # 추천 기준 충족 여부 (핫 점수 15 이상 또는 기존 신뢰도 45 이상)
-                if hot_score >= 15 or (confidence['score'] >= 45 and confidence['signal'] in ['buy', 'strong_buy']):
-                    current_price = price_data['종가'].iloc[-1]
+    def _analyze_technical(self, price_data, sentiment_result):
+        """
+        기술적 분석 + 신뢰도 계산
+
+        Returns:
+            tuple: (기술적 분석 결과, 신뢰도 결과)
+        """
+        if self.analysis_pool is not None:
+            analysis = self.analysis_pool.analyze(price_data, sentiment_result)
+            return analysis['technical'], analysis['confidence']
+
+        # 분석기는 영문 컬럼명 사용
+        technical_result = TechnicalAnalyzer(normalize_dataframe(price_data)).analyze_all()
+        confidence = ConfidenceCalculator().calculate_confidence(technical_result, sentiment_result)
+        return technical_result, confidence
+
+    def get_krx_universe(self):
+        """
+        코스피+코스닥 전체 종목 (스캔 대상)
+
+        Returns:
+            list: [(티커, 종목명)]
+        """
+        stock_list = get_krx_list().stock_list
+        if stock_list is None:
+            return []
+        return list(zip(stock_list['Ticker'], stock_list['Name']))
 
-                    # 추천 근거에 핫 요인 추가
-                    hot_reasons = []
-                    if is_surge:
-                        hot_reasons.append({
-                            'category': '거래량',
-                            'reason': f'거래량 {surge_pct:.0f}% 급증',
-                            'impact': '상'
-                        })
-                    if momentum_type in ['strong_uptrend', 'uptrend']:
-                        hot_reasons.append({
-                            'category': '모멘텀',
-                            'reason': momentum_desc,
-                            'impact': '상' if momentum_type == 'strong_uptrend' else '중'
-                        })
-
-                    # Phase 2-3: 경제 이벤트 추가
-                    if relevant_events and event_impact_score > 0:
+    def _scan_korean_stock(self, ticker, name, all_events):
+        """
+        한 종목 수집/분석 (워커 스레드에서 실행)
+
+        Returns:
+            dict or None: 추천 기준을 충족하면 추천 정보
+        """
+        try:
+            print(f"🔍 {name} ({ticker}) 분석 중...")
+
+            # 데이터 수집
+            price_data = self.stock_collector.get_stock_data(ticker, period='3mo')
+            if price_data is None or price_data.empty:
+                print(f"   ⚠️ {name} 데이터 없음")
+                return None
+
+            # 다중 소스 뉴스 수집 (Phase 2-2)
+            naver_news = self.news_collector.get_news(name, max_count=10)
+            # Google News는 시간이 오래 걸릴 수 있으므로 옵션으로 처리
+            # google_news = self.google_news_collector.get_news(name, max_count=5, language='ko')
+            # all_news = naver_news + google_news
+            news_list = naver_news  # 일단 네이버만 사용 (속도 우선)
+
+            sentiment_result = self.sentiment_analyzer.analyze_news_list(news_list)
+
+            # 기술적 분석 + 신뢰도 계산 (프로세스 풀이 있으면 워커 프로세스에서)
+            technical_result, confidence = self._analyze_technical(price_data, sentiment_result)
+
+            rsi = technical_result.get('rsi', 50)
+
+            # 거래량 급증 감지
+            is_surge, surge_pct, volume_score = self.detect_volume_surge(price_data)
+
+            # 가격 모멘텀 감지
+            momentum_type, momentum_score, momentum_desc = self.detect_price_momentum(price_data)
+
+            # Phase 2-3: 종목 관련 경제 이벤트 필터링
+            event_impact_score = 0
+            relevant_events = []
+            try:
+                if all_events:
+                    relevant_events = self.event_collector.filter_events_by_stock(
+                        all_events, name, ticker
+                    )
+
+                    if relevant_events:
+                        # 가장 중요한 이벤트의 영향도 계산
                         top_event = max(relevant_events,
                                       key=lambda e: self.event_collector.get_event_impact_score(e))
-                        event_date = top_event['date'][:10] if isinstance(top_event['date'], str) else top_event['date'].strftime('%Y-%m-%d')
-                        hot_reasons.append({
-                            'category': '이벤트',
-                            'reason': f'{event_date} {top_event["name"]}',
-                            'impact': '상' if event_impact_score >= 15 else '중'
-                        })
-
-                    all_reasons = hot_reasons + confidence['reasons'][:3]
+                        impact_score = self.event_collector.get_event_impact_score(top_event)
+                        # 최대 +20점으로 제한 (영향도 100점 → 20점으로 스케일링)
+                        event_impact_score = min(20, impact_score / 5)
+            except Exception as e:
+                print(f"   ⚠️ 이벤트 필터링 오류: {str(e)}")
+
+            # 핫 점수 계산 (Phase 2-3: 이벤트 영향 반영)
+            hot_score = self.calculate_hot_score(
+                technical_result,
+                sentiment_result,
+                volume_score,
+                momentum_score,
+                confidence['score'],
+                event_impact_score  # Phase 2-3
+            )
+
+            # 추천 기준 충족 여부 (핫 점수 15 이상 또는 기존 신뢰도 45 이상)
+            if hot_score >= 15 or (confidence['score'] >= 45 and confidence['signal'] in ['buy', 'strong_buy']):
+                current_price = price_data['종가'].iloc[-1]
+
+                # 추천 근거에 핫 요인 추가
+                hot_reasons = []
+                if is_surge:
+                    hot_reasons.append({
+                        'category': '거래량',
+                        'reason': f'거래량 {surge_pct:.0f}% 급증',
+                        'impact': '상'
+                    })
+                if momentum_type in ['strong_uptrend', 'uptrend']:
+                    hot_reasons.append({
+                        'category': '모멘텀',
+                        'reason': momentum_desc,
+                        'impact': '상' if momentum_type == 'strong_uptrend' else '중'
+                    })
 
-                    recommendations.append({
-                        'ticker': ticker,
-                        'name': name,
-                        'current_price': current_price,
-                        'confidence': confidence['score'],
-                        'signal': confidence['signal'],
-                        'rsi': rsi,
-                        'hot_score': hot_score,  # 핫 점수 추가
-                        'is_hot': hot_score >= 70,  # 70점 이상이면 "HOT" 표시
-                        'reasons': all_reasons[:5],  # 상위 5개
-                        'scan_time': datetime.now()
+                # Phase 2-3: 경제 이벤트 추가
+                if relevant_events and event_impact_score > 0:
+                    top_event = max(relevant_events,
+                                  key=lambda e: self.event_collector.get_event_impact_score(e))
+                    event_date = top_event['date'][:10] if isinstance(top_event['date'], str) else top_event['date'].strftime('%Y-%m-%d')
+                    hot_reasons.append({
+                        'category': '이벤트',
+                        'reason': f'{event_date} {top_event["name"]}',
+                        'impact': '상' if event_impact_score >= 15 else '중'
                     })
 
-                    hot_emoji = '🔥' if hot_score >= 70 else '✅'
-                    print(f"   {hot_emoji} 추천! 핫점수 {hot_score}, 신뢰도 {confidence['score']}%, RSI {rsi:.1f}")
-                    if is_surge:
-                        print(f"      💹 거래량 {surge_pct:.0f}% 급증!")
-                    if momentum_type in ['strong_uptrend', 'uptrend']:
-                        print(f"      📈 {momentum_desc}")
-                    if relevant_events and event_impact_score > 0:
-                        print(f"      📅 경제 이벤트 영향 +{event_impact_score:.1f}점 ({len(relevant_events)}개 관련 이벤트)")
-                else:
-                    print(f"   ❌ 기준 미달 (핫점수 {hot_score}, 신뢰도 {confidence['score']}%, RSI {rsi:.1f})")
+                all_reasons = hot_reasons + confidence['reasons'][:3]
+
+                recommendation = {
+                    'ticker': ticker,
+                    'name': name,
+                    'current_price': current_price,
+                    'confidence': confidence['score'],
+                    'signal': confidence['signal'],
+                    'rsi': rsi,
+                    'hot_score': hot_score,  # 핫 점수 추가
+                    'is_hot': hot_score >= 70,  # 70점 이상이면 "HOT" 표시
+                    'reasons': all_reasons[:5],  # 상위 5개
+                    'scan_time': datetime.now()
+                }
 
-                # 요청 간 딜레이
-                time.sleep(1)
+                hot_emoji = '🔥' if hot_score >= 70 else '✅'
+                print(f"   {hot_emoji} {name} 추천! 핫점수 {hot_score}, 신뢰도 {confidence['score']}%, RSI {rsi:.1f}")
+                if is_surge:
+                    print(f"      💹 거래량 {surge_pct:.0f}% 급증!")
+                if momentum_type in ['strong_uptrend', 'uptrend']:
+                    print(f"      📈 {momentum_desc}")
+                if relevant_events and event_impact_score > 0:
+                    print(f"      📅 경제 이벤트 영향 +{event_impact_score:.1f}점 ({len(relevant_events)}개 관련 이벤트)")
+                return recommendation
 
-            except Exception as e:
-                print(f"   ❌ 오류: {str(e)}")
-                continue
+            print(f"   ❌ {name} 기준 미달 (핫점수 {hot_score}, 신뢰도 {confidence['score']}%, RSI {rsi:.1f})")
 
-        print(f"\n{'='*60}")
-        print(f"✅ 스캔 완료: {len(recommendations)}개 종목 추천")
-        print(f"{'='*60}\n")
+            return None
 
-        return recommendations
+        except Exception as e:
+            print(f"   ❌ {name} 오류: {str(e)}")
+            return None
 
     def scan_cryptocurrencies(self, coin_list=None):
         """
@@ -403,12 +480,14 @@ class AutoRecommender:
         print(f"🪙 가상화폐 스캔 시작 ({len(coin_list)}개 코인)")
         print(f"{'='*60}\n")
 
+        # 가격 이력은 공용 이벤트 루프에서 한 번에 동시 조회 (CoinGecko 호스트 예산 안에서)
+        price_map = self.crypto_collector.get_crypto_data_many([coin_id for coin_id, _ in coin_list], days=90)
+
         for coin_id, coin_name in coin_list:
             try:
                 print(f"🔍 {coin_name} ({coin_id}) 분석 중...")
 
-                # 데이터 수집
-                price_data = self.crypto_collector.get_crypto_data(coin_id, days=90)
+                price_data = price_map.get(coin_id)
                 if price_data is None or price_data.empty:
                     print(f"   ⚠️ 데이터 없음")
                     continue
@@ -455,9 +534,6 @@ class AutoRecommender:
                 else:
                     print(f"   ❌ 기준 미달 (신뢰도 {confidence['score']}%, RSI {rsi:.1f})")
 
-                # CoinGecko API 제한 방지 (무료 API는 분당 10-30 요청)
-                time.sleep(3)
-
             except Exception as e:
                 print(f"   ❌ 오류: {str(e)}")
                 continue
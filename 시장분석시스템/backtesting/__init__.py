@@ -4,5 +4,8 @@
 """
 from .backtest_engine import BacktestEngine
 from .performance_tracker import PerformanceTracker
+from .vectorized_backtest import VectorizedBacktester
+from .param_sweep import ParameterSweep
+from .walk_forward import WalkForwardReplay
 
-__all__ = ['BacktestEngine', 'PerformanceTracker']
+__all__ = ['BacktestEngine', 'PerformanceTracker', 'VectorizedBacktester', 'ParameterSweep', 'WalkForwardReplay']
@@ -14,6 +14,8 @@ from collectors.stock_collector import StockCollector
 from analyzers.technical_analyzer import TechnicalAnalyzer
 from analyzers.sentiment_analyzer import SentimentAnalyzer
 from auto_recommender import AutoRecommender
+from backtesting.vectorized_backtest import VectorizedBacktester
+from backtesting.walk_forward import WalkForwardReplay
 
 
 class BacktestEngine:
@@ -94,6 +96,55 @@ class BacktestEngine:
 
         return result
 
+    def backtest_signals(self, tickers, period='2y', hold_days=5):
+        """
+        신뢰도 신호 벡터화 백테스트 (종목당 이력 1회 수집/계산)
+
+        신호가 발생한 모든 봉에서 진입하고 config의 손절/손익비로 청산합니다.
+
+        Args:
+            tickers: 종목 코드 리스트
+            period: 이력 기간
+            hold_days: 최대 보유 기간 (일)
+
+        Returns:
+            dict: summary + 종목별 결과 (적중률, CAGR, 최대 낙폭, 샤프)
+        """
+        backtester = VectorizedBacktester(hold_days=hold_days, stock_collector=self.stock_collector)
+        result = backtester.run_universe(tickers, period)
+
+        summary = result['summary']
+        if summary['tested']:
+            print(f"\n📊 신호 백테스트: {summary['tested']}/{summary['tickers']}개 종목, 거래 {summary['total_trades']}건")
+            print(f"적중률: {summary['hit_rate']:.1f}%, 평균 CAGR: {summary['avg_cagr']:+.2f}%, "
+                  f"평균 최대 낙폭: {summary['avg_max_drawdown']:.2f}%, 평균 샤프: {summary['avg_sharpe']:.2f}")
+
+        return result
+
+    def replay_hot_stocks(self, start_date, end_date=None, stock_list=None, exact=False):
+        """
+        핫 종목 추천 워크포워드 리플레이
+
+        각 날짜 시점으로 이력을 잘라 AutoRecommender의 거래량 급증/모멘텀/신뢰도/핫 점수를
+        재현하고, 추천 종목의 1/5/20일 후 수익률을 기록합니다.
+
+        Args:
+            start_date: 리플레이 시작 날짜 (YYYY-MM-DD)
+            end_date: 리플레이 종료 날짜 (None이면 현재)
+            stock_list: (티커, 종목명) 리스트 (None이면 추천 엔진 기본 종목)
+            exact: 날짜마다 실제 분석기를 실행하는 정밀 모드 여부
+
+        Returns:
+            dict: summary + records (DataFrame)
+        """
+        replay = WalkForwardReplay(stock_collector=self.stock_collector)
+        result = replay.run(stock_list, start_date, end_date, exact=exact)
+
+        if not result['records'].empty:
+            replay.save(result['records'])
+
+        return result
+
     def backtest_hot_stocks(self, test_date, hold_days=5):
         """
         특정 날짜의 핫 종목 추천 백테스트
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+신뢰도 모델 파라미터 스윕 (그리드 서치)
+가중치(WEIGHTS) × 매수 임계값(SIGNAL_THRESHOLDS['buy']) × RSI/MACD 기간 조합을
+캐시된 이력으로 평가하고 순위표를 만듭니다.
+
+- 구성 점수(기술/거래량/지지저항)와 봉별 진입 성과(손절/익절/보유 만료 수익률)는
+  지표 파라미터 세트마다 한 번만 계산
+- 각 조합은 가중합 + 임계값 비교뿐이라 행렬 연산으로 수천 개를 한 번에 평가
+- 지표 파라미터 세트 단위로 프로세스 풀에 분산
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL, MA_PERIODS,
+    STOP_LOSS_PERCENT, RISK_REWARD_RATIO, ANALYSIS_MAX_WORKERS
+)
+from analyzers.indicator_frame import IndicatorFrame
+from backtesting.vectorized_backtest import component_scores, simulate_trades, TRADING_DAYS
+from utils.data_normalizer import normalize_dataframe
+
+WEIGHT_KEYS = ['technical', 'sentiment', 'volume', 'support']  # config.WEIGHTS 키 순서
+
+
+def weight_grid(step=0.1, minimum=0.0):
+    """
+    합이 1인 가중치 조합 전체
+
+    Args:
+        step (float): 가중치 간격
+        minimum (float): 각 가중치 최솟값
+
+    Returns:
+        ndarray: (조합 수, 4) - WEIGHT_KEYS 순서
+    """
+    units = int(round(1 / step))
+    low = int(round(minimum / step))
+    combos = [
+        (a, b, c, units - a - b - c)
+        for a, b, c in itertools.product(range(low, units + 1), repeat=3)
+        if units - a - b - c >= low
+    ]
+    return np.array(combos, dtype='float64') / units
+
+
+def _bar_dataset(df, rsi_period, macd_params, hold_days, stop_loss, risk_reward, warmup):
+    """
+    한 종목의 (구성 점수 행렬, 봉별 진입 수익률) - 진입 가능한 봉만
+
+    Returns:
+        tuple: (ndarray (m, 3) technical/volume/support, ndarray (m,) 수익률)
+    """
+    indicators = IndicatorFrame(df)
+    components = component_scores(df, indicators, rsi_period, *macd_params)
+
+    # 모든 봉에서 진입했을 때의 거래 결과 (조합과 무관하게 한 번만)
+    n = len(df)
+    trades, _ = simulate_trades(df, np.ones(n, dtype=bool), hold_days, stop_loss, risk_reward)
+
+    bars = slice(warmup, n - hold_days)
+    features = np.column_stack([components['technical'], components['volume'], components['support']])[bars]
+    returns = trades['return'].to_numpy()[warmup:]
+    return features, returns
+
+
+def _evaluate_group(features, returns, weights, thresholds, sentiment, hold_days):
+    """
+    지표 파라미터 세트 하나에 대해 (가중치 × 임계값) 조합 평가 (워커 프로세스)
+
+    Returns:
+        dict: 조합별 지표 배열 (shape: 가중치 수 × 임계값 수)
+    """
+    # (m, 가중치 수) 신뢰도 행렬: 기술/거래량/지지 가중합 + 감성 상수항
+    scores = (features @ weights[:, [0, 2, 3]].T + sentiment * weights[:, 1]) * 100
+    scores = np.clip(scores, 0, 100)
+
+    wins = (returns > 0).astype('float64')
+    count = np.empty((len(weights), len(thresholds)))
+    win_count = np.empty_like(count)
+    ret_sum = np.empty_like(count)
+    ret_sq = np.empty_like(count)
+
+    for j, threshold in enumerate(thresholds):
+        mask = (scores >= threshold).astype('float64')  # (m, 가중치 수)
+        count[:, j] = mask.sum(axis=0)
+        win_count[:, j] = wins @ mask
+        ret_sum[:, j] = returns @ mask
+        ret_sq[:, j] = (returns * returns) @ mask
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = ret_sum / count
+        std = np.sqrt(np.maximum(ret_sq / count - mean * mean, 0) * count / (count - 1))
+        sharpe = np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS / hold_days), 0.0)
+        hit_rate = win_count / count * 100
+
+    return {
+        'trades': count,
+        'hit_rate': np.nan_to_num(hit_rate),
+        'avg_return': np.nan_to_num(mean * 100),
+        'sharpe': np.nan_to_num(sharpe)
+    }
+
+
+class ParameterSweep:
+    """신뢰도 가중치/임계값/지표 기간 그리드 서치"""
+
+    def __init__(self, hold_days=5, stop_loss=STOP_LOSS_PERCENT, risk_reward=RISK_REWARD_RATIO,
+                 sentiment=0.5, warmup=None, max_workers=None, stock_collector=None):
+        """
+        Args:
+            hold_days (int): 최대 보유 봉 수
+            stop_loss (float): 손절 비율
+            risk_reward (float): 손익비
+            sentiment (float): 과거 구간 감성 점수 (뉴스 이력이 없어 기본 중립)
+            warmup (int): 지표 안정화 구간 (기본값: 최장 이동평균 기간)
+            max_workers (int): 워커 프로세스 수 (기본값: config.ANALYSIS_MAX_WORKERS 또는 CPU 코어 수)
+            stock_collector (StockCollector): 가격 수집기 (없으면 필요할 때 생성)
+        """
+        self.hold_days = hold_days
+        self.stop_loss = stop_loss
+        self.risk_reward = risk_reward
+        self.sentiment = sentiment
+        self.warmup = warmup if warmup is not None else max(MA_PERIODS)
+        self.max_workers = max_workers or ANALYSIS_MAX_WORKERS or os.cpu_count() or 1
+        self._stock_collector = stock_collector
+        self.price_data = {}
+        self.results_dir = os.path.join(os.path.dirname(__file__), 'results')
+
+    @property
+    def stock_collector(self):
+        """가격 수집기 (필요할 때 생성)"""
+        if self._stock_collector is None:
+            from collectors.stock_collector import StockCollector
+            self._stock_collector = StockCollector()
+        return self._stock_collector
+
+    def load(self, tickers, period='2y'):
+        """종목 이력 로드 (바 저장소 캐시 사용)"""
+        for ticker in tickers:
+            price_data = self.stock_collector.get_stock_data(ticker, period=period)
+            if price_data is None or len(price_data) <= self.warmup + self.hold_days:
+                print(f"⚠️ {ticker} 데이터 부족 - 제외")
+                continue
+            self.add(ticker, price_data)
+
+        print(f"✅ 스윕 대상 {len(self.price_data)}개 종목 로드")
+        return self
+
+    def add(self, ticker, price_data):
+        """이미 가진 가격 데이터 추가"""
+        df = normalize_dataframe(price_data)
+        df.index = pd.to_datetime(df.index)
+        self.price_data[ticker] = df
+        return self
+
+    def _dataset(self, rsi_period, macd_params):
+        """전체 종목 데이터셋 (종목별 진입 가능 봉을 이어 붙임)"""
+        parts = [
+            _bar_dataset(df, rsi_period, macd_params, self.hold_days, self.stop_loss, self.risk_reward, self.warmup)
+            for df in self.price_data.values()
+            if len(df) > self.warmup + self.hold_days
+        ]
+        if not parts:
+            return np.empty((0, 3)), np.empty(0)
+        return np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
+
+    def run(self, weights=None, thresholds=None, rsi_periods=None, macd_params=None,
+            min_trades=30, sort_by='sharpe'):
+        """
+        그리드 서치 실행
+
+        Args:
+            weights (ndarray): (조합 수, 4) 가중치 - WEIGHT_KEYS 순서 (기본값: 0.1 간격 전체)
+            thresholds (list): 매수 임계값 후보 (기본값: 50~75, 2.5 간격)
+            rsi_periods (list): RSI 기간 후보
+            macd_params (list): (fast, slow, signal) 후보
+            min_trades (int): 순위에 포함할 최소 거래 수
+            sort_by (str): 정렬 기준 (sharpe, hit_rate, avg_return)
+
+        Returns:
+            DataFrame: 조합별 성과 순위표
+        """
+        if not self.price_data:
+            print("❌ 스윕할 가격 데이터가 없습니다")
+            return pd.DataFrame()
+
+        weights = weight_grid() if weights is None else np.asarray(weights, dtype='float64')
+        thresholds = np.asarray(thresholds if thresholds is not None else np.arange(50, 75.1, 2.5), dtype='float64')
+        rsi_periods = rsi_periods or [9, RSI_PERIOD, 21]
+        macd_params = macd_params or [(MACD_FAST, MACD_SLOW, MACD_SIGNAL), (8, 17, 9), (5, 35, 5)]
+        groups = list(itertools.product(rsi_periods, macd_params))
+
+        total = len(weights) * len(thresholds) * len(groups)
+        print(f"🔍 파라미터 스윕: {total:,}개 조합 ({len(groups)}개 지표 세트 × "
+              f"{len(weights)}개 가중치 × {len(thresholds)}개 임계값)")
+
+        # 구성 점수는 부모 프로세스에서 한 번, 조합 평가는 지표 세트 단위로 분산
+        datasets = [self._dataset(rsi_period, macd) for rsi_period, macd in groups]
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+            futures = [
+                executor.submit(_evaluate_group, features, returns, weights, thresholds,
+                                self.sentiment, self.hold_days)
+                for features, returns in datasets
+            ]
+            evaluations = [future.result() for future in futures]
+
+        table = self._to_table(groups, weights, thresholds, evaluations)
+        table = table[table['trades'] >= min_trades]
+        table = table.sort_values([sort_by, 'trades'], ascending=False).reset_index(drop=True)
+        table.index += 1
+
+        print(f"✅ 스윕 완료: 최소 거래 {min_trades}건 이상 {len(table):,}개 조합")
+        return table
+
+    @staticmethod
+    def _to_table(groups, weights, thresholds, evaluations):
+        """평가 결과 → 조합별 행"""
+        w_index, t_index = np.meshgrid(np.arange(len(weights)), np.arange(len(thresholds)), indexing='ij')
+        w_index, t_index = w_index.ravel(), t_index.ravel()
+
+        frames = []
+        for (rsi_period, macd), evaluation in zip(groups, evaluations):
+            frame = pd.DataFrame({
+                'rsi_period': rsi_period,
+                'macd': '/'.join(str(p) for p in macd),
+                **{f'w_{key}': weights[w_index, i] for i, key in enumerate(WEIGHT_KEYS)},
+                'buy_threshold': thresholds[t_index]
+            })
+            for metric, values in evaluation.items():
+                frame[metric] = values.ravel()
+            frames.append(frame)
+
+        table = pd.concat(frames, ignore_index=True)
+        table['trades'] = table['trades'].astype(int)
+        return table
+
+    def save(self, table, top=None):
+        """순위표 CSV 저장"""
+        os.makedirs(self.results_dir, exist_ok=True)
+        filename = f"param_sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filepath = os.path.join(self.results_dir, filename)
+
+        (table.head(top) if top else table).to_csv(filepath, index_label='rank', encoding='utf-8-sig')
+        print(f"💾 결과 저장: {filename}")
+        return filepath
+
+
+if __name__ == '__main__':
+    from auto_recommender import AutoRecommender
+
+    sweep = ParameterSweep(hold_days=5)
+    sweep.load([ticker for ticker, _ in AutoRecommender.DEFAULT_KOREAN_STOCKS], period='2y')
+
+    ranking = sweep.run()
+    if not ranking.empty:
+        print(ranking.head(20).to_string())
+        sweep.save(ranking)
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+벡터화 백테스트 엔진
+전체 이력에서 지표/신뢰도 시계열을 한 번만 계산하고,
+신호가 발생한 모든 봉에서 진입해 보유/손절/익절 규칙으로 청산
+
+- 신뢰도 시계열은 TechnicalAnalyzer + ConfidenceCalculator의 점수 규칙을
+  봉 단위 배열로 옮긴 것 (각 봉 값 = 그 봉까지의 데이터로 분석했을 때의 점수)
+- 과거 뉴스는 없으므로 감성 점수는 상수(기본 중립 0.5)로 처리
+- 종목당 1회 계산으로 적중률, CAGR, 최대 낙폭, 샤프 지수 산출
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    MA_PERIODS, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+    WEIGHTS, SIGNAL_THRESHOLDS, STOP_LOSS_PERCENT, RISK_REWARD_RATIO
+)
+from analyzers.indicator_frame import IndicatorFrame
+from utils.data_normalizer import normalize_dataframe
+
+TRADING_DAYS = 252  # 연환산 기준 거래일 수
+
+
+# ==================== 신뢰도 시계열 ====================
+
+def component_scores(df, indicators=None, rsi_period=RSI_PERIOD,
+                     macd_fast=MACD_FAST, macd_slow=MACD_SLOW, macd_signal=MACD_SIGNAL,
+                     sr_window=20):
+    """
+    ConfidenceCalculator 구성 점수의 봉 단위 시계열
+
+    Args:
+        df (DataFrame): 정규화된 OHLCV 데이터 (Open, High, Low, Close, Volume)
+        indicators (IndicatorFrame): 공유 지표 캐시 (없으면 새로 생성)
+        rsi_period (int): RSI 기간
+        macd_fast, macd_slow, macd_signal (int): MACD 파라미터
+        sr_window (int): 지지/저항 탐색 구간 (봉 수)
+
+    Returns:
+        dict: technical, volume, support (0~1 점수 배열), rsi, volume_ratio
+    """
+    indicators = IndicatorFrame.of(df, indicators)
+    close = indicators.column('Close')
+    n = len(close)
+
+    rsi = indicators.rsi(rsi_period)
+    macd = indicators.macd(macd_fast, macd_slow, macd_signal)
+    ma20, ma60, ma120 = (indicators.sma(period) for period in MA_PERIODS[:3])
+
+    # NaN 비교는 False (분석기의 스칼라 비교와 동일)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # 신호 점수 (TechnicalAnalyzer.analyze_all)
+        signal_score = np.zeros(n)
+        signal_score += np.select([rsi < 30, rsi < 40, rsi > 70], [15, 8, -15], 0)
+
+        hist = macd['histogram']
+        signal_score += np.select(
+            [(hist > 0) & (macd['macd'] > macd['signal']), (hist < 0) & (macd['macd'] < macd['signal'])],
+            [15, -15], 0
+        )
+
+        trend_score = np.select(
+            [
+                (close > ma20) & (ma20 > ma60) & (ma60 > ma120),
+                (close > ma20) & (ma20 > ma60),
+                (close < ma20) & (ma20 < ma60) & (ma60 < ma120),
+                (close < ma20) & (ma20 < ma60)
+            ],
+            [100, 75, 0, 25], 50
+        )
+        signal_score += np.select([trend_score >= 75, trend_score <= 25], [10, -10], 0)
+
+        volume = indicators.column('Volume')
+        avg_volume = indicators.sma(20, 'Volume')
+        volume_ratio = np.where(avg_volume > 0, volume / avg_volume, 1.0)
+        spike = volume_ratio > 1.5
+        signal_score += np.where(spike, 15, 0)
+
+        high_max = pd.Series(indicators.column('High')).rolling(sr_window, min_periods=1).max().to_numpy()
+        low_min = pd.Series(indicators.column('Low')).rolling(sr_window, min_periods=1).min().to_numpy()
+        near_support = (close - low_min) / close < 0.03
+        near_resistance = (high_max - close) / close < 0.03
+        signal_score += np.where(near_support, 10, 0)
+
+        prev20 = np.concatenate(([np.nan], ma20[:-1]))
+        prev60 = np.concatenate(([np.nan], ma60[:-1]))
+        golden = (prev20 <= prev60) & (ma20 > ma60)
+        dead = (prev20 >= prev60) & (ma20 < ma60)
+        signal_score += np.select([golden, dead], [15, -15], 0)
+
+        # 기술적 점수 (ConfidenceCalculator._calculate_technical_score)
+        technical = 0.5 + signal_score / 100
+        technical += np.select([rsi < 30, rsi > 70], [0.15, -0.15], 0)
+        technical += np.select([trend_score >= 75, trend_score <= 25], [0.10, -0.10], 0)
+
+        # 거래량 점수
+        volume_score = 0.5 + np.select([spike, volume_ratio > 1.2, volume_ratio < 0.7], [0.15, 0.08, -0.05], 0)
+
+        # 지지/저항 점수
+        support_score = 0.5 + np.where(near_support, 0.10, 0) - np.where(near_resistance, 0.05, 0)
+
+    return {
+        'technical': np.clip(technical, 0, 1),
+        'volume': np.clip(volume_score, 0, 1),
+        'support': np.clip(support_score, 0, 1),
+        'rsi': rsi,
+        'volume_ratio': volume_ratio
+    }
+
+
+def confidence_series(components, weights=None, sentiment=0.5):
+    """
+    구성 점수 → 신뢰도(0~100) 시계열
+
+    Args:
+        components (dict): component_scores 결과
+        weights (dict): 가중치 (기본값: config.WEIGHTS)
+        sentiment (float or ndarray): 감성 점수 (0~1)
+
+    Returns:
+        ndarray: 봉별 신뢰도
+    """
+    weights = weights or WEIGHTS
+    total = (
+        components['technical'] * weights['technical'] +
+        sentiment * weights['sentiment'] +
+        components['volume'] * weights['volume'] +
+        components['support'] * weights['support']
+    ) * 100
+    return np.clip(total, 0, 100)
+
+
+# ==================== 거래 시뮬레이션 ====================
+
+def simulate_trades(df, entries, hold_days=5, stop_loss=STOP_LOSS_PERCENT, risk_reward=RISK_REWARD_RATIO):
+    """
+    진입 신호가 난 모든 봉에서 종가 진입 → 손절/익절/보유 만료 청산
+
+    같은 봉에서 손절가와 익절가를 모두 건드리면 손절로 처리 (보수적).
+    갭으로 손절/익절가를 건너뛰고 시작한 봉은 시가에 청산.
+    청산까지 hold_days 봉이 남지 않은 신호는 제외.
+
+    Args:
+        df (DataFrame): 정규화된 OHLCV 데이터
+        entries (ndarray[bool]): 봉별 진입 여부
+        hold_days (int): 최대 보유 봉 수
+        stop_loss (float): 손절 비율 (0.05 = -5%)
+        risk_reward (float): 손익비 (익절 = 손절 × 손익비)
+
+    Returns:
+        tuple: (거래 DataFrame, 일별 전략 수익률 ndarray)
+    """
+    close = df['Close'].to_numpy(dtype='float64')
+    open_ = df['Open'].to_numpy(dtype='float64')
+    high = df['High'].to_numpy(dtype='float64')
+    low = df['Low'].to_numpy(dtype='float64')
+    n = len(close)
+
+    entry_idx = np.flatnonzero(np.asarray(entries, dtype=bool)[:max(0, n - hold_days)])
+    daily_returns = np.zeros(n)
+    if len(entry_idx) == 0 or hold_days < 1:
+        return pd.DataFrame(columns=['entry_date', 'exit_date', 'entry_price', 'exit_price',
+                                     'return', 'bars_held', 'exit_reason']), daily_returns
+
+    # (거래 수, hold_days) 보유 구간 행렬: t+1 ... t+hold_days
+    window = entry_idx[:, None] + 1 + np.arange(hold_days)
+    entry_price = close[entry_idx]
+    stop_price = entry_price * (1 - stop_loss)
+    target_price = entry_price * (1 + stop_loss * risk_reward)
+
+    stop_hit = low[window] <= stop_price[:, None]
+    target_hit = high[window] >= target_price[:, None]
+    any_stop = stop_hit.any(axis=1)
+    any_target = target_hit.any(axis=1)
+    first_stop = np.where(any_stop, stop_hit.argmax(axis=1), hold_days)
+    first_target = np.where(any_target, target_hit.argmax(axis=1), hold_days)
+
+    is_stop = any_stop & (first_stop <= first_target)
+    is_target = any_target & ~is_stop
+    exit_offset = np.select([is_stop, is_target], [first_stop, first_target], hold_days - 1)
+    exit_idx = entry_idx + 1 + exit_offset
+    exit_price = np.select(
+        [is_stop, is_target],
+        [np.minimum(stop_price, open_[exit_idx]), np.maximum(target_price, open_[exit_idx])],
+        close[exit_idx]
+    )
+
+    # 보유 중 일별 수익률 (청산 봉은 청산가 기준), 같은 날 보유 중인 거래는 동일 비중
+    prev_close = close[window - 1]
+    bar_returns = close[window] / prev_close - 1
+    rows = np.arange(len(entry_idx))
+    bar_returns[rows, exit_offset] = exit_price / prev_close[rows, exit_offset] - 1
+    held = np.arange(hold_days)[None, :] <= exit_offset[:, None]
+
+    return_sum = np.zeros(n)
+    open_count = np.zeros(n)
+    np.add.at(return_sum, window[held], bar_returns[held])
+    np.add.at(open_count, window[held], 1)
+    np.divide(return_sum, open_count, out=daily_returns, where=open_count > 0)
+
+    trades = pd.DataFrame({
+        'entry_date': df.index[entry_idx],
+        'exit_date': df.index[exit_idx],
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'return': exit_price / entry_price - 1,
+        'bars_held': exit_offset + 1,
+        'exit_reason': np.select([is_stop, is_target], ['stop_loss', 'take_profit'], 'hold_expired')
+    })
+    return trades, daily_returns
+
+
+def performance_metrics(trades, daily_returns, index):
+    """
+    거래 목록/일별 수익률 → 성과 지표
+
+    Returns:
+        dict: 거래 수, 적중률, 평균 수익률, 누적 수익률, CAGR, 최대 낙폭, 샤프 지수 (비율은 %)
+    """
+    equity = np.cumprod(1 + daily_returns)
+    drawdown = equity / np.maximum.accumulate(equity) - 1 if len(equity) else np.zeros(1)
+
+    years = (index[-1] - index[0]).days / 365.25 if len(index) > 1 else 0
+    total_return = equity[-1] - 1 if len(equity) else 0.0
+    cagr = (equity[-1] ** (1 / years) - 1) if years > 0 and equity[-1] > 0 else 0.0
+
+    std = daily_returns.std(ddof=1) if len(daily_returns) > 1 else 0.0
+    sharpe = daily_returns.mean() / std * np.sqrt(TRADING_DAYS) if std > 0 else 0.0
+
+    trade_count = len(trades)
+    wins = int((trades['return'] > 0).sum()) if trade_count else 0
+
+    return {
+        'total_trades': trade_count,
+        'win_count': wins,
+        'hit_rate': wins / trade_count * 100 if trade_count else 0.0,
+        'avg_trade_return': float(trades['return'].mean() * 100) if trade_count else 0.0,
+        'total_return': float(total_return * 100),
+        'cagr': float(cagr * 100),
+        'max_drawdown': float(drawdown.min() * 100),
+        'sharpe': float(sharpe),
+        'exposure': float((daily_returns != 0).mean() * 100) if len(daily_returns) else 0.0
+    }
+
+
+# ==================== 백테스터 ====================
+
+class VectorizedBacktester:
+    """신뢰도 신호 기반 벡터화 백테스터 (종목당 1회 계산)"""
+
+    def __init__(self, hold_days=5, stop_loss=STOP_LOSS_PERCENT, risk_reward=RISK_REWARD_RATIO,
+                 entry_threshold=None, weights=None, sentiment=0.5, warmup=None, stock_collector=None):
+        """
+        Args:
+            hold_days (int): 최대 보유 봉 수
+            stop_loss (float): 손절 비율 (기본값: config.STOP_LOSS_PERCENT)
+            risk_reward (float): 손익비 (기본값: config.RISK_REWARD_RATIO)
+            entry_threshold (float): 진입 신뢰도 (기본값: SIGNAL_THRESHOLDS['buy'])
+            weights (dict): 신뢰도 가중치 (기본값: config.WEIGHTS)
+            sentiment (float): 과거 구간 감성 점수 (뉴스 이력이 없어 기본 중립)
+            warmup (int): 지표 안정화 구간 (이 봉 수 이전 신호 무시, 기본값: 최장 이동평균 기간)
+            stock_collector (StockCollector): 가격 수집기 (없으면 필요할 때 생성)
+        """
+        self.hold_days = hold_days
+        self.stop_loss = stop_loss
+        self.risk_reward = risk_reward
+        self.entry_threshold = entry_threshold if entry_threshold is not None else SIGNAL_THRESHOLDS['buy']
+        self.weights = weights or WEIGHTS
+        self.sentiment = sentiment
+        self.warmup = warmup if warmup is not None else max(MA_PERIODS)
+        self._stock_collector = stock_collector
+
+    @property
+    def stock_collector(self):
+        """가격 수집기 (필요할 때 생성)"""
+        if self._stock_collector is None:
+            from collectors.stock_collector import StockCollector
+            self._stock_collector = StockCollector()
+        return self._stock_collector
+
+    def signals(self, df, indicators=None):
+        """
+        봉별 신뢰도와 진입 여부
+
+        Returns:
+            tuple: (신뢰도 ndarray, 진입 여부 ndarray[bool])
+        """
+        scores = confidence_series(component_scores(df, indicators), self.weights, self.sentiment)
+        entries = scores >= self.entry_threshold
+        entries[:self.warmup] = False
+        return scores, entries
+
+    def run(self, price_data, ticker=None):
+        """
+        가격 데이터 한 번으로 전체 구간 백테스트
+
+        Args:
+            price_data (DataFrame): OHLCV 데이터 (한글/영문 컬럼 모두 가능)
+            ticker (str): 결과 표시용 종목 코드
+
+        Returns:
+            dict: 성과 지표 + 거래 목록
+        """
+        df = normalize_dataframe(price_data)
+        df.index = pd.to_datetime(df.index)
+
+        scores, entries = self.signals(df)
+        trades, daily_returns = simulate_trades(df, entries, self.hold_days, self.stop_loss, self.risk_reward)
+        metrics = performance_metrics(trades, daily_returns, df.index)
+
+        trade_records = trades.assign(
+            entry_date=trades['entry_date'].dt.strftime('%Y-%m-%d'),
+            exit_date=trades['exit_date'].dt.strftime('%Y-%m-%d'),
+            entry_score=scores[df.index.get_indexer(trades['entry_date'])] if len(trades) else []
+        ).to_dict('records')
+
+        return {
+            'ticker': ticker,
+            'start_date': df.index[0].strftime('%Y-%m-%d'),
+            'end_date': df.index[-1].strftime('%Y-%m-%d'),
+            'bars': len(df),
+            'hold_days': self.hold_days,
+            'stop_loss': self.stop_loss * 100,
+            'take_profit': self.stop_loss * self.risk_reward * 100,
+            'entry_threshold': self.entry_threshold,
+            **metrics,
+            'trades': trade_records
+        }
+
+    def run_ticker(self, ticker, period='2y'):
+        """종목 이력 수집(바 저장소 캐시) 후 백테스트"""
+        price_data = self.stock_collector.get_stock_data(ticker, period=period)
+        if price_data is None or price_data.empty:
+            return {'ticker': ticker, 'error': '데이터 수집 실패'}
+
+        if len(price_data) <= self.warmup + self.hold_days:
+            return {'ticker': ticker, 'error': f'데이터 부족 ({len(price_data)}개)'}
+
+        try:
+            return self.run(price_data, ticker)
+        except Exception as e:
+            print(f"⚠️ {ticker} 백테스트 실패: {e}")
+            return {'ticker': ticker, 'error': str(e)}
+
+    def run_universe(self, tickers, period='2y'):
+        """
+        여러 종목 백테스트 + 전체 요약
+
+        Returns:
+            dict: summary (전체 거래 기준 적중률, 종목 평균 CAGR/낙폭/샤프), results
+        """
+        results = [self.run_ticker(ticker, period) for ticker in tickers]
+        valid = [r for r in results if 'error' not in r]
+
+        summary = {'tickers': len(tickers), 'tested': len(valid)}
+        if valid:
+            total_trades = sum(r['total_trades'] for r in valid)
+            summary.update({
+                'total_trades': total_trades,
+                'hit_rate': sum(r['win_count'] for r in valid) / total_trades * 100 if total_trades else 0.0,
+                'avg_cagr': float(np.mean([r['cagr'] for r in valid])),
+                'avg_max_drawdown': float(np.mean([r['max_drawdown'] for r in valid])),
+                'avg_sharpe': float(np.mean([r['sharpe'] for r in valid]))
+            })
+
+        return {'summary': summary, 'results': results}
+
+
+if __name__ == '__main__':
+    backtester = VectorizedBacktester(hold_days=5)
+    result = backtester.run_ticker('005930.KS', period='2y')
+
+    if 'error' in result:
+        print(f"❌ {result['error']}")
+    else:
+        print(f"\n📊 {result['ticker']} ({result['start_date']} ~ {result['end_date']})")
+        print(f"거래 수: {result['total_trades']}개, 적중률: {result['hit_rate']:.1f}%")
+        print(f"CAGR: {result['cagr']:+.2f}%, 최대 낙폭: {result['max_drawdown']:.2f}%, 샤프: {result['sharpe']:.2f}")
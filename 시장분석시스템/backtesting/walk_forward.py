@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+"""
+AutoRecommender 워크포워드 리플레이
+과거 각 날짜 시점으로 돌아가 추천 엔진이 그날 무엇을 추천했을지 재현하고
+이후 실제 수익률(전방 수익률)을 기록합니다.
+
+- 캐시된 이력(바 저장소)을 종목당 한 번만 읽음
+- 빠른 모드(fast): 거래량 급증/모멘텀/신뢰도 시계열을 한 번에 계산
+  (모든 지표가 인과적이므로 각 봉 값 = 그 날짜로 자른 이력에서의 값)
+- 정밀 모드(exact): 날짜별로 이력을 잘라 AutoRecommender/TechnicalAnalyzer를 그대로 실행
+  (lookback으로 실시간 스캔과 같은 조회 기간(3mo)을 재현, 검증용)
+- 과거 뉴스/경제 이벤트는 없으므로 감성은 중립, 이벤트 점수는 0
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import contextlib
+import io
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from config import MA_PERIODS, SIGNAL_THRESHOLDS
+from analyzers.indicator_frame import IndicatorFrame
+from backtesting.vectorized_backtest import component_scores, confidence_series
+from utils.data_normalizer import normalize_dataframe
+
+NEUTRAL_SENTIMENT = {
+    'overall_sentiment': 'neutral',
+    'overall_score': 0.5,
+    'positive_count': 0,
+    'negative_count': 0,
+    'total_news': 0
+}
+
+
+# ==================== 시점별 시계열 ====================
+
+def volume_surge_series(df, window=20):
+    """
+    AutoRecommender.detect_volume_surge의 봉 단위 시계열
+
+    Returns:
+        tuple: (급증 여부, 급증 퍼센트, 핫 점수) 배열
+    """
+    volume = df['Volume'].to_numpy(dtype='float64')
+    avg_volume = IndicatorFrame(df).sma(window, 'Volume')
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        valid = (volume != 0) & (avg_volume != 0) & ~np.isnan(avg_volume)
+        surge_pct = np.where(valid, (volume - avg_volume) / avg_volume * 100, 0.0)
+        strong = valid & (volume > avg_volume * 2)
+        mild = valid & ~strong & (volume > avg_volume * 1.5)
+
+    score = np.select([strong, mild], [np.minimum(50, surge_pct / 2), np.minimum(30, surge_pct / 3)], 0.0)
+    return strong | mild, surge_pct, score
+
+
+def momentum_series(df):
+    """
+    AutoRecommender.detect_price_momentum의 봉 단위 시계열 (최근 5봉 기준)
+
+    Returns:
+        tuple: (모멘텀 타입, 핫 점수) 배열 - 처음 4봉은 'none'
+    """
+    close = df['Close'].to_numpy(dtype='float64')
+    up = np.zeros(len(close), dtype=bool)
+    down = np.zeros(len(close), dtype=bool)
+    up[1:] = close[:-1] < close[1:]
+    down[1:] = close[:-1] > close[1:]
+
+    def lag(values, k):
+        shifted = np.zeros_like(values)
+        shifted[k:] = values[:len(values) - k]
+        return shifted
+
+    # 최근 5봉 c0..c4 (c4 = 당일): up[t] = c3 < c4
+    strong = lag(up, 3) & lag(up, 2) & lag(up, 1) & up
+    four = lag(up, 3) & lag(up, 2) & lag(up, 1)
+    three = lag(up, 1) & up
+    falling = lag(down, 1) & down
+
+    momentum_type = np.select(
+        [strong, four, three, falling],
+        ['strong_uptrend', 'uptrend', 'uptrend', 'downtrend'], 'sideways'
+    ).astype(object)
+    score = np.select([strong, four, three, falling], [40, 30, 20, 10], 0)
+
+    momentum_type[:4] = 'none'
+    score[:4] = 0
+    return momentum_type, score
+
+
+def forward_returns(close, horizons):
+    """봉별 h봉 후 수익률 (%) - 이력 끝을 넘으면 NaN"""
+    result = {}
+    for h in horizons:
+        forward = np.full(len(close), np.nan)
+        forward[:len(close) - h] = (close[h:] / close[:len(close) - h] - 1) * 100
+        result[f'fwd_{h}d'] = forward
+    return result
+
+
+# ==================== 리플레이 ====================
+
+class WalkForwardReplay:
+    """추천 엔진 시점별 재현 (워크포워드)"""
+
+    def __init__(self, horizons=(1, 5, 20), top_n=5, recommender=None, stock_collector=None):
+        """
+        Args:
+            horizons (tuple): 전방 수익률 기간 (봉 수)
+            top_n (int): 날짜별 핫 점수 상위 N개 (포트폴리오 성과 집계용)
+            recommender (AutoRecommender): 핫 점수 계산에 사용할 추천 엔진 (없으면 필요할 때 생성)
+            stock_collector (StockCollector): 가격 수집기 (없으면 추천 엔진의 수집기)
+        """
+        self.horizons = tuple(horizons)
+        self.top_n = top_n
+        self._recommender = recommender
+        self._stock_collector = stock_collector
+        self.warmup = max(MA_PERIODS)
+        self.results_dir = os.path.join(os.path.dirname(__file__), 'results')
+
+    @property
+    def recommender(self):
+        """추천 엔진 (필요할 때 생성)"""
+        if self._recommender is None:
+            from auto_recommender import AutoRecommender
+            self._recommender = AutoRecommender()
+        return self._recommender
+
+    @property
+    def stock_collector(self):
+        """가격 수집기"""
+        if self._stock_collector is None:
+            self._stock_collector = self.recommender.stock_collector
+        return self._stock_collector
+
+    def _is_recommended(self, hot_score, confidence_score, signal):
+        """AutoRecommender 추천 기준 (핫 점수 15 이상 또는 신뢰도 45 이상 매수 신호)"""
+        return hot_score >= 15 or (confidence_score >= 45 and signal in ['buy', 'strong_buy'])
+
+    @staticmethod
+    def _signal(score):
+        """신뢰도 → 신호 (ConfidenceCalculator._determine_signal 기준)"""
+        if score >= SIGNAL_THRESHOLDS['strong_buy']:
+            return 'strong_buy'
+        if score >= SIGNAL_THRESHOLDS['buy']:
+            return 'buy'
+        if score >= SIGNAL_THRESHOLDS['neutral']:
+            return 'neutral'
+        if score >= 100 - SIGNAL_THRESHOLDS['sell']:
+            return 'sell'
+        return 'strong_sell'
+
+    def replay_ticker(self, price_data, ticker, name=None, start=None, end=None):
+        """
+        한 종목 빠른 리플레이 (시계열 1회 계산)
+
+        Args:
+            price_data (DataFrame): 캐시된 전체 이력 (한글/영문 컬럼 모두 가능)
+            ticker (str): 종목 코드
+            name (str): 종목명
+            start, end (str or Timestamp): 리플레이 구간 (기본값: 지표 안정화 이후 전체)
+
+        Returns:
+            list: 날짜별 기록 딕셔너리
+        """
+        df = normalize_dataframe(price_data)
+        df.index = pd.to_datetime(df.index)
+        close = df['Close'].to_numpy(dtype='float64')
+
+        components = component_scores(df)
+        confidence = confidence_series(components)
+        _, surge_pct, volume_score = volume_surge_series(df)
+        momentum_type, momentum_score = momentum_series(df)
+        forward = forward_returns(close, self.horizons)
+
+        records = []
+        for t in self._replay_bars(df.index, start, end):
+            rsi = components['rsi'][t]
+            technical_result = {'rsi': rsi if not np.isnan(rsi) else 50}
+            hot_score = self.recommender.calculate_hot_score(
+                technical_result, NEUTRAL_SENTIMENT, volume_score[t], momentum_score[t], round(confidence[t], 1)
+            )
+            records.append(self._record(
+                df.index[t], ticker, name, close[t], hot_score, confidence[t], rsi,
+                volume_score[t], surge_pct[t], momentum_type[t], {k: v[t] for k, v in forward.items()}
+            ))
+        return records
+
+    def replay_ticker_exact(self, price_data, ticker, name=None, start=None, end=None, lookback='3mo'):
+        """
+        한 종목 정밀 리플레이 (날짜마다 이력을 잘라 실제 추천 파이프라인 실행)
+
+        Args:
+            lookback (str or None): 날짜별 조회 기간 (실시간 스캔은 3mo, None이면 그 날짜까지 전체)
+
+        Returns:
+            list: 날짜별 기록 딕셔너리
+        """
+        from analyzers.technical_analyzer import TechnicalAnalyzer
+        from analyzers.confidence_calculator import ConfidenceCalculator
+        from collectors.bar_store import period_start
+
+        df = normalize_dataframe(price_data)
+        df.index = pd.to_datetime(df.index)
+        close = df['Close'].to_numpy(dtype='float64')
+        forward = forward_returns(close, self.horizons)
+        recommender = self.recommender
+
+        records = []
+        for t in self._replay_bars(df.index, start, end):
+            window_start = period_start(lookback, now=df.index[t]) if lookback else None
+            view = df.iloc[:t + 1] if window_start is None else df.iloc[df.index.searchsorted(window_start):t + 1]
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                technical_result = TechnicalAnalyzer(view).analyze_all()
+                confidence = ConfidenceCalculator().calculate_confidence(technical_result, NEUTRAL_SENTIMENT)
+                _, surge_pct, volume_score = recommender.detect_volume_surge(view)
+                momentum_type, momentum_score, _ = recommender.detect_price_momentum(view)
+
+            hot_score = recommender.calculate_hot_score(
+                technical_result, NEUTRAL_SENTIMENT, volume_score, momentum_score, confidence['score']
+            )
+            records.append(self._record(
+                df.index[t], ticker, name, close[t], hot_score, confidence['score'], technical_result['rsi'],
+                volume_score, surge_pct, momentum_type, {k: v[t] for k, v in forward.items()}
+            ))
+        return records
+
+    def _replay_bars(self, index, start, end):
+        """리플레이할 봉 위치 (지표 안정화 구간 이후)"""
+        i0 = max(self.warmup, index.searchsorted(pd.Timestamp(start)) if start is not None else 0)
+        i1 = index.searchsorted(pd.Timestamp(end), side='right') if end is not None else len(index)
+        return range(i0, i1)
+
+    def _record(self, date, ticker, name, price, hot_score, confidence_score, rsi,
+                volume_score, surge_pct, momentum_type, forward):
+        """날짜별 기록 (추천 여부 포함)"""
+        signal = self._signal(confidence_score)
+        return {
+            'date': date,
+            'ticker': ticker,
+            'name': name or ticker,
+            'price': float(price),
+            'hot_score': int(hot_score),
+            'confidence': round(float(confidence_score), 1),
+            'signal': signal,
+            'rsi': float(rsi),
+            'volume_score': float(volume_score),
+            'surge_pct': float(surge_pct),
+            'momentum': momentum_type,
+            'recommended': self._is_recommended(hot_score, round(float(confidence_score), 1), signal),
+            **{key: float(value) for key, value in forward.items()}
+        }
+
+    def run(self, stock_list=None, start=None, end=None, period='2y', exact=False, lookback='3mo'):
+        """
+        스캔 대상 전체 리플레이
+
+        Args:
+            stock_list (list): (티커, 종목명) 리스트 (기본값: AutoRecommender 기본 종목)
+            start, end (str): 리플레이 구간 (기본값: 최근 1년)
+            period (str): 캐시에서 읽을 이력 기간 (지표 안정화 구간 포함)
+            exact (bool): 정밀 모드 여부
+            lookback (str): 정밀 모드 날짜별 조회 기간
+
+        Returns:
+            dict: summary, records (DataFrame)
+        """
+        if stock_list is None:
+            stock_list = self.recommender.DEFAULT_KOREAN_STOCKS
+        if start is None:
+            start = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+
+        print(f"\n{'='*60}")
+        print(f"⏪ 워크포워드 리플레이 ({len(stock_list)}개 종목, {start} ~ {end or '현재'}, "
+              f"{'정밀' if exact else '빠른'} 모드)")
+        print(f"{'='*60}\n")
+
+        records = []
+        for ticker, name in stock_list:
+            price_data = self.stock_collector.get_stock_data(ticker, period=period)
+            if price_data is None or len(price_data) <= self.warmup:
+                print(f"   ⚠️ {name} 데이터 부족 - 제외")
+                continue
+
+            try:
+                if exact:
+                    records.extend(self.replay_ticker_exact(price_data, ticker, name, start, end, lookback))
+                else:
+                    records.extend(self.replay_ticker(price_data, ticker, name, start, end))
+            except Exception as e:
+                print(f"   ❌ {name} 리플레이 실패: {e}")
+
+        frame = pd.DataFrame(records)
+        summary = self.summarize(frame)
+
+        if summary:
+            print(f"✅ 리플레이 완료: {summary['days']}일, 추천 {summary['recommendations']}건")
+            for horizon in self.horizons:
+                stats = summary['horizons'][f'{horizon}d']
+                print(f"   {horizon}일 후: 추천 평균 {stats['recommended_avg']:+.2f}% "
+                      f"(적중률 {stats['recommended_hit_rate']:.1f}%), 전체 평균 {stats['all_avg']:+.2f}%, "
+                      f"상위 {self.top_n}개 평균 {stats['top_n_avg']:+.2f}%")
+
+        return {'summary': summary, 'records': frame}
+
+    def summarize(self, frame):
+        """
+        리플레이 기록 요약 (기간별 추천 종목 vs 전체 vs 날짜별 상위 N개)
+
+        Returns:
+            dict: 요약 통계 (기록이 없으면 빈 딕셔너리)
+        """
+        if frame.empty:
+            return {}
+
+        recommended = frame[frame['recommended']]
+        top_n = frame.sort_values('hot_score', ascending=False).groupby('date').head(self.top_n)
+
+        horizons = {}
+        for horizon in self.horizons:
+            column = f'fwd_{horizon}d'
+            rec = recommended[column].dropna()
+            horizons[f'{horizon}d'] = {
+                'recommended_count': int(len(rec)),
+                'recommended_avg': float(rec.mean()) if len(rec) else 0.0,
+                'recommended_hit_rate': float((rec > 0).mean() * 100) if len(rec) else 0.0,
+                'all_avg': float(frame[column].dropna().mean()),
+                'top_n_avg': float(top_n[column].dropna().mean())
+            }
+
+        return {
+            'days': int(frame['date'].nunique()),
+            'tickers': int(frame['ticker'].nunique()),
+            'recommendations': int(frame['recommended'].sum()),
+            'horizons': horizons
+        }
+
+    def save(self, frame):
+        """리플레이 기록 CSV 저장"""
+        os.makedirs(self.results_dir, exist_ok=True)
+        filename = f"walk_forward_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filepath = os.path.join(self.results_dir, filename)
+        frame.to_csv(filepath, index=False, encoding='utf-8-sig')
+        print(f"💾 결과 저장: {filename}")
+        return filepath
+
+
+if __name__ == '__main__':
+    replay = WalkForwardReplay()
+    result = replay.run()
+    if not result['records'].empty:
+        replay.save(result['records'])
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""
+OHLCV 컬럼 저장소 (Bar Store)
+종목별 전체 이력을 NumPy .npy 컬럼 파일로 저장하고 기간은 슬라이스로 제공
+
+디렉토리 구조:
+    data/bars/<종목키>/meta.json        - 컬럼 목록, 세그먼트 목록, 현재 버전, 갱신 시각, 커버 시작일
+    data/bars/<종목키>/v<N>/dates.npy   - 세그먼트 날짜 인덱스 (datetime64[ns] → int64)
+    data/bars/<종목키>/v<N>/c<i>.npy    - 세그먼트 컬럼별 값 (float64)
+
+- 1mo/3mo/1y 요청이 하나의 이력을 공유 (기간별 중복 저장 없음)
+- 이력은 날짜순 세그먼트 디렉토리로 나뉘어 있고 읽기는 memory-map으로 필요한 구간만 복사
+- 쓰기는 바뀐 뒷부분만 새 세그먼트에 기록 후 meta.json 교체 (원자적 전환)
+  겹치는 세그먼트는 meta의 행 수만 줄여 앞부분을 그대로 재사용 (파일은 수정하지 않음)
+"""
+
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+try:
+    import fcntl  # 여러 프로세스(gunicorn 워커) 간 쓰기 잠금
+except ImportError:  # Windows - 프로세스 내 잠금만 사용
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+
+# 기간 문자열 → 달력 일수
+PERIOD_DAYS = {
+    '1mo': 30,
+    '3mo': 90,
+    '6mo': 180,
+    '1y': 365,
+    '2y': 730,
+    '5y': 1825,
+    '10y': 3650,
+}
+
+# 기간 문자열 → 최근 봉 개수 (달력 일수로 자르면 주말에 비는 기간)
+PERIOD_BARS = {
+    '1d': 1,
+    '5d': 5,
+}
+
+# 세그먼트가 이만큼 쌓이면 다음 쓰기에서 하나로 합침
+MAX_SEGMENTS = 16
+
+
+def period_start(period, now=None):
+    """
+    기간 문자열의 시작 날짜 계산
+
+    Args:
+        period (str or int): 기간 (1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max) 또는 일수
+        now (datetime): 기준 시각 (기본값: 현재)
+
+    Returns:
+        pd.Timestamp or None: 시작 날짜 (max 또는 봉 개수 기준 기간이면 None)
+    """
+    now = now or datetime.now()
+
+    if isinstance(period, int):
+        return pd.Timestamp(now - timedelta(days=period)).normalize()
+    if period == 'ytd':
+        return pd.Timestamp(now.year, 1, 1)
+    if period in PERIOD_DAYS:
+        return pd.Timestamp(now - timedelta(days=PERIOD_DAYS[period])).normalize()
+    if period in PERIOD_BARS or period == 'max':
+        return None
+
+    return pd.Timestamp(now - timedelta(days=90)).normalize()  # 기본 3개월
+
+
+def _segments(meta):
+    """메타의 세그먼트 목록 (세그먼트 도입 전 메타는 버전 디렉토리 하나)"""
+    if meta.get('segments'):
+        return meta['segments']
+    return [{'name': meta['version'], 'rows': meta['rows'], 'last': meta['last_date']}]
+
+
+def _concat(parts, dtype):
+    return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+
+class BarStore:
+    """종목별 OHLCV 이력 저장소 (StockCollector / KRStockCollector / CryptoCollector 공용)"""
+
+    def __init__(self, base_dir=None):
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent / 'data' / 'bars'
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()  # _key_locks 접근용
+        self._key_locks = {}
+
+    # ==================== 경로/메타 ====================
+
+    def _key_dir(self, key):
+        """종목 키 → 디렉토리 (파일명에 쓸 수 없는 문자 치환)"""
+        safe_key = re.sub(r'[^0-9A-Za-z._=-]', '_', key)
+        return self.base_dir / safe_key
+
+    def load_meta(self, key):
+        """메타 정보 로드 (없으면 None)"""
+        meta_path = self._key_dir(key) / 'meta.json'
+        if not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 바 저장소 메타 로드 실패 ({key}): {e}")
+            return None
+
+    @contextmanager
+    def _write_lock(self, key):
+        """
+        종목 키 쓰기 잠금 (프로세스 내 종목별 잠금 + 파일 잠금)
+
+        여러 워커가 같은 종목을 동시에 병합하면 서로의 버전을 지울 수 있으므로 직렬화합니다.
+        다른 종목의 쓰기는 서로 기다리지 않습니다.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if fcntl is None:
+                yield
+                return
+
+            key_dir = self._key_dir(key)
+            key_dir.mkdir(parents=True, exist_ok=True)
+            with open(key_dir / '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_meta(self, key, meta):
+        """메타 정보 원자적 저장"""
+        key_dir = self._key_dir(key)
+        tmp_path = key_dir / f'meta.json.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, key_dir / 'meta.json')
+
+    # ==================== 상태 조회 ====================
+
+    def last_date(self, key):
+        """저장된 마지막 봉 날짜 (없으면 None)"""
+        meta = self.load_meta(key)
+        if not meta or not meta.get('last_date'):
+            return None
+        return pd.Timestamp(meta['last_date'])
+
+    def is_fresh(self, key, ttl):
+        """마지막 갱신 후 ttl(초)이 지나지 않았는지"""
+        meta = self.load_meta(key)
+        if not meta:
+            return False
+        return time.time() - meta.get('updated_at', 0) < ttl
+
+    def covers(self, key, period):
+        """요청 기간의 이력이 모두 확보되어 있는지"""
+        meta = self.load_meta(key)
+        if not meta or not meta.get('rows'):
+            return False
+        if period in PERIOD_BARS:
+            return meta['rows'] >= PERIOD_BARS[period]
+        if period == 'max':
+            return meta.get('covered_max', False)
+        return pd.Timestamp(meta['covered_from']) <= period_start(period)
+
+    # ==================== 읽기 ====================
+
+    def read(self, key, start=None, end=None):
+        """
+        저장된 이력 중 [start, end] 구간 읽기
+
+        Args:
+            key (str): 종목 키
+            start (Timestamp): 시작 날짜 (None이면 처음부터)
+            end (Timestamp): 종료 날짜 (None이면 끝까지)
+
+        Returns:
+            pandas.DataFrame or None
+        """
+        for attempt in range(2):
+            meta = self.load_meta(key)
+            if not meta or not meta.get('rows'):
+                return None
+
+            try:
+                return self._read_version(key, meta, start, end)
+            except FileNotFoundError as e:
+                # 읽는 사이 다른 프로세스가 새 버전으로 교체하고 이전 버전을 지운 경우 → 새 메타로 재시도
+                if attempt == 0:
+                    continue
+                print(f"⚠️ 바 저장소 읽기 실패 ({key}): {e}")
+            except Exception as e:
+                print(f"⚠️ 바 저장소 읽기 실패 ({key}): {e}")
+            return None
+
+    def _read_version(self, key, meta, start, end):
+        """메타가 가리키는 세그먼트들에서 구간 읽기"""
+        return self._read_segments(key, meta, _segments(meta), start, end)
+
+    def _read_segments(self, key, meta, segments, start=None, end=None):
+        """
+        세그먼트 목록에서 [start, end] 구간 읽기
+
+        세그먼트 항목: name (디렉토리), rows (사용할 행 수), last (마지막 날짜), from (시작 행, 생략 시 0)
+        """
+        key_dir = self._key_dir(key)
+        columns = meta['columns']
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+
+        date_parts = []
+        value_parts = [[] for _ in columns]
+        for seg in segments:
+            if start is not None and pd.Timestamp(seg['last']) < start:
+                continue
+
+            seg_dir = key_dir / seg['name']
+            dates = np.load(seg_dir / 'dates.npy', mmap_mode='r')
+            lo, hi = seg.get('from', 0), seg['rows']
+            i0 = lo + int(np.searchsorted(dates[lo:hi], start.value, side='left')) if start is not None else lo
+            i1 = lo + int(np.searchsorted(dates[lo:hi], end.value, side='right')) if end is not None else hi
+            if i0 >= i1:
+                continue
+
+            # 필요한 구간만 복사 (memory-map 참조를 DataFrame에 남기지 않음)
+            date_parts.append(np.array(dates[i0:i1]))
+            for i, parts in enumerate(value_parts):
+                values = np.load(seg_dir / f'c{i}.npy', mmap_mode='r')
+                parts.append(np.array(values[i0:i1]))
+
+        index = pd.DatetimeIndex(_concat(date_parts, 'int64').view('datetime64[ns]'), name=meta.get('index_name'))
+        return pd.DataFrame(
+            {col: _concat(parts, 'float64') for col, parts in zip(columns, value_parts)},
+            index=index
+        )
+
+    def get(self, key, period):
+        """기간 문자열로 이력 슬라이스 조회"""
+        if period in PERIOD_BARS:
+            df = self.read(key)
+            return df.tail(PERIOD_BARS[period]) if df is not None else None
+        return self.read(key, start=period_start(period))
+
+    def get_fresh(self, key, period, ttl):
+        """
+        캐시 조회: 갱신 후 ttl(초) 이내이고 요청 기간을 커버할 때만 반환
+
+        Returns:
+            pandas.DataFrame or None: 캐시 미스면 None
+        """
+        if not self.is_fresh(key, ttl) or not self.covers(key, period):
+            return None
+
+        df = self.get(key, period)
+        if df is None or df.empty:
+            return None
+        return df
+
+    # ==================== 쓰기 ====================
+
+    def append(self, key, df, period=None, rebuild=False):
+        """
+        새 봉을 기존 이력에 병합
+
+        겹치는 날짜는 새 데이터로 덮어씀 (장중 미완성 봉 갱신).
+        새 데이터 시작일 이후의 기존 봉만 다시 읽고 써서, 비용은 전체 이력이 아니라 새 봉 수에 비례합니다.
+
+        Args:
+            key (str): 종목 키
+            df (DataFrame): 새로 수집한 OHLCV 데이터 (DatetimeIndex)
+            period (str): 이번 수집이 요청한 기간 (커버 범위 기록용)
+            rebuild (bool): True면 기존 봉을 버리고 df로 이력을 다시 만듦 (수정주가 재동기화)
+                - 커버 범위는 유지하므로 df는 기존 커버 시작일부터 수집한 데이터여야 함
+
+        Returns:
+            int: 새로 추가된 봉 개수 (rebuild면 df의 봉 개수)
+        """
+        if df is None or df.empty:
+            self.touch(key, period)
+            return 0
+
+        new_df = df.copy()
+        new_df.index = pd.DatetimeIndex(new_df.index)
+        if new_df.index.tz is not None:
+            new_df.index = new_df.index.tz_localize(None)
+        new_df = new_df[~new_df.index.duplicated(keep='last')].sort_index()
+
+        with self._write_lock(key):
+            meta = self.load_meta(key)
+            segments = _segments(meta) if meta and meta.get('rows') else []
+            if rebuild:
+                kept, existing, replaced = [], None, segments
+            else:
+                try:
+                    kept, tail, replaced = self._split_segments(key, meta, segments, new_df)
+                    existing = self._read_segments(key, meta, tail) if tail else None
+                except Exception as e:
+                    # 기존 이력을 읽지 못함 → 저장되는 것은 이번 데이터뿐이므로 기존 커버 범위를 버림
+                    print(f"⚠️ 바 저장소 기존 이력 읽기 실패 ({key}), 새 데이터로 다시 시작: {e}")
+                    meta = dict(meta, covered_from=None, covered_max=False)
+                    kept, existing, replaced = [], None, segments
+
+            if existing is not None and not existing.empty:
+                added = int((~new_df.index.isin(existing.index)).sum())
+                merged = pd.concat([existing[~existing.index.isin(new_df.index)], new_df]).sort_index()
+            else:
+                added = len(new_df)
+                merged = new_df
+
+            # 커버 범위: 기존 범위와 이번 요청 시작일 중 더 이른 날짜
+            candidates = [merged.index[0]]
+            if meta and meta.get('covered_from'):
+                candidates.append(pd.Timestamp(meta['covered_from']))
+            requested_start = period_start(period) if period else None
+            if requested_start is not None:
+                candidates.append(requested_start)
+            covered_max = period == 'max' or bool(meta and meta.get('covered_max'))
+
+            self._write_version(key, merged, meta, kept, replaced, min(candidates), covered_max)
+
+        return added
+
+    def _split_segments(self, key, meta, segments, new_df):
+        """
+        새 데이터 기준으로 세그먼트 나누기
+
+        Returns:
+            tuple: (kept, tail, replaced)
+                - kept: 그대로 둘 앞쪽 세그먼트 (겹치는 세그먼트는 행 수만 줄임)
+                - tail: 새 데이터와 병합하려고 다시 읽을 기존 구간
+                - replaced: 교체 후 지울 세그먼트 디렉토리
+        """
+        columns = [str(col) for col in new_df.columns if pd.api.types.is_numeric_dtype(new_df[col])]
+        if not segments or set(columns) != set(meta['columns']) or len(segments) >= MAX_SEGMENTS:
+            # 컬럼 구성이 바뀌었거나 세그먼트가 많이 쌓임 → 전체를 한 세그먼트로 다시 씀
+            return [], segments, segments
+
+        first_new = new_df.index[0]
+        k = next((i for i, seg in enumerate(segments) if pd.Timestamp(seg['last']) >= first_new), len(segments))
+        if k == len(segments):
+            return segments, [], []  # 모두 기존 마지막 봉 이후
+
+        seg = segments[k]
+        dates = np.load(self._key_dir(key) / seg['name'] / 'dates.npy', mmap_mode='r')
+        cut = int(np.searchsorted(dates[:seg['rows']], first_new.value, side='left'))
+
+        kept = segments[:k]
+        replaced = segments[k + 1:]
+        if cut > 0:
+            last = pd.Timestamp(int(dates[cut - 1])).isoformat()
+            kept = kept + [dict(seg, rows=cut, last=last)]
+        else:
+            replaced = [seg] + replaced
+
+        return kept, [dict(seg, **{'from': cut})] + segments[k + 1:], replaced
+
+    def touch(self, key, period=None):
+        """데이터 변경 없이 갱신 시각(과 요청 커버 범위)만 업데이트 (새 봉이 없는 경우)"""
+        with self._write_lock(key):
+            meta = self.load_meta(key)
+            if meta:
+                meta['updated_at'] = time.time()
+                requested_start = period_start(period) if period else None
+                if requested_start is not None and requested_start < pd.Timestamp(meta['covered_from']):
+                    meta['covered_from'] = requested_start.isoformat()
+                self._write_meta(key, meta)
+
+    def _write_version(self, key, df, old_meta, kept, replaced, covered_from, covered_max=False):
+        """새 세그먼트 디렉토리에 컬럼 파일 기록 후 메타 교체 (kept 세그먼트 뒤에 이어 붙임)"""
+        key_dir = self._key_dir(key)
+        key_dir.mkdir(parents=True, exist_ok=True)
+
+        old_version = old_meta.get('version') if old_meta else None
+        version_no = int(old_version[1:].split('_')[0]) + 1 if old_version else 1
+        # 프로세스/호출마다 고유한 이름 (다른 워커가 같은 번호로 쓰더라도 디렉토리가 겹치지 않음)
+        version = f'v{version_no}_{os.getpid()}_{uuid.uuid4().hex[:8]}'
+        version_dir = key_dir / version
+        version_dir.mkdir(exist_ok=True)
+
+        if kept:
+            columns = old_meta['columns']  # _split_segments에서 컬럼 구성이 같을 때만 남김
+        else:
+            columns = [str(col) for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+        df = df.rename(columns=str)
+
+        np.save(version_dir / 'dates.npy', df.index.values.astype('datetime64[ns]').view('int64'))
+        for i, col in enumerate(columns):
+            np.save(version_dir / f'c{i}.npy', df[col].to_numpy(dtype='float64'))
+
+        segments = kept + [{'name': version, 'rows': len(df), 'last': df.index[-1].isoformat()}]
+        self._write_meta(key, {
+            'key': key,
+            'version': version,
+            'columns': columns,
+            'segments': segments,
+            'index_name': df.index.name,
+            'rows': sum(seg['rows'] for seg in segments),
+            'last_date': df.index[-1].isoformat(),
+            'covered_from': pd.Timestamp(covered_from).isoformat(),
+            'covered_max': covered_max,
+            'updated_at': time.time()
+        })
+
+        # 교체된 세그먼트 정리 (다른 프로세스가 memory-map 중이면 다음 기회에)
+        for seg in replaced:
+            shutil.rmtree(key_dir / seg['name'], ignore_errors=True)
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_bar_store = None
+_bar_store_lock = threading.Lock()
+
+
+def get_bar_store():
+    """전역 바 저장소 인스턴스"""
+    global _bar_store
+    if _bar_store is None:
+        with _bar_store_lock:
+            if _bar_store is None:
+                _bar_store = BarStore()
+    return _bar_store
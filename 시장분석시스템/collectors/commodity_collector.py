@@ -9,11 +9,16 @@ from datetime import datetime, timedelta
 import ssl
 import os
 import time
+import sys
 
 # SSL 인증서 검증 우회
 ssl._create_default_https_context = ssl._create_unverified_context
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from collectors.stock_collector import YAHOO_HOST
+from utils.rate_limiter import rate_limit
+
 
 class CommodityCollector:
     """원자재 데이터 수집 클래스"""
@@ -67,7 +72,7 @@ class CommodityCollector:
 
             for attempt in range(max_retries):
                 try:
-                    time.sleep(0.5)  # 짧은 딜레이
+                    rate_limit(YAHOO_HOST)  # 요청 예산 소진 시에만 대기
                     ticker = yf.Ticker(symbol)
                     hist = ticker.history(period=period)
 
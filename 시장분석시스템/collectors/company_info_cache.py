@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+기업 정보 캐시
+종목명/업종/시장/재무 지표처럼 자주 바뀌지 않는 값은 디스크(data/company_info.json)에
+긴 TTL로 보관하고, 52주 최고/최저·평균거래량은 이미 수집한 가격 이력에서 계산
+
+- 미국 주식: yfinance .info 호출을 종목당 하루 한 번으로 줄임
+- 한국 주식: 기업 정보를 위한 별도 전체 이력 다운로드 없음
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DATA_DIR, COMPANY_INFO_TTL
+
+# 가격 이력 컬럼 후보 (수집기별 한글/영문 컬럼명)
+PRICE_COLUMNS = {
+    'close': ('종가', 'Close'),
+    'high': ('고가', 'High'),
+    'low': ('저가', 'Low'),
+    'volume': ('거래량', 'Volume'),
+}
+
+YEAR_BARS = 252     # 52주 거래일 수
+YEAR_SPAN = pd.Timedelta(days=358)  # 1년치 이력으로 볼 최소 기간 (연초 휴장일로 첫 봉이 며칠 늦을 수 있음)
+VOLUME_BARS = 20    # 평균거래량 기간
+
+
+def _column(data, name):
+    for col in PRICE_COLUMNS[name]:
+        if col in data.columns:
+            return data[col]
+    return None
+
+
+def price_stats(data, full_year=None):
+    """
+    가격 이력에서 파생 지표 계산 (52주 최고/최저, 20일 평균거래량, 현재가)
+
+    Args:
+        data (pandas.DataFrame): 일봉 OHLCV (한글 또는 영문 컬럼명)
+        full_year (bool): 1년치 이력 여부 (None이면 첫 봉~마지막 봉 기간으로 판단)
+            - 1년이 안 되면 52주 최고/최저는 None (3개월 이력을 52주로 표시하지 않음)
+
+    Returns:
+        dict: current_price, high_52w, low_52w, avg_volume (계산할 수 없는 값은 None)
+    """
+    stats = {'current_price': None, 'high_52w': None, 'low_52w': None, 'avg_volume': None}
+    if data is None or data.empty:
+        return stats
+
+    if full_year is None:
+        index = pd.to_datetime(data.index)
+        full_year = index[-1] - index[0] >= YEAR_SPAN
+
+    close = _column(data, 'close')
+    high = _column(data, 'high')
+    low = _column(data, 'low')
+    volume = _column(data, 'volume')
+
+    if close is not None:
+        stats['current_price'] = float(close.iloc[-1])
+    if high is not None and full_year:
+        stats['high_52w'] = float(high.tail(YEAR_BARS).max())
+    if low is not None and full_year:
+        stats['low_52w'] = float(low.tail(YEAR_BARS).min())
+    if volume is not None:
+        stats['avg_volume'] = float(volume.tail(VOLUME_BARS).mean())
+    return stats
+
+
+class CompanyInfoCache:
+    """종목별 정적 기업 정보 캐시 (메모리 + JSON 파일, 스레드 안전)"""
+
+    def __init__(self, path=None, ttl=None):
+        """
+        Args:
+            path (str): 캐시 파일 경로 (기본값: data/company_info.json)
+            ttl (int): 유효 시간 (초, 기본값: config.COMPANY_INFO_TTL)
+        """
+        self.path = path or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), DATA_DIR, 'company_info.json'
+        )
+        self.ttl = COMPANY_INFO_TTL if ttl is None else ttl
+        self._entries = None  # 첫 조회 시 파일에서 로드
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is not None:
+            return
+
+        self._entries = {}
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except Exception as e:
+            print(f"⚠️ 기업 정보 캐시 로드 실패: {e}")
+
+    def _save(self):
+        """파일 원자적 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ 기업 정보 캐시 저장 실패: {e}")
+
+    def get(self, key):
+        """유효한 기업 정보 (없거나 만료되면 None)"""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry['updated_at'] >= self.ttl:
+                return None
+            return dict(entry['info'])
+
+    def put(self, key, info):
+        """기업 정보 저장 (빈 정보는 저장하지 않음)"""
+        if not info:
+            return
+        with self._lock:
+            self._load()
+            self._entries[key] = {'info': dict(info), 'updated_at': time.time()}
+            self._save()
+
+    def invalidate(self, key=None):
+        """캐시 삭제 (key가 None이면 전체)"""
+        with self._lock:
+            self._load()
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._save()
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_company_info_cache = None
+_company_info_cache_lock = threading.Lock()
+
+
+def get_company_info_cache():
+    """전역 기업 정보 캐시 인스턴스"""
+    global _company_info_cache
+    if _company_info_cache is None:
+        with _company_info_cache_lock:
+            if _company_info_cache is None:
+                _company_info_cache = CompanyInfoCache()
+    return _company_info_cache
@@ -8,6 +8,20 @@ import requests
 import pandas as pd
 from datetime import datetime
 import time
+import asyncio
+import sys
+import os
+
+# 상위 디렉토리 임포트
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BAR_STORE_TTL
+from collectors.bar_store import get_bar_store
+from utils.single_flight import single_flight
+from utils.http_session import get_http_session
+from utils.rate_limiter import rate_limit
+from utils.async_loop import run_sync
+
+COINGECKO_HOST = 'api.coingecko.com'  # 속도 제한 키 (무료 API는 분당 10-30 요청)
 
 
 class CryptoCollector:
@@ -16,7 +30,10 @@ class CryptoCollector:
     def __init__(self):
         self.base_url = "https://api.coingecko.com/api/v3"
         self.data = None
+        self.bar_store = get_bar_store()  # 일봉 이력 캐시 (crypto_<코인>_<통화> 키)
+        self.session = get_http_session()  # 공용 연결 풀 세션
 
+    @single_flight  # 같은 인자의 동시 요청은 한 번만 조회
     def get_crypto_data(self, coin_id="bitcoin", days=365, currency="usd"):
         """
         암호화폐 가격 데이터 수집
@@ -29,6 +46,15 @@ class CryptoCollector:
         Returns:
             pandas.DataFrame: 가격 데이터
         """
+        store_key = f"crypto_{coin_id}_{currency}"
+
+        # 캐시 확인 (기간은 저장된 이력의 슬라이스)
+        cached = self.bar_store.get_fresh(store_key, days, BAR_STORE_TTL)
+        if cached is not None:
+            print(f"✅ 캐시에서 {coin_id} 데이터 로드 ({len(cached)}개)")
+            self.data = cached
+            return cached
+
         try:
             print(f"🪙 {coin_id} 데이터 수집 중...")
 
@@ -39,7 +65,9 @@ class CryptoCollector:
                 'interval': 'daily'
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            rate_limit(COINGECKO_HOST)
+
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -66,6 +94,15 @@ class CryptoCollector:
             # 컬럼 순서 정리 (주식 데이터와 동일하게)
             df = df[['시가', '고가', '저가', '종가', '거래량']]
 
+            # 일봉 단위로 정리 (마지막 포인트는 현재 시각 → 당일 봉으로 병합)
+            df.index = df.index.normalize()
+            df = df[~df.index.duplicated(keep='last')]
+
+            try:
+                self.bar_store.append(store_key, df, days)
+            except Exception as store_error:
+                print(f"⚠️ 캐시 저장 실패: {store_error}")
+
             self.data = df
             print(f"✅ {coin_id} 데이터 {len(df)}개 수집 완료")
             return df
@@ -77,6 +114,29 @@ class CryptoCollector:
             print(f"❌ 에러: {str(e)}")
             return None
 
+    async def get_crypto_data_async(self, coin_id="bitcoin", days=365, currency="usd"):
+        """get_crypto_data의 코루틴 버전 (공용 이벤트 루프에서 여러 코인을 동시에 조회)"""
+        return await asyncio.to_thread(self.get_crypto_data, coin_id, days, currency)
+
+    async def get_crypto_data_many_async(self, coin_ids, days=365, currency="usd"):
+        """여러 코인 가격 이력 동시 조회 (코루틴)"""
+        results = await asyncio.gather(*(self.get_crypto_data_async(coin_id, days, currency) for coin_id in coin_ids))
+        return dict(zip(coin_ids, results))
+
+    def get_crypto_data_many(self, coin_ids, days=365, currency="usd"):
+        """
+        여러 코인 가격 이력 동시 조회 (CoinGecko 호스트 예산 안에서 병렬)
+
+        Args:
+            coin_ids (list): 코인 ID 리스트
+            days (int): 수집 기간 (일)
+            currency (str): 통화
+
+        Returns:
+            dict: {코인 ID: DataFrame 또는 None}
+        """
+        return run_sync(self.get_crypto_data_many_async(list(coin_ids), days, currency))
+
     def get_current_price(self, coin_ids, currency="usd"):
         """
         현재가 조회 (여러 코인 동시 조회 가능)
@@ -101,7 +161,9 @@ class CryptoCollector:
                 'include_market_cap': 'true'
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            rate_limit(COINGECKO_HOST)
+
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             return response.json()
@@ -121,7 +183,9 @@ class CryptoCollector:
                 'developer_data': 'false'
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            rate_limit(COINGECKO_HOST)
+
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -152,7 +216,9 @@ class CryptoCollector:
             url = f"{self.base_url}/search"
             params = {'query': keyword}
 
-            response = requests.get(url, params=params, timeout=10)
+            rate_limit(COINGECKO_HOST)
+
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -177,7 +243,8 @@ class CryptoCollector:
         """트렌딩 코인 (인기 상승 코인)"""
         try:
             url = f"{self.base_url}/search/trending"
-            response = requests.get(url, timeout=10)
+            rate_limit(COINGECKO_HOST)
+            response = self.session.get(url)
             response.raise_for_status()
 
             data = response.json()
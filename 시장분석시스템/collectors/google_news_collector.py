@@ -9,9 +9,19 @@ import requests
 import xml.etree.ElementTree as ET
 from datetime import datetime
 import time
+import asyncio
 import json
 import os
 import hashlib
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.single_flight import single_flight
+from utils.http_session import get_http_session
+from utils.async_loop import run_sync
+from utils.rate_limiter import rate_limit
+
+GOOGLE_NEWS_HOST = 'news.google.com'  # 속도 제한 키
 
 
 class GoogleNewsCollector:
@@ -22,6 +32,7 @@ class GoogleNewsCollector:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        self.session = get_http_session()  # 공용 연결 풀 세션
 
         # Phase 4-2: 캐시 설정
         self.cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'news')
@@ -68,6 +79,7 @@ class GoogleNewsCollector:
         except:
             pass
 
+    @single_flight  # 같은 인자의 동시 요청은 한 번만 조회
     def get_news(self, keyword, max_count=20, language='ko', use_cache=True):
         """
         Google News에서 키워드 검색 (Phase 4-2: 캐시 지원)
@@ -105,7 +117,8 @@ class GoogleNewsCollector:
             print(f"🔍 URL: {url}")
 
             # RSS 피드 가져오기
-            response = requests.get(url, headers=self.headers, timeout=10)
+            rate_limit(GOOGLE_NEWS_HOST)  # 요청 예산 소진 시에만 대기
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
 
             # XML 파싱
@@ -206,10 +219,16 @@ class GoogleNewsCollector:
             print(f"❌ 예상치 못한 오류: {str(e)}")
             return []
 
+    async def get_news_async(self, keyword, max_count=20, language='ko', use_cache=True):
+        """get_news의 코루틴 버전 (공용 이벤트 루프에서 여러 키워드/종목을 동시에 조회)"""
+        return await asyncio.to_thread(self.get_news, keyword, max_count, language, use_cache)
+
     def get_finance_news(self, keyword, max_count=20):
         """
         금융/경제 뉴스 검색 (키워드 보강)
 
+        보강 키워드 검색은 공용 이벤트 루프에서 동시에 실행합니다.
+
         Args:
             keyword (str): 기본 키워드
             max_count (int): 최대 뉴스 개수
@@ -217,6 +236,10 @@ class GoogleNewsCollector:
         Returns:
             list: 뉴스 리스트
         """
+        return run_sync(self.get_finance_news_async(keyword, max_count))
+
+    async def get_finance_news_async(self, keyword, max_count=20):
+        """get_finance_news의 코루틴 버전"""
         # 금융 관련 키워드 추가
         finance_keywords = [
             f"{keyword} 주가",
@@ -225,20 +248,20 @@ class GoogleNewsCollector:
             f"{keyword} 투자"
         ]
 
-        all_news = []
-        seen_titles = set()  # 중복 제거
+        results = await asyncio.gather(*(
+            self.get_news_async(finance_keyword, max_count=max_count // len(finance_keywords))
+            for finance_keyword in finance_keywords
+        ))
 
-        for finance_keyword in finance_keywords:
-            news_list = self.get_news(finance_keyword, max_count=max_count // len(finance_keywords))
+        all_news = []
+        seen_titles = set()  # 중복 제거 (키워드 순서 유지)
 
-            # 중복 제거
+        for news_list in results:
             for news in news_list:
                 if news['제목'] not in seen_titles:
                     seen_titles.add(news['제목'])
                     all_news.append(news)
 
-            time.sleep(0.5)  # Rate limiting
-
         print(f"\n✅ 총 {len(all_news)}개 금융 뉴스 수집 완료 (중복 제거)")
         return all_news
 
@@ -5,6 +5,7 @@
 """
 
 import FinanceDataReader as fdr
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import sys
@@ -12,6 +13,13 @@ import os
 
 # 상위 디렉토리 임포트
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BAR_STORE_TTL, BAR_RESYNC_OVERLAP_DAYS
+from collectors.bar_store import get_bar_store, period_start
+from collectors.krx_stock_list import get_krx_list
+from collectors.company_info_cache import price_stats
+from utils.rate_limiter import rate_limit
+
+KRX_HOST = 'data.krx.co.kr'  # FinanceDataReader 시세 출처 (속도 제한 키)
 
 
 class KRStockCollector:
@@ -19,10 +27,16 @@ class KRStockCollector:
 
     def __init__(self):
         self.data = None
+        self.bar_store = get_bar_store()  # 일봉 이력 캐시 (종목코드 6자리 키)
 
-    def get_stock_data(self, ticker, period="3mo", interval="1d"):
+    def get_stock_data(self, ticker, period="3mo", interval="1d", max_age=None):
         """
-        한국 주식 데이터 수집
+        한국 주식 데이터 수집 (증분 수집)
+
+        저장소에 이력이 있으면 마지막 봉 이후 구간만 요청해 병합하고,
+        요청 기간이 저장된 범위보다 길면 앞쪽 부족 구간만 추가로 요청합니다.
+        마지막 봉 이전 며칠(config.BAR_RESYNC_OVERLAP_DAYS)도 다시 받아 저장된 봉과 비교하고,
+        분할/배당으로 수정주가가 바뀌었으면 저장된 이력 전체를 다시 수집합니다.
 
         Args:
             ticker (str): 종목 코드
@@ -30,6 +44,7 @@ class KRStockCollector:
                 - 또는 .KS/.KQ 포함: "005930.KS"
             period (str): 수집 기간 (1mo, 3mo, 6mo, 1y, 2y, 5y)
             interval (str): 데이터 간격 (현재는 일봉만 지원)
+            max_age (int): 캐시 허용 시간 (초, 기본값: config.BAR_STORE_TTL)
 
         Returns:
             pandas.DataFrame: OHLCV 데이터
@@ -40,53 +55,136 @@ class KRStockCollector:
 
             print(f"📊 {clean_ticker} 데이터 수집 중...")
 
-            # 기간 계산
+            # 기간 계산 (1d/5d/max 등 날짜로 환산되지 않는 기간은 기본 3개월)
+            if period_start(period) is None:
+                period = "3mo"
             end_date = datetime.now()
-            if period == "1mo":
-                start_date = end_date - timedelta(days=30)
-            elif period == "3mo":
-                start_date = end_date - timedelta(days=90)
-            elif period == "6mo":
-                start_date = end_date - timedelta(days=180)
-            elif period == "1y":
-                start_date = end_date - timedelta(days=365)
-            elif period == "2y":
-                start_date = end_date - timedelta(days=730)
-            elif period == "5y":
-                start_date = end_date - timedelta(days=1825)
+            start_date = period_start(period)
+
+            # 캐시 확인 (기간은 저장된 이력의 슬라이스)
+            covered = self.bar_store.covers(clean_ticker, period)
+            if covered and self.bar_store.is_fresh(clean_ticker, BAR_STORE_TTL if max_age is None else max_age):
+                cached = self.bar_store.read(clean_ticker, start=start_date)
+                if cached is not None and not cached.empty:
+                    print(f"✅ 캐시에서 {clean_ticker} 데이터 로드 ({len(cached)}개)")
+                    self.data = cached
+                    return cached
+
+            meta = self.bar_store.load_meta(clean_ticker)
+            last_date = self.bar_store.last_date(clean_ticker)
+
+            if last_date is None:
+                # 저장된 이력 없음 → 전체 기간 수집
+                new_data = self._fetch_range(clean_ticker, start_date, end_date)
+                if new_data is None:
+                    print(f"⚠️ {clean_ticker} 데이터 없음")
+                    return None
+                self._store(clean_ticker, new_data, period)
             else:
-                start_date = end_date - timedelta(days=90)  # 기본 3개월
-
-            # 데이터 수집
-            self.data = fdr.DataReader(clean_ticker, start_date, end_date)
-
-            if self.data is None or self.data.empty:
+                try:
+                    covered_from = pd.Timestamp(meta['covered_from'])
+
+                    # 마지막 봉 이후 구간 + 비교용 겹침 구간 (마지막 봉은 장중 미완성일 수 있어 다시 요청)
+                    print(f"🔄 {clean_ticker} 증분 수집: {last_date.strftime('%Y-%m-%d')} 이후")
+                    overlap_start = last_date - timedelta(days=BAR_RESYNC_OVERLAP_DAYS)
+                    tail = self._fetch_range(clean_ticker, overlap_start, end_date)
+
+                    full = None
+                    if self._adjusted_changed(clean_ticker, tail, last_date):
+                        # 분할/배당으로 과거 수정주가가 바뀜 → 저장된 범위(와 요청 범위) 전체를 다시 수집
+                        print(f"🔁 {clean_ticker} 수정주가 변경 감지, 전체 이력 다시 수집")
+                        full = self._fetch_range(clean_ticker, min(start_date, covered_from), end_date)
+
+                    if full is not None:
+                        self._store(clean_ticker, full, period, rebuild=True)
+                    else:
+                        # 앞쪽 부족 구간 (요청 기간이 저장된 범위보다 긴 경우)
+                        if not covered:
+                            head = self._fetch_range(clean_ticker, start_date, covered_from - timedelta(days=1))
+                            self._store(clean_ticker, head, period)
+                        self._store(clean_ticker, tail, period)
+                except Exception as fetch_error:
+                    # 증분 수집 실패 시 저장된 이력으로 응답
+                    print(f"⚠️ {clean_ticker} 증분 수집 실패, 저장된 데이터 사용: {fetch_error}")
+
+            # 여러 스레드가 같은 인스턴스를 쓰므로 반환값은 지역 변수로
+            data = self.bar_store.read(clean_ticker, start=start_date)
+            self.data = data
+
+            if data is None or data.empty:
                 print(f"⚠️ {clean_ticker} 데이터 없음")
                 return None
 
-            # 한글 컬럼명으로 변경 (기존 시스템과 호환)
-            column_mapping = {
-                'Open': '시가',
-                'High': '고가',
-                'Low': '저가',
-                'Close': '종가',
-                'Volume': '거래량',
-                'Change': '변동폭'
-            }
+            print(f"✅ {clean_ticker} 데이터 {len(data)}개 수집 완료")
+            return data
 
-            self.data = self.data.rename(columns=column_mapping)
+        except Exception as e:
+            print(f"❌ 에러: {ticker} 데이터 수집 실패 - {str(e)}")
+            return None
 
-            # 필요한 컬럼만 선택 (기존 시스템 호환)
-            available_cols = [col for col in ['시가', '고가', '저가', '종가', '거래량'] if col in self.data.columns]
-            self.data = self.data[available_cols]
+    def _fetch_range(self, clean_ticker, start_date, end_date):
+        """FinanceDataReader로 [start_date, end_date] 구간 수집 (한글 컬럼명)"""
+        if start_date > end_date:
+            return None
 
-            print(f"✅ {clean_ticker} 데이터 {len(self.data)}개 수집 완료")
-            return self.data
+        rate_limit(KRX_HOST)
+        data = fdr.DataReader(clean_ticker, start_date, end_date)
 
-        except Exception as e:
-            print(f"❌ 에러: {ticker} 데이터 수집 실패 - {str(e)}")
+        if data is None or data.empty:
             return None
 
+        # 한글 컬럼명으로 변경 (기존 시스템과 호환)
+        column_mapping = {
+            'Open': '시가',
+            'High': '고가',
+            'Low': '저가',
+            'Close': '종가',
+            'Volume': '거래량',
+            'Change': '변동폭'
+        }
+
+        data = data.rename(columns=column_mapping)
+
+        # 필요한 컬럼만 선택 (기존 시스템 호환)
+        available_cols = [col for col in ['시가', '고가', '저가', '종가', '거래량'] if col in data.columns]
+        return data[available_cols]
+
+    def _adjusted_changed(self, clean_ticker, tail, last_date):
+        """
+        겹침 구간(마지막 봉 이전)의 가격이 저장된 봉과 다른지 (분할/배당으로 수정주가가 바뀐 경우)
+
+        거래량은 비교하지 않고, 저장된 봉과 날짜가 겹치지 않으면 False.
+        """
+        if tail is None:
+            return False
+
+        fetched = tail[tail.index < last_date]
+        stored = self.bar_store.read(clean_ticker, start=tail.index[0], end=last_date - timedelta(days=1))
+        if fetched.empty or stored is None or stored.empty:
+            return False
+
+        dates = fetched.index.intersection(stored.index)
+        columns = [col for col in ['시가', '고가', '저가', '종가'] if col in fetched.columns and col in stored.columns]
+        if dates.empty or not columns:
+            return False
+
+        return not np.allclose(
+            fetched.loc[dates, columns].to_numpy(dtype='float64'),
+            stored.loc[dates, columns].to_numpy(dtype='float64'),
+            rtol=1e-6, equal_nan=True
+        )
+
+    def _store(self, clean_ticker, data, period, rebuild=False):
+        """수집 구간을 저장소 이력에 병합 (새 봉이 없으면 갱신 시각만 기록, rebuild면 이력 교체)"""
+        try:
+            added = self.bar_store.append(clean_ticker, data, period, rebuild=rebuild)
+            if rebuild:
+                print(f"💾 {clean_ticker} 이력 {added}개 봉으로 다시 저장")
+            elif added:
+                print(f"💾 {clean_ticker} 신규 {added}개 봉 병합")
+        except Exception as store_error:
+            print(f"⚠️ 캐시 저장 실패: {store_error}")
+
     def get_current_price(self, ticker):
         """현재가 조회"""
         try:
@@ -98,42 +196,43 @@ class KRStockCollector:
         except:
             return None
 
-    def get_company_info(self, ticker):
+    def get_company_info(self, ticker, price_data=None):
         """
         기업 정보 조회
-        FinanceDataReader는 제한적인 정보만 제공
+        종목명/시장은 공용 KRX 목록, 가격 지표는 이미 수집한 가격 이력에서 계산
+
+        Args:
+            ticker (str): 종목 코드
+            price_data (pandas.DataFrame): 수집한 가격 이력 (없으면 저장된 이력 사용, 1년 미만이면 52주 값은 None)
         """
         try:
             clean_ticker = ticker.replace('.KS', '').replace('.KQ', '')
 
-            # 종목 리스트에서 종목명 찾기
-            krx_list = fdr.StockListing('KRX')
-            stock_info = krx_list[krx_list['Code'] == clean_ticker]
+            # 종목 리스트에서 종목명 찾기 (공용 KRX 목록 dict 조회)
+            stock_info = get_krx_list().get_by_code(clean_ticker)
 
-            if stock_info.empty:
+            if stock_info is None:
                 return {'종목명': clean_ticker}
 
-            stock_name = stock_info['Name'].iloc[0]
-            market = stock_info['Market'].iloc[0]
+            info = {'종목명': stock_info['name'], '시장': stock_info['market']}
 
-            # 최근 데이터로 간단한 정보 제공
-            recent_data = fdr.DataReader(clean_ticker)
-            if recent_data is not None and not recent_data.empty:
-                current_price = recent_data['Close'].iloc[-1]
-                avg_volume = recent_data['Volume'].tail(20).mean()
-                week_52_high = recent_data['High'].tail(252).max()
-                week_52_low = recent_data['Low'].tail(252).min()
+            # 52주 최고/최저·평균거래량은 별도 다운로드 없이 가격 이력에서 계산
+            if price_data is None:
+                # 저장된 이력이 1년을 커버할 때만 52주 값 계산 (짧은 이력이면 None)
+                stats = price_stats(self.bar_store.get(clean_ticker, '1y'), full_year=self.bar_store.covers(clean_ticker, '1y'))
+            else:
+                stats = price_stats(price_data)
 
-                return {
-                    '종목명': stock_name,
-                    '시장': market,
-                    '현재가': f"{current_price:,.0f}원",
-                    '평균거래량': f"{avg_volume:,.0f}",
-                    '52주 최고': f"{week_52_high:,.0f}원",
-                    '52주 최저': f"{week_52_low:,.0f}원"
-                }
+            if stats['current_price'] is not None:
+                info['현재가'] = f"{stats['current_price']:,.0f}원"
+            if stats['avg_volume'] is not None:
+                info['평균거래량'] = f"{stats['avg_volume']:,.0f}"
+            if stats['high_52w'] is not None:
+                info['52주 최고'] = f"{stats['high_52w']:,.0f}원"
+            if stats['low_52w'] is not None:
+                info['52주 최저'] = f"{stats['low_52w']:,.0f}원"
 
-            return {'종목명': stock_name, '시장': market}
+            return info
 
         except Exception as e:
             print(f"⚠️ 기업 정보 조회 실패: {str(e)}")
@@ -142,17 +241,13 @@ class KRStockCollector:
     def search_ticker(self, keyword):
         """
         종목 코드 검색
-        FinanceDataReader의 StockListing 활용
+        공용 KRX 목록의 검색 인덱스 활용 (가장 잘 맞는 종목)
         """
         try:
-            # KRX 전체 종목 리스트
-            krx_list = fdr.StockListing('KRX')
-
-            # 종목명으로 검색
-            result = krx_list[krx_list['Name'].str.contains(keyword, na=False)]
+            results = get_krx_list().search_stocks(keyword, limit=1)
 
-            if not result.empty:
-                return result['Code'].iloc[0]
+            if results:
+                return results[0]['code']
 
             return None
 
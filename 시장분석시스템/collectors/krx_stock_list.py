@@ -2,6 +2,10 @@
 """
 KRX 전체 상장 종목 리스트 수집
 코스피 + 코스닥 전체 종목 검색 가능
+
+- 디스크 스냅샷(data/krx_listing.csv)으로 서버 시작 시 즉시 로드
+- 백그라운드 스레드가 하루 주기로 FinanceDataReader에서 새로 받아 통째로 교체
+- 종목코드 → 종목 정보는 dict 조회 (요청마다 StockListing을 다시 받지 않음)
 """
 import sys
 import io
@@ -14,20 +18,120 @@ if __name__ == "__main__" and hasattr(sys.stdout, 'buffer'):
         pass
 
 import pandas as pd
-import requests
 from datetime import datetime
-import json
-import time
+import threading
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DATA_DIR, KRX_LISTING_REFRESH, KRX_LISTING_RETRY
+from collectors.search_index import build_krx_index, strip_krx_suffix
+
+LISTING_COLUMNS = ['Ticker', 'Name', 'Market', 'Code', 'Marcap']
+
 
 class KRXStockList:
-    """한국거래소 전체 종목 리스트"""
+    """한국거래소 전체 종목 리스트 (디스크 스냅샷 + 주기 갱신)"""
 
-    def __init__(self):
-        self.stock_list = None
-        self.last_update = None
+    def __init__(self, snapshot_path=None, refresh_interval=None):
+        """
+        Args:
+            snapshot_path (str): 스냅샷 CSV 경로 (기본값: data/krx_listing.csv)
+            refresh_interval (int): 갱신 주기 (초, 기본값: config.KRX_LISTING_REFRESH)
+        """
+        self.snapshot_path = snapshot_path or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), DATA_DIR, 'krx_listing.csv'
+        )
+        self.refresh_interval = refresh_interval or KRX_LISTING_REFRESH
+        self._state = None            # (종목 DataFrame, 검색 인덱스, 코드 → 종목 dict, 갱신 시각)
+        self._listeners = []          # 목록 교체 시 호출 (새 검색 인덱스 전달)
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ==================== 조회 ====================
+
+    @property
+    def stock_list(self):
+        return self._state[0] if self._state else None
+
+    @property
+    def index(self):
+        return self._state[1] if self._state else None
+
+    @property
+    def last_update(self):
+        return self._state[3] if self._state else None
+
+    def _ensure_loaded(self):
+        """목록이 없으면 스냅샷 → 다운로드 순으로 로드"""
+        if self._state is None and not self.load_snapshot():
+            self.fetch_all_stocks()
 
-    def fetch_all_stocks(self):
-        """전체 상장 종목 가져오기 (FinanceDataReader 사용)"""
+    def get_by_code(self, code):
+        """
+        종목코드로 종목 정보 조회 (dict 조회)
+
+        Args:
+            code (str): 종목코드 ('005930' 또는 '005930.KS')
+
+        Returns:
+            dict or None: {'ticker', 'name', 'market', 'code'}
+        """
+        self._ensure_loaded()
+        return self._state[2].get(strip_krx_suffix(code))
+
+    # ==================== 로드/갱신 ====================
+
+    def _apply(self, stock_list, updated):
+        """새 목록으로 인덱스를 만든 뒤 한 번에 교체 (조회 중인 스레드는 이전 목록을 끝까지 사용)"""
+        stock_list = stock_list.reset_index(drop=True)
+        by_code = {
+            code: {'ticker': ticker, 'name': name, 'market': market, 'code': code}
+            for ticker, name, market, code in zip(stock_list['Ticker'], stock_list['Name'],
+                                                  stock_list['Market'], stock_list['Code'])
+        }
+        index = build_krx_index(stock_list)
+        self._state = (stock_list, index, by_code, updated)
+
+        for listener in list(self._listeners):
+            try:
+                listener(index)
+            except Exception as e:
+                print(f"⚠️ 종목 리스트 갱신 알림 실패: {e}")
+
+    def add_listener(self, callback):
+        """목록 교체 시 호출할 함수 등록 (예: 통합 검색의 KRX 인덱스 교체)"""
+        self._listeners.append(callback)
+
+    def load_snapshot(self):
+        """디스크 스냅샷 로드 (없거나 손상되면 False)"""
+        if not os.path.exists(self.snapshot_path):
+            return False
+
+        try:
+            stock_list = pd.read_csv(self.snapshot_path, dtype={'Code': str}, encoding='utf-8')
+            stock_list['Code'] = stock_list['Code'].str.zfill(6)
+            updated = datetime.fromtimestamp(os.path.getmtime(self.snapshot_path))
+            self._apply(stock_list, updated)
+            print(f"✅ KRX 종목 리스트 스냅샷 로드: {len(stock_list)}개 ({updated:%Y-%m-%d %H:%M})")
+            return True
+        except Exception as e:
+            print(f"⚠️ KRX 종목 리스트 스냅샷 로드 실패: {e}")
+            return False
+
+    def _save_snapshot(self, stock_list):
+        """스냅샷 저장 (임시 파일에 쓴 뒤 교체 - 읽는 쪽은 항상 완전한 파일을 봄)"""
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+            # 워커/스레드마다 다른 임시 파일 (여러 워커가 동시에 갱신해도 서로 덮어쓰지 않음)
+            tmp_path = f"{self.snapshot_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            stock_list.to_csv(tmp_path, index=False, encoding='utf-8')
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            print(f"⚠️ KRX 종목 리스트 스냅샷 저장 실패: {e}")
+
+    def _download(self):
+        """FinanceDataReader로 코스피 + 코스닥 전체 종목 다운로드 (실패 시 None)"""
         try:
             import FinanceDataReader as fdr
 
@@ -45,21 +149,59 @@ class KRXStockList:
 
             # 합치기
             all_stocks = pd.concat([kospi, kosdaq], ignore_index=True)
+            if 'Marcap' not in all_stocks.columns:
+                all_stocks['Marcap'] = 0
 
-            # 필요한 컬럼만
-            self.stock_list = all_stocks[['Ticker', 'Name', 'Market', 'Code']].copy()
-            self.last_update = datetime.now()
-
-            print(f"✅ 총 {len(self.stock_list)}개 종목 로딩 완료")
-
-            return self.stock_list
+            # 필요한 컬럼만 (시가총액은 검색 결과 정렬용)
+            return all_stocks[LISTING_COLUMNS].copy()
 
         except ImportError:
             print("⚠️ FinanceDataReader 없음, 기본 종목만 제공")
-            return self._get_default_stocks()
         except Exception as e:
             print(f"❌ 종목 리스트 로딩 실패: {e}")
-            return self._get_default_stocks()
+        return None
+
+    def fetch_all_stocks(self):
+        """
+        전체 상장 종목 새로 받기 (성공 시 스냅샷 저장 후 교체)
+
+        실패하면 기존 목록을 유지하고, 목록이 아예 없으면 기본 주요 종목을 사용합니다.
+        """
+        with self._refresh_lock:
+            stock_list = self._download()
+            if stock_list is not None and not stock_list.empty:
+                self._save_snapshot(stock_list)
+                self._apply(stock_list, datetime.now())
+                print(f"✅ 총 {len(stock_list)}개 종목 로딩 완료")
+            elif self._state is None:
+                return self._get_default_stocks()
+            return self.stock_list
+
+    def start_auto_refresh(self):
+        """백그라운드 갱신 스레드 시작 (스냅샷이 주기보다 오래됐으면 바로 갱신)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name='krx-listing', daemon=True)
+        self._thread.start()
+
+    def stop_auto_refresh(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        """목록이 갱신 주기보다 오래되면 다시 받기 (실패하면 KRX_LISTING_RETRY 뒤 재시도)"""
+        while not self._stop.is_set():
+            last_update = self.last_update
+            age = (datetime.now() - last_update).total_seconds() if last_update else None
+
+            if age is None or age >= self.refresh_interval:
+                self.fetch_all_stocks()
+                wait = self.refresh_interval if self.last_update is not last_update else KRX_LISTING_RETRY
+            else:
+                wait = self.refresh_interval - age
+
+            if self._stop.wait(wait):
+                return
 
     def _get_default_stocks(self):
         """FinanceDataReader 없을 때 기본 주요 종목"""
@@ -117,51 +259,34 @@ class KRXStockList:
             ('373220.KS', 'LG에너지솔루션', 'KOSPI', '373220'),
         ]
 
-        self.stock_list = pd.DataFrame(default_list, columns=['Ticker', 'Name', 'Market', 'Code'])
-        self.last_update = datetime.now()
+        stock_list = pd.DataFrame(default_list, columns=LISTING_COLUMNS[:4])
+        stock_list['Marcap'] = range(len(default_list), 0, -1)  # 시가총액 순위 (정렬용)
+        self._apply(stock_list, None)  # 갱신 시각 없음 → 백그라운드 갱신 대상
 
         return self.stock_list
 
+    # ==================== 검색 ====================
+
     def search_stocks(self, query, limit=20):
         """
-        종목 검색
+        종목 검색 (n-gram 인덱스, 초성 검색 지원)
 
         Args:
-            query: 검색어 (종목명 또는 코드 일부)
+            query: 검색어 (종목명/코드 일부 또는 초성)
             limit: 최대 결과 개수
 
         Returns:
-            list: 검색 결과
+            list: 검색 결과 (일치 품질 → 시가총액 순)
         """
-        if self.stock_list is None:
-            self.fetch_all_stocks()
-
-        query = query.strip().upper()
-
-        # 검색: 종목명 또는 코드에 포함
-        results = self.stock_list[
-            self.stock_list['Name'].str.contains(query, na=False, case=False) |
-            self.stock_list['Code'].str.contains(query, na=False) |
-            self.stock_list['Ticker'].str.contains(query, na=False)
-        ].head(limit)
-
-        # 딕셔너리 리스트로 변환
-        return [
-            {
-                'ticker': row['Ticker'],
-                'name': row['Name'],
-                'market': row['Market'],
-                'code': row['Code']
-            }
-            for _, row in results.iterrows()
-        ]
+        self._ensure_loaded()
+        return self.index.search(strip_krx_suffix(query), limit)
 
     def get_ticker_by_name(self, name):
         """종목명으로 티커 찾기"""
-        if self.stock_list is None:
-            self.fetch_all_stocks()
+        self._ensure_loaded()
 
-        result = self.stock_list[self.stock_list['Name'] == name]
+        stock_list = self.stock_list
+        result = stock_list[stock_list['Name'] == name]
 
         if not result.empty:
             return result.iloc[0]['Ticker']
@@ -171,13 +296,25 @@ class KRXStockList:
 
 # 전역 인스턴스 (캐싱)
 _krx_list = None
+_krx_list_lock = threading.Lock()
+
 
 def get_krx_list():
-    """전역 KRX 리스트 인스턴스"""
+    """
+    전역 KRX 리스트 인스턴스
+
+    스냅샷이 있으면 즉시 로드하고, 없으면 기본 종목으로 시작한 뒤
+    백그라운드에서 전체 목록을 받아 교체합니다.
+    """
     global _krx_list
     if _krx_list is None:
-        _krx_list = KRXStockList()
-        _krx_list.fetch_all_stocks()
+        with _krx_list_lock:
+            if _krx_list is None:
+                krx_list = KRXStockList()
+                if not krx_list.load_snapshot():
+                    krx_list._get_default_stocks()
+                krx_list.start_auto_refresh()
+                _krx_list = krx_list
     return _krx_list
 
 
@@ -5,71 +5,39 @@ Yahoo Finance 실패 시 자동으로 대체 소스 사용
 """
 
 import yfinance as yf
-import pandas as pd
-from datetime import datetime, timedelta
 import time
-import json
+import sys
 import os
-from pathlib import Path
+
+# 상위 디렉토리 임포트
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BAR_STORE_TTL
+from collectors.bar_store import get_bar_store
+from collectors.stock_collector import YAHOO_HOST
+from utils.rate_limiter import rate_limit
 
 class MultiSourceCollector:
     """여러 데이터 소스를 순차적으로 시도하는 수집기"""
 
     def __init__(self):
-        # 캐시 디렉토리 설정
-        self.cache_dir = Path(__file__).parent.parent / 'data' / 'cache'
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 캐시: 종목별 컬럼 저장소 (StockCollector, KRStockCollector, CryptoCollector와 공유)
+        self.bar_store = get_bar_store()
 
         # 캐시 유효 시간 (초) - 1시간
-        self.cache_ttl = 3600
-
-    def _get_cache_path(self, ticker, period):
-        """캐시 파일 경로"""
-        return self.cache_dir / f"{ticker}_{period}.json"
+        self.cache_ttl = BAR_STORE_TTL
 
     def _load_from_cache(self, ticker, period):
-        """캐시에서 데이터 로드"""
-        cache_path = self._get_cache_path(ticker, period)
-
-        if not cache_path.exists():
-            return None
-
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-
-            # 캐시 유효성 확인
-            cached_time = datetime.fromisoformat(cache_data['cached_at'])
-            if (datetime.now() - cached_time).total_seconds() < self.cache_ttl:
-                print(f"✅ 캐시에서 {ticker} 데이터 로드 (캐시 시간: {cached_time.strftime('%H:%M:%S')})")
-
-                # DataFrame으로 변환
-                df = pd.DataFrame(cache_data['data'])
-                df.index = pd.to_datetime(df.index)
-                return df
-            else:
-                print(f"⏰ 캐시 만료 ({ticker})")
-                return None
-
-        except Exception as e:
-            print(f"⚠️ 캐시 로드 실패: {e}")
-            return None
+        """캐시에서 데이터 로드 (기간은 저장된 전체 이력의 슬라이스)"""
+        df = self.bar_store.get_fresh(ticker, period, self.cache_ttl)
+        if df is not None:
+            print(f"✅ 캐시에서 {ticker} 데이터 로드 ({len(df)}개)")
+        return df
 
     def _save_to_cache(self, ticker, period, data):
-        """캐시에 데이터 저장"""
+        """캐시에 데이터 저장 (새 봉만 기존 이력에 병합)"""
         try:
-            cache_data = {
-                'ticker': ticker,
-                'period': period,
-                'cached_at': datetime.now().isoformat(),
-                'data': data.reset_index().to_dict('records')
-            }
-
-            cache_path = self._get_cache_path(ticker, period)
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, default=str)
-
-            print(f"💾 캐시 저장 완료: {ticker}")
+            added = self.bar_store.append(ticker, data, period)
+            print(f"💾 캐시 저장 완료: {ticker} (신규 {added}개)")
         except Exception as e:
             print(f"⚠️ 캐시 저장 실패: {e}")
 
@@ -77,7 +45,7 @@ class MultiSourceCollector:
         """Yahoo Finance로 데이터 수집"""
         try:
             print(f"📊 [Yahoo Finance] {ticker} 시도 중...")
-            time.sleep(2)  # Rate limit 방지
+            rate_limit(YAHOO_HOST)  # 요청 예산 소진 시에만 대기
 
             stock = yf.Ticker(ticker)
             data = stock.history(period=period)
@@ -87,6 +55,10 @@ class MultiSourceCollector:
 
             # 한글 컬럼명 변환
             data.columns = ['시가', '고가', '저가', '종가', '거래량', '배당금', '주식분할']
+
+            # 캐시와 동일한 인덱스 형식 (거래소 현지 날짜, timezone 제거)
+            if data.index.tz is not None:
+                data.index = data.index.tz_localize(None)
             return data, None
 
         except Exception as e:
@@ -3,14 +3,23 @@
 네이버 뉴스 수집 모듈 (클릭 가능한 링크 포함)
 Phase 4-2: 캐시 시스템 추가 (1시간 유효)
 """
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import time
+import asyncio
 import re
 import json
 import os
 import hashlib
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.rate_limiter import rate_limit
+from utils.single_flight import single_flight
+from utils.http_session import get_http_session
+from utils.async_loop import run_sync
+
+NAVER_SEARCH_HOST = 'search.naver.com'  # 속도 제한 키
 
 
 class NaverNewsCollector:
@@ -20,6 +29,7 @@ class NaverNewsCollector:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        self.session = get_http_session()  # 공용 연결 풀 세션
 
         # Phase 4-2: 캐시 설정
         self.cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'news')
@@ -67,10 +77,13 @@ class NaverNewsCollector:
         except:
             pass
 
+    @single_flight  # 같은 인자의 동시 요청은 한 번만 조회
     def get_news(self, query, max_count=20, use_cache=True):
         """
         네이버 뉴스 검색 및 수집 (Phase 4-2: 캐시 지원)
 
+        페이지(start=1, 11, 21...)는 공용 이벤트 루프에서 동시에 조회합니다.
+
         Args:
             query (str): 검색 키워드 (예: "삼성전자", "비트코인")
             max_count (int): 수집할 뉴스 개수
@@ -79,100 +92,113 @@ class NaverNewsCollector:
         Returns:
             list: 뉴스 리스트 [{'title', 'description', 'url', 'date', 'source'}]
         """
+        return run_sync(self.get_news_async(query, max_count, use_cache))
+
+    async def get_news_async(self, query, max_count=20, use_cache=True):
+        """get_news의 코루틴 버전 (페이지 동시 조회, 속도 제한은 호스트 예산으로 적용)"""
         # Phase 4-2: 캐시 확인
         if use_cache:
             cached_news = self._load_cache(query, max_count)
             if cached_news is not None:
                 return cached_news
 
-        news_list = []
-
-        try:
-            # 네이버 뉴스 검색 URL
-            base_url = "https://search.naver.com/search.naver"
-
-            for start in range(1, max_count + 1, 10):
-                params = {
-                    'where': 'news',
-                    'query': query,
-                    'start': start,
-                    'sort': 1  # 최신순 (0: 관련도순, 1: 최신순)
-                }
-
-                response = requests.get(base_url, params=params, headers=self.headers, timeout=10)
-
-                if response.status_code != 200:
-                    print(f"⚠️ 뉴스 수집 실패: HTTP {response.status_code}")
-                    break
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 뉴스 항목 파싱
-                articles = soup.select('div.news_area')
-
-                if not articles:
-                    print(f"⚠️ 더 이상 뉴스가 없습니다")
-                    break
-
-                for article in articles:
-                    try:
-                        # 제목 및 링크
-                        title_elem = article.select_one('a.news_tit')
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get('title', title_elem.get_text(strip=True))
-                        url = title_elem.get('href', '')
-
-                        # 요약
-                        desc_elem = article.select_one('div.news_dsc')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ''
+        starts = range(1, max_count + 1, 10)
+        pages = await asyncio.gather(*(asyncio.to_thread(self._fetch_page, query, start) for start in starts))
 
-                        # 언론사
-                        source_elem = article.select_one('a.info.press')
-                        source = source_elem.get_text(strip=True) if source_elem else '알 수 없음'
+        # 페이지 순서대로 합치되, 실패/빈 페이지 이후는 버림 (순차 조회와 같은 결과)
+        news_list = []
+        for page in pages:
+            if page is None:
+                break
+            news_list.extend(page[:max_count - len(news_list)])
+            if len(news_list) >= max_count:
+                break
 
-                        # 날짜
-                        date_elem = article.select_one('span.info')
-                        date_text = date_elem.get_text(strip=True) if date_elem else ''
+        print(f"✅ 네이버 뉴스 {len(news_list)}개 수집 완료")
 
-                        # 날짜 파싱
-                        published_date = self._parse_date(date_text)
+        # Phase 4-2: 캐시 저장
+        if use_cache:
+            self._save_cache(query, max_count, news_list)
 
-                        news_list.append({
-                            '제목': title,
-                            '설명': description,
-                            '링크': url,  # 키 통일
-                            '날짜': published_date,
-                            '언론사': source,
-                            '출처': '네이버 뉴스',
-                            'source_type': 'domestic'  # 네이버는 모두 국내 뉴스
-                        })
+        return news_list
 
-                        if len(news_list) >= max_count:
-                            break
+    def _fetch_page(self, query, start):
+        """
+        검색 결과 한 페이지 조회
 
-                    except Exception as e:
-                        print(f"⚠️ 뉴스 파싱 오류: {str(e)}")
-                        continue
+        Returns:
+            list or None: 페이지의 뉴스 (HTTP 실패/더 이상 결과 없음/오류 시 None)
+        """
+        # 네이버 뉴스 검색 URL
+        base_url = "https://search.naver.com/search.naver"
+        params = {
+            'where': 'news',
+            'query': query,
+            'start': start,
+            'sort': 1  # 최신순 (0: 관련도순, 1: 최신순)
+        }
 
-                if len(news_list) >= max_count:
-                    break
+        try:
+            rate_limit(NAVER_SEARCH_HOST)  # 네이버 부하 방지 (호스트별 요청 예산)
+            response = self.session.get(base_url, params=params, headers=self.headers)
 
-                # 요청 간 딜레이 (네이버 부하 방지)
-                time.sleep(0.5)
+            if response.status_code != 200:
+                print(f"⚠️ 뉴스 수집 실패: HTTP {response.status_code}")
+                return None
 
-            print(f"✅ 네이버 뉴스 {len(news_list)}개 수집 완료")
+            soup = BeautifulSoup(response.text, 'html.parser')
+        except Exception as e:
+            print(f"❌ 뉴스 수집 오류: {str(e)}")
+            return None
 
-            # Phase 4-2: 캐시 저장
-            if use_cache:
-                self._save_cache(query, max_count, news_list)
+        # 뉴스 항목 파싱
+        articles = soup.select('div.news_area')
 
-            return news_list
+        if not articles:
+            print(f"⚠️ 더 이상 뉴스가 없습니다")
+            return None
 
-        except Exception as e:
-            print(f"❌ 뉴스 수집 오류: {str(e)}")
-            return news_list
+        news_list = []
+        for article in articles:
+            try:
+                # 제목 및 링크
+                title_elem = article.select_one('a.news_tit')
+                if not title_elem:
+                    continue
+
+                title = title_elem.get('title', title_elem.get_text(strip=True))
+                url = title_elem.get('href', '')
+
+                # 요약
+                desc_elem = article.select_one('div.news_dsc')
+                description = desc_elem.get_text(strip=True) if desc_elem else ''
+
+                # 언론사
+                source_elem = article.select_one('a.info.press')
+                source = source_elem.get_text(strip=True) if source_elem else '알 수 없음'
+
+                # 날짜
+                date_elem = article.select_one('span.info')
+                date_text = date_elem.get_text(strip=True) if date_elem else ''
+
+                # 날짜 파싱
+                published_date = self._parse_date(date_text)
+
+                news_list.append({
+                    '제목': title,
+                    '설명': description,
+                    '링크': url,  # 키 통일
+                    '날짜': published_date,
+                    '언론사': source,
+                    '출처': '네이버 뉴스',
+                    'source_type': 'domestic'  # 네이버는 모두 국내 뉴스
+                })
+
+            except Exception as e:
+                print(f"⚠️ 뉴스 파싱 오류: {str(e)}")
+                continue
+
+        return news_list
 
     def _parse_date(self, date_text):
         """날짜 텍스트 파싱"""
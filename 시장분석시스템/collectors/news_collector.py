@@ -11,6 +11,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import NEWS_API_KEY
+from utils.http_session import get_http_session
 
 
 class NewsCollector:
@@ -19,6 +20,7 @@ class NewsCollector:
     def __init__(self, api_key=NEWS_API_KEY):
         self.api_key = api_key
         self.base_url = "https://newsapi.org/v2"
+        self.session = get_http_session()  # 공용 연결 풀 세션
 
     def get_news(self, query, days=7, language="ko", page_size=20):
         """
@@ -55,7 +57,7 @@ class NewsCollector:
                 'apiKey': self.api_key
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -114,7 +116,7 @@ class NewsCollector:
             if category:
                 params['category'] = category
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+종목 검색 인덱스 (KRX + 미국 주요 종목 + 가상화폐)
+대시보드가 키 입력마다 호출하는 /api/search를 위해 미리 만들어 둔 메모리 인덱스
+
+- 이름/코드/별칭의 1·2글자 n-gram 역색인 → 후보만 골라 부분 일치 확인
+- 한글 초성 검색 (예: "ㅅㅅㅈㅈ" → 삼성전자)
+- 응답 dict를 미리 만들어 두고, 일치 품질(완전 > 접두 > 부분) → 시가총액 순으로 정렬
+"""
+import sys
+import os
+import heapq
+import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+# 미국 주요 종목 (한글명 포함)
+US_STOCKS = [
+    {'code': 'AAPL', 'name': 'Apple', 'name_kr': '애플', 'market': 'NASDAQ'},
+    {'code': 'MSFT', 'name': 'Microsoft', 'name_kr': '마이크로소프트', 'market': 'NASDAQ'},
+    {'code': 'GOOGL', 'name': 'Google', 'name_kr': '구글', 'market': 'NASDAQ'},
+    {'code': 'AMZN', 'name': 'Amazon', 'name_kr': '아마존', 'market': 'NASDAQ'},
+    {'code': 'TSLA', 'name': 'Tesla', 'name_kr': '테슬라', 'market': 'NASDAQ'},
+    {'code': 'META', 'name': 'Meta', 'name_kr': '메타', 'market': 'NASDAQ'},
+    {'code': 'NVDA', 'name': 'NVIDIA', 'name_kr': '엔비디아', 'market': 'NASDAQ'},
+    {'code': 'INTC', 'name': 'Intel', 'name_kr': '인텔', 'market': 'NASDAQ'},
+    {'code': 'AMD', 'name': 'AMD', 'name_kr': 'AMD', 'market': 'NASDAQ'},
+    {'code': 'NFLX', 'name': 'Netflix', 'name_kr': '넷플릭스', 'market': 'NASDAQ'},
+    {'code': 'JPM', 'name': 'JPMorgan Chase', 'name_kr': 'JP모건', 'market': 'NYSE'},
+    {'code': 'V', 'name': 'Visa', 'name_kr': '비자', 'market': 'NYSE'},
+    {'code': 'WMT', 'name': 'Walmart', 'name_kr': '월마트', 'market': 'NYSE'},
+    {'code': 'DIS', 'name': 'Disney', 'name_kr': '디즈니', 'market': 'NYSE'},
+    {'code': 'BA', 'name': 'Boeing', 'name_kr': '보잉', 'market': 'NYSE'},
+    {'code': 'BABA', 'name': 'Alibaba', 'name_kr': '알리바바', 'market': 'NYSE'},
+    {'code': 'NKE', 'name': 'Nike', 'name_kr': '나이키', 'market': 'NYSE'},
+    {'code': 'PYPL', 'name': 'PayPal', 'name_kr': '페이팔', 'market': 'NASDAQ'},
+    {'code': 'ADBE', 'name': 'Adobe', 'name_kr': '어도비', 'market': 'NASDAQ'},
+    {'code': 'CRM', 'name': 'Salesforce', 'name_kr': '세일즈포스', 'market': 'NYSE'},
+]
+
+# 주요 가상화폐 (한글명 포함, 시가총액 순)
+CRYPTOS = [
+    {'id': 'bitcoin', 'name': 'Bitcoin', 'name_kr': '비트코인', 'symbol': 'BTC'},
+    {'id': 'ethereum', 'name': 'Ethereum', 'name_kr': '이더리움', 'symbol': 'ETH'},
+    {'id': 'binancecoin', 'name': 'Binance Coin', 'name_kr': '바이낸스', 'symbol': 'BNB'},
+    {'id': 'ripple', 'name': 'XRP', 'name_kr': '리플', 'symbol': 'XRP'},
+    {'id': 'cardano', 'name': 'Cardano', 'name_kr': '카르다노', 'symbol': 'ADA'},
+    {'id': 'solana', 'name': 'Solana', 'name_kr': '솔라나', 'symbol': 'SOL'},
+    {'id': 'polkadot', 'name': 'Polkadot', 'name_kr': '폴카닷', 'symbol': 'DOT'},
+    {'id': 'dogecoin', 'name': 'Dogecoin', 'name_kr': '도지코인', 'symbol': 'DOGE'},
+    {'id': 'avalanche-2', 'name': 'Avalanche', 'name_kr': '아발란체', 'symbol': 'AVAX'},
+    {'id': 'chainlink', 'name': 'Chainlink', 'name_kr': '체인링크', 'symbol': 'LINK'},
+    {'id': 'orderly-network', 'name': 'Orderly', 'name_kr': '오덜리', 'symbol': 'ORDER'},
+]
+
+
+def normalize(text):
+    """검색용 정규화 (소문자, 공백 제거)"""
+    return ''.join(str(text).lower().split())
+
+
+def to_choseong(text):
+    """한글 음절 → 초성 (한글이 아닌 글자는 그대로)"""
+    chars = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        chars.append(CHOSEONG[code // 588] if 0 <= code < 11172 else char)
+    return ''.join(chars)
+
+
+def has_choseong(text):
+    """초성(자음 자모)이 섞인 검색어인지"""
+    return any('ㄱ' <= char <= 'ㅎ' for char in text)
+
+
+def _grams(text):
+    """1·2글자 n-gram"""
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """n-gram 역색인 기반 부분 일치 검색"""
+
+    def __init__(self, cache_size=1024):
+        """
+        Args:
+            cache_size (int): 최근 검색 결과 캐시 크기 (인덱스는 만든 뒤 바뀌지 않음)
+        """
+        self.entries = []                  # (응답 dict, 검색 키, 초성 키, 그룹 순서, 시가총액)
+        self._postings = defaultdict(set)  # n-gram → 항목 번호
+        self._choseong_postings = defaultdict(set)
+        self._search = lru_cache(maxsize=cache_size)(self._ranked_uncached)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, result, keys, group=0, marcap=0):
+        """
+        검색 항목 추가
+
+        Args:
+            result (dict): 검색 시 그대로 돌려줄 응답
+            keys (list): 검색 대상 문자열 (이름, 코드, 별칭)
+            group (int): 같은 품질일 때 먼저 보일 그룹 순서 (작을수록 먼저)
+            marcap (float): 시가총액 (같은 품질·그룹 내 정렬)
+        """
+        keys = [normalize(key) for key in keys if key]
+        choseong_keys = [to_choseong(key) for key in keys]
+        entry_id = len(self.entries)
+        self.entries.append((result, keys, choseong_keys, group, -(marcap or 0)))
+
+        for key in keys:
+            for gram in _grams(key):
+                self._postings[gram].add(entry_id)
+        for key in choseong_keys:
+            for gram in _grams(key):
+                self._choseong_postings[gram].add(entry_id)
+
+    def search(self, query, limit=10):
+        """
+        검색
+
+        Args:
+            query (str): 검색어 (이름/코드 일부 또는 초성)
+            limit (int): 최대 결과 수
+
+        Returns:
+            list: 응답 dict 리스트 (일치 품질 → 그룹 → 시가총액 순)
+        """
+        return [result for _, result in self.search_ranked(query, limit)]
+
+    def search_ranked(self, query, limit=10):
+        """
+        순위 키와 함께 검색 (여러 인덱스의 결과를 합칠 때 사용)
+
+        Returns:
+            tuple: (순위 키, 응답 dict) 튜플 (순위 키가 작을수록 먼저)
+        """
+        query = normalize(query)
+        if not query:
+            return ()
+        return self._search(query, limit)
+
+    def _ranked_uncached(self, query, limit):
+        # 초성이 섞이면 검색어/대상 모두 초성으로 비교
+        key_slot = 1
+        postings = self._postings
+        original = query
+        if has_choseong(query):
+            query = to_choseong(query)
+            key_slot = 2
+            postings = self._choseong_postings
+
+        grams = {query} if len(query) == 1 else {query[i:i + 2] for i in range(len(query) - 1)}
+        lists = sorted((postings.get(gram, ()) for gram in grams), key=len)
+        if not lists or not lists[0]:
+            return ()
+        candidates = set(lists[0]).intersection(*lists[1:])
+
+        ranked = []
+        for entry_id in candidates:
+            entry = self.entries[entry_id]
+            if key_slot == 1:
+                quality = min(self._match_quality(query, key) for key in entry[1])
+            else:
+                quality = min(self._choseong_quality(original, key, choseong_key)
+                              for key, choseong_key in zip(entry[1], entry[2]))
+            if quality < 3:
+                ranked.append((quality, entry[3], entry[4], entry_id))
+
+        return tuple((item, self.entries[item[3]][0]) for item in heapq.nsmallest(limit, ranked))
+
+    @staticmethod
+    def _match_quality(query, key):
+        """0: 완전 일치, 1: 접두 일치, 2: 부분 일치, 3: 불일치"""
+        if key == query:
+            return 0
+        if key.startswith(query):
+            return 1
+        if query in key:
+            return 2
+        return 3
+
+    @staticmethod
+    def _choseong_quality(query, key, choseong_key):
+        """초성 섞인 검색어의 일치 품질 (초성 자리는 초성끼리, 완성된 글자는 그대로 비교)"""
+        pattern = to_choseong(query)
+        start = choseong_key.find(pattern)
+        while start != -1:
+            if all(q == k for q, k in zip(query, key[start:]) if not 'ㄱ' <= q <= 'ㅎ'):
+                if start == 0:
+                    return 0 if len(key) == len(query) else 1
+                return 2
+            start = choseong_key.find(pattern, start + 1)
+        return 3
+
+
+def build_krx_index(stock_list):
+    """
+    KRX 종목 인덱스
+
+    Args:
+        stock_list (DataFrame): Ticker, Name, Market, Code (+ Marcap) 컬럼
+
+    Returns:
+        SearchIndex
+    """
+    index = SearchIndex()
+    marcaps = stock_list['Marcap'] if 'Marcap' in stock_list.columns else [0] * len(stock_list)
+    for ticker, name, market, code, marcap in zip(stock_list['Ticker'], stock_list['Name'],
+                                                  stock_list['Market'], stock_list['Code'], marcaps):
+        index.add({
+            'ticker': ticker,
+            'name': name,
+            'market': market,
+            'code': code,
+            'display': f"{name} ({ticker}) - {market}"
+        }, [name, code], group=0, marcap=marcap if marcap == marcap else 0)
+    return index
+
+
+def strip_krx_suffix(query):
+    """'005930.KS' 같은 티커 입력은 코드로 검색 (.KS/.KQ 접미사 제거)"""
+    return re.sub(r'\.(k[sq]?)?$', '', query.strip(), flags=re.IGNORECASE)
+
+
+class TickerSearch:
+    """/api/search용 통합 검색 (주식: KRX + 미국, 가상화폐)"""
+
+    def __init__(self, krx_index):
+        """
+        Args:
+            krx_index (SearchIndex): KRX 전체 종목 인덱스 (KRXStockList.index, 갱신 시 함께 교체)
+        """
+        self.krx_index = krx_index
+
+        # 미국 종목은 시가총액 정보가 없어 같은 품질이면 KRX 다음(group=1), 목록 순서대로
+        self.us_index = SearchIndex()
+        for order, stock in enumerate(US_STOCKS):
+            self.us_index.add({
+                'ticker': stock['code'],
+                'name': stock['name'],
+                'market': stock['market'],
+                'display': f"{stock['name']} ({stock['code']}) - {stock['market']}"
+            }, [stock['code'], stock['name'], stock['name_kr']], group=1, marcap=len(US_STOCKS) - order)
+
+        self.crypto_index = SearchIndex()
+        for order, crypto in enumerate(CRYPTOS):
+            self.crypto_index.add({
+                'ticker': crypto['id'],
+                'name': crypto['name'],
+                'symbol': crypto['symbol'],
+                'display': f"{crypto['name']} ({crypto['symbol']}) - {crypto['name_kr']}"
+            }, [crypto['id'], crypto['name'], crypto['symbol'], crypto['name_kr']], marcap=len(CRYPTOS) - order)
+
+        print(f"🔎 검색 인덱스 생성: 주식 {len(self.krx_index) + len(self.us_index)}개, "
+              f"가상화폐 {len(self.crypto_index)}개")
+
+    def set_krx_index(self, krx_index):
+        """KRX 목록이 바뀌면 KRXStockList가 새로 만든 인덱스로 교체 (KRXStockList 갱신 알림)"""
+        self.krx_index = krx_index
+
+    def search(self, query, asset_type='stock', limit=10):
+        """종목 검색 (asset_type: stock 또는 crypto)"""
+        if asset_type == 'stock':
+            query = strip_krx_suffix(query)
+            ranked = self.krx_index.search_ranked(query, limit) + self.us_index.search_ranked(query, limit)
+            return [result for _, result in heapq.nsmallest(limit, ranked, key=lambda item: item[0])]
+        if asset_type == 'crypto':
+            return self.crypto_index.search(query, limit)
+        return []
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_ticker_search = None
+_ticker_search_lock = threading.Lock()
+
+
+def get_ticker_search():
+    """전역 통합 검색 인덱스 (처음 호출 시 KRX 목록으로 생성)"""
+    global _ticker_search
+    if _ticker_search is None:
+        with _ticker_search_lock:
+            if _ticker_search is None:
+                from collectors.krx_stock_list import get_krx_list
+                krx_list = get_krx_list()
+                ticker_search = TickerSearch(krx_list.index)
+                krx_list.add_listener(ticker_search.set_krx_index)  # 백그라운드 갱신 시 함께 교체
+
+                # 생성 중 갱신이 끝나 알림을 놓쳤으면 최신 인덱스로 교체
+                if ticker_search.krx_index is not krx_list.index:
+                    ticker_search.set_krx_index(krx_list.index)
+                _ticker_search = ticker_search
+    return _ticker_search
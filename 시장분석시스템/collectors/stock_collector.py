@@ -12,6 +12,7 @@ import os
 import ssl
 import urllib.request
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # SSL 인증서 검증 우회 (한글 경로 문제 해결)
 ssl._create_default_https_context = ssl._create_unverified_context
@@ -19,7 +20,67 @@ os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 # 상위 디렉토리 임포트
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import DEFAULT_PERIOD, DEFAULT_INTERVAL
+from config import (
+    DEFAULT_PERIOD, DEFAULT_INTERVAL, BAR_STORE_TTL,
+    QUOTE_MAX_AGE, QUOTE_MAX_WORKERS, QUOTE_BATCH_SIZE
+)
+from collectors.bar_store import get_bar_store
+from collectors.company_info_cache import get_company_info_cache, price_stats
+from utils.single_flight import single_flight
+from utils.rate_limiter import rate_limit
+
+YAHOO_HOST = 'query1.finance.yahoo.com'  # yfinance 시세/기업 정보 출처 (속도 제한 키)
+
+# yfinance 컬럼 → 한글 컬럼명 (get_stock_data와 같은 순서, 바 저장소 공유)
+YF_COLUMNS = {
+    'Open': '시가',
+    'High': '고가',
+    'Low': '저가',
+    'Close': '종가',
+    'Volume': '거래량',
+    'Dividends': '배당금',
+    'Stock Splits': '주식분할'
+}
+
+
+def quote_summary(data, sparkline_points=20):
+    """
+    가격 이력 → 시세 요약 (현재가, 전일 대비 등락률, 스파크라인)
+
+    Args:
+        data (pandas.DataFrame): 일봉 이력 (종가 또는 Close 컬럼)
+        sparkline_points (int): 스파크라인 종가 개수
+
+    Returns:
+        dict: current_price, change_percent, sparkline, last_update (데이터가 없으면 error 포함)
+    """
+    close = None
+    if data is not None and not data.empty:
+        close = data['종가'] if '종가' in data.columns else data.get('Close')
+
+    if close is not None:
+        close = close.dropna()
+
+    if close is None or close.empty:
+        return {
+            'error': '데이터 없음',
+            'current_price': 0,
+            'change_percent': 0,
+            'sparkline': [],
+            'last_update': '정보 없음'
+        }
+
+    current_price = float(close.iloc[-1])
+    prev_price = float(close.iloc[-2]) if len(close) > 1 else current_price
+    change_percent = ((current_price - prev_price) / prev_price) * 100 if prev_price > 0 else 0
+
+    return {
+        'current_price': round(current_price, 2),
+        'change_percent': round(change_percent, 2),
+        'sparkline': close.tail(sparkline_points).tolist(),
+        'last_update': close.index[-1].strftime('%Y-%m-%d')  # 마지막 봉 날짜
+    }
+
 
 # 한국 주식 전용 콜렉터
 try:
@@ -35,8 +96,11 @@ class StockCollector:
     def __init__(self):
         self.data = None
         self.kr_collector = KRStockCollector() if KR_STOCK_AVAILABLE else None
+        self.bar_store = get_bar_store()  # 일봉 이력 캐시 (MultiSourceCollector와 공유)
+        self.info_cache = get_company_info_cache()  # 기업 정보 캐시 (하루)
 
-    def get_stock_data(self, ticker, period=DEFAULT_PERIOD, interval=DEFAULT_INTERVAL):
+    @single_flight  # 같은 인자의 동시 요청은 한 번만 조회
+    def get_stock_data(self, ticker, period=DEFAULT_PERIOD, interval=DEFAULT_INTERVAL, max_age=None):
         """
         주식 데이터 수집
 
@@ -47,6 +111,7 @@ class StockCollector:
                 - 미국: "AAPL" (애플)
             period (str): 수집 기간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
             interval (str): 데이터 간격 (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)
+            max_age (int): 캐시 허용 시간 (초, 기본값: config.BAR_STORE_TTL)
 
         Returns:
             pandas.DataFrame: OHLCV 데이터
@@ -57,36 +122,58 @@ class StockCollector:
         if is_korean and self.kr_collector:
             # FinanceDataReader로 한국 주식 수집
             print(f"📊 [한국 주식] {ticker} 데이터 수집 중 (FinanceDataReader)...")
-            return self.kr_collector.get_stock_data(ticker, period, interval)
+            return self.kr_collector.get_stock_data(ticker, period, interval, max_age)
+
+        # 일봉은 저장소 캐시 확인 (기간은 저장된 이력의 슬라이스)
+        use_store = interval == DEFAULT_INTERVAL
+        if use_store:
+            cached = self.bar_store.get_fresh(ticker, period, BAR_STORE_TTL if max_age is None else max_age)
+            if cached is not None:
+                print(f"✅ 캐시에서 {ticker} 데이터 로드 ({len(cached)}개)")
+                self.data = cached
+                return cached
 
         # 미국 주식은 yfinance 사용
         try:
             print(f"📊 [미국 주식] {ticker} 데이터 수집 중 (yfinance)...")
 
-            # API 요청 제한 방지 - 재시도 로직 추가
+            # 요청 예산(호스트별 토큰 버킷)이 있으면 바로 조회, 실패 시에만 재시도 대기
             max_retries = 3
             retry_delay = 2
 
             for attempt in range(max_retries):
                 try:
-                    time.sleep(retry_delay * (attempt + 1))  # 점진적 딜레이 증가
+                    rate_limit(YAHOO_HOST)
 
+                    # 동시 호출끼리 self.data를 덮어쓰지 않도록 지역 변수로 처리
                     stock = yf.Ticker(ticker)
-                    self.data = stock.history(period=period, interval=interval)
+                    data = stock.history(period=period, interval=interval)
 
-                    if self.data.empty:
+                    if data.empty:
                         if attempt < max_retries - 1:
                             print(f"⚠️ 재시도 {attempt + 1}/{max_retries}...")
+                            time.sleep(retry_delay * (attempt + 1))  # 점진적 딜레이 증가
                             continue
                         else:
                             print(f"⚠️ {ticker} 데이터 없음 (종목코드를 확인하세요)")
                             return None
 
                     # 한글 컬럼명으로 변경
-                    self.data.columns = ['시가', '고가', '저가', '종가', '거래량', '배당금', '주식분할']
+                    data.columns = ['시가', '고가', '저가', '종가', '거래량', '배당금', '주식분할']
 
-                    print(f"✅ {ticker} 데이터 {len(self.data)}개 수집 완료")
-                    return self.data
+                    # 캐시와 동일한 인덱스 형식 (거래소 현지 날짜, timezone 제거)
+                    if data.index.tz is not None:
+                        data.index = data.index.tz_localize(None)
+
+                    if use_store:
+                        try:
+                            self.bar_store.append(ticker, data, period)
+                        except Exception as store_error:
+                            print(f"⚠️ 캐시 저장 실패: {store_error}")
+
+                    print(f"✅ {ticker} 데이터 {len(data)}개 수집 완료")
+                    self.data = data
+                    return data
 
                 except Exception as retry_error:
                     if "429" in str(retry_error) or "Too Many Requests" in str(retry_error):
@@ -105,6 +192,118 @@ class StockCollector:
             print(f"❌ 에러: {ticker} 데이터 수집 실패 - {str(e)}")
             return None
 
+    def get_quotes(self, tickers, period='1mo', max_age=None, sparkline_points=20):
+        """
+        여러 종목 시세 일괄 조회 (관심종목/포트폴리오)
+
+        - 한국 주식: 종목별 증분 수집(바 저장소)을 스레드로 동시 실행
+        - 미국 주식/가상화폐: 저장된 이력이 오래된 종목만 모아 yf.download로 일괄 조회
+
+        Args:
+            tickers (list): 종목 코드 목록
+            period (str): 스파크라인 기간
+            max_age (int): 저장된 이력 허용 시간 (초, 기본값: config.QUOTE_MAX_AGE)
+            sparkline_points (int): 스파크라인 종가 개수
+
+        Returns:
+            dict: 종목 코드 → quote_summary 결과 (입력 순서 유지)
+        """
+        max_age = QUOTE_MAX_AGE if max_age is None else max_age
+        tickers = list(dict.fromkeys(tickers))  # 중복 제거
+
+        korean = []
+        others = []
+        for ticker in tickers:
+            is_korean = ticker.endswith('.KS') or ticker.endswith('.KQ') or (ticker.isdigit() and len(ticker) == 6)
+            (korean if is_korean and self.kr_collector else others).append(ticker)
+
+        histories = {}
+        if korean:
+            with ThreadPoolExecutor(max_workers=min(QUOTE_MAX_WORKERS, len(korean)), thread_name_prefix='quote') as executor:
+                futures = {
+                    ticker: executor.submit(self.kr_collector.get_stock_data, ticker, period, DEFAULT_INTERVAL, max_age)
+                    for ticker in korean
+                }
+                for ticker, future in futures.items():
+                    try:
+                        histories[ticker] = future.result()
+                    except Exception as e:
+                        print(f"❌ {ticker} 시세 조회 실패: {str(e)}")
+
+        if others:
+            histories.update(self._download_many(others, period, max_age))
+
+        return {ticker: quote_summary(histories.get(ticker), sparkline_points) for ticker in tickers}
+
+    def _download_many(self, tickers, period, max_age):
+        """
+        yfinance 여러 종목 일괄 수집 (저장된 이력이 유효하면 재사용, 새로 받은 봉은 저장소에 병합)
+
+        Returns:
+            dict: 종목 코드 → 한글 컬럼 DataFrame (실패한 종목은 제외)
+        """
+        histories = {}
+        missing = []
+        for ticker in tickers:
+            cached = self.bar_store.get_fresh(ticker, period, max_age)
+            if cached is not None:
+                histories[ticker] = cached
+            else:
+                missing.append(ticker)
+
+        for i in range(0, len(missing), QUOTE_BATCH_SIZE):
+            chunk = missing[i:i + QUOTE_BATCH_SIZE]
+            try:
+                print(f"📊 [일괄 시세] {len(chunk)}개 종목 수집 중 (yfinance)...")
+                rate_limit(YAHOO_HOST, tokens=len(chunk))  # 종목별 요청 수만큼 예산 사용
+                data = yf.download(
+                    chunk, period=period, interval=DEFAULT_INTERVAL, group_by='ticker',
+                    auto_adjust=True, actions=True,  # Ticker.history와 같은 값/컬럼
+                    threads=min(QUOTE_MAX_WORKERS, len(chunk)), progress=False
+                )
+            except Exception as e:
+                print(f"❌ 일괄 시세 수집 실패: {str(e)}")
+                continue
+
+            for ticker in chunk:
+                frame = self._split_download(data, ticker, len(chunk))
+                if frame is None:
+                    print(f"⚠️ {ticker} 데이터 없음")
+                    continue
+
+                try:
+                    self.bar_store.append(ticker, frame, period)
+                except Exception as store_error:
+                    print(f"⚠️ 캐시 저장 실패: {store_error}")
+                histories[ticker] = frame
+
+        return histories
+
+    @staticmethod
+    def _split_download(data, ticker, count):
+        """yf.download 결과에서 한 종목 분리 (한글 컬럼명, 빈 봉 제거)"""
+        if data is None or data.empty:
+            return None
+
+        if isinstance(data.columns, pd.MultiIndex):
+            key = ticker if ticker in data.columns.get_level_values(0) else ticker.upper()
+            if key not in data.columns.get_level_values(0):
+                return None
+            frame = data[key]
+        elif count == 1:
+            frame = data  # 한 종목만 요청하면 단일 컬럼
+        else:
+            return None
+
+        frame = frame.reindex(columns=list(YF_COLUMNS), fill_value=0.0).dropna(subset=['Close'])
+        if frame.empty:
+            return None
+
+        frame = frame.rename(columns=YF_COLUMNS)
+        if frame.index.tz is not None:
+            frame.index = frame.index.tz_localize(None)
+        return frame
+
     def get_current_price(self, ticker):
         """현재가 조회"""
         # 한국 주식 확인
@@ -115,40 +314,60 @@ class StockCollector:
 
         # 미국 주식
         try:
-            time.sleep(1)  # API 요청 제한 방지
+            rate_limit(YAHOO_HOST)  # 요청 예산 소진 시에만 대기
             stock = yf.Ticker(ticker)
             info = stock.info
             return info.get('currentPrice') or info.get('regularMarketPrice')
         except:
             return None
 
-    def get_company_info(self, ticker):
-        """기업 정보 조회"""
+    def get_company_info(self, ticker, price_data=None):
+        """
+        기업 정보 조회
+        정적 정보(종목명/업종/재무 지표)는 캐시, 52주 최고/최저·평균거래량은 가격 이력에서 계산
+
+        Args:
+            ticker (str): 종목 코드
+            price_data (pandas.DataFrame): 수집한 가격 이력 (없으면 저장된 이력 사용, 1년 미만이면 52주 값은 None)
+        """
         # 한국 주식 확인
         is_korean = ticker.endswith('.KS') or ticker.endswith('.KQ') or (ticker.isdigit() and len(ticker) == 6)
 
         if is_korean and self.kr_collector:
-            return self.kr_collector.get_company_info(ticker)
+            return self.kr_collector.get_company_info(ticker, price_data)
 
         # 미국 주식
         try:
-            time.sleep(1)  # API 요청 제한 방지
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self.info_cache.get(ticker)
+            if info is None:
+                rate_limit(YAHOO_HOST)  # 요청 예산 소진 시에만 대기
+                stock = yf.Ticker(ticker)
+                raw_info = stock.info
+
+                info = {
+                    '종목명': raw_info.get('longName') or raw_info.get('shortName'),
+                    '시가총액': raw_info.get('marketCap'),
+                    'PER': raw_info.get('trailingPE'),
+                    'PBR': raw_info.get('priceToBook'),
+                    'ROE': raw_info.get('returnOnEquity'),
+                    '배당수익률': raw_info.get('dividendYield'),
+                    '업종': raw_info.get('sector'),
+                    '산업': raw_info.get('industry')
+                }
+                if info['종목명']:  # 조회 실패(빈 응답)는 캐시하지 않음
+                    self.info_cache.put(ticker, info)
+
+            if price_data is None:
+                # 저장된 이력이 1년을 커버할 때만 52주 값 계산 (짧은 이력이면 None)
+                stats = price_stats(self.bar_store.get(ticker, '1y'), full_year=self.bar_store.covers(ticker, '1y'))
+            else:
+                stats = price_stats(price_data)
+
+            info['52주 최고'] = stats['high_52w']
+            info['52주 최저'] = stats['low_52w']
+            info['평균거래량'] = stats['avg_volume']
+            return info
 
-            return {
-                '종목명': info.get('longName') or info.get('shortName'),
-                '시가총액': info.get('marketCap'),
-                'PER': info.get('trailingPE'),
-                'PBR': info.get('priceToBook'),
-                'ROE': info.get('returnOnEquity'),
-                '배당수익률': info.get('dividendYield'),
-                '52주 최고': info.get('fiftyTwoWeekHigh'),
-                '52주 최저': info.get('fiftyTwoWeekLow'),
-                '평균거래량': info.get('averageVolume'),
-                '업종': info.get('sector'),
-                '산업': info.get('industry')
-            }
         except Exception as e:
             print(f"⚠️ 기업 정보 조회 실패: {str(e)}")
             return {}
@@ -11,6 +11,62 @@ TELEGRAM_CHAT_ID = ""  # 본인 chat_id (선택사항)
 # 데이터 수집 설정
 DEFAULT_PERIOD = "1y"  # 기본 데이터 수집 기간
 DEFAULT_INTERVAL = "1d"  # 기본 간격 (1d=일봉)
+BAR_STORE_TTL = 3600  # 가격 이력 캐시 유효 시간 (초) - 1시간
+BAR_RESYNC_OVERLAP_DAYS = 14  # 증분 수집 시 다시 받아 저장된 봉과 비교할 기간 (일) - 분할/배당 수정주가 반영
+COMPANY_INFO_TTL = 86400  # 기업 정보(종목명/업종/재무 지표) 캐시 유효 시간 (초) - 하루
+
+# 분석 API 동시 수집 설정
+ANALYZE_CONCURRENCY = 4  # 워커 프로세스당 동시 /api/analyze 요청 수 (gunicorn --threads) - 소스별 조회 풀 크기 기준
+COMPARE_MAX_WORKERS = 20  # /api/compare 외부 조회 동시 실행 스레드 수 (분석 API와 별도 풀, 최대 10종목 × 가격/뉴스)
+ANALYZE_TIMEOUTS = {  # 소스별 최대 대기 시간 (초, 조회 제출 시점부터)
+    "price": 20,  # 가격 데이터
+    "info": 10,   # 기업/코인 정보
+    "news": 10,   # 네이버/구글 뉴스
+    "fx": 5       # USD/KRW 환율
+}
+RESPONSE_CACHE_TTL_OPEN = 60     # 장중 분석 응답 캐시 유효 시간 (초) - 장 마감 후에는 다음 개장까지
+RESPONSE_CACHE_TTL_CRYPTO = 60   # 가상화폐 분석 응답 캐시 유효 시간 (초) - 24시간 거래
+RESPONSE_CACHE_MAX_ENTRIES = 256 # 최대 보관 응답 수
+
+# 외부 API 호스트별 요청 속도 제한 (초당 요청 수, 버스트)
+RATE_LIMITS = {
+    "data.krx.co.kr": (5, 10),    # FinanceDataReader 한국 주식 시세
+    "search.naver.com": (3, 5),   # 네이버 뉴스 검색
+    "query1.finance.yahoo.com": (2, 5),  # yfinance 미국 주식/원자재 시세, 기업 정보
+    "api.coingecko.com": (0.5, 5),       # CoinGecko 무료 API (분당 약 30회)
+    "news.google.com": (2, 5),           # Google News RSS
+}
+DEFAULT_RATE_LIMIT = (2, 2)  # 목록에 없는 호스트
+
+# 공용 HTTP 세션 설정 (연결 풀 + 재시도)
+HTTP_TIMEOUT = (5, 10)       # 기본 타임아웃 (연결, 읽기 초)
+HTTP_RETRIES = 3             # 429/5xx/연결 오류 최대 재시도 횟수
+HTTP_BACKOFF = 0.5           # 지수 백오프 기준 (0.5 → 1 → 2초)
+HTTP_MAX_RETRY_AFTER = 30    # Retry-After 헤더 대기 상한 (초)
+HTTP_POOL_HOSTS = 20         # 연결 풀을 유지할 호스트 수
+HTTP_POOL_SIZE = 16          # 호스트별 최대 연결 수
+ASYNC_IO_WORKERS = 16        # 공용 asyncio 루프의 블로킹 조회 스레드 수 (뉴스/코인 동시 조회)
+
+# KRX 종목 리스트 설정 (data/krx_listing.csv 스냅샷)
+KRX_LISTING_REFRESH = 86400  # 종목 리스트 갱신 주기 (초) - 하루
+KRX_LISTING_RETRY = 600      # 갱신 실패 시 재시도 간격 (초)
+
+# 시세 일괄 조회 설정 (관심종목/포트폴리오)
+QUOTE_MAX_AGE = 300          # 시세 조회 시 저장된 이력 허용 시간 (초) - 5분
+QUOTE_MAX_WORKERS = 8        # 한국 주식 동시 수집 스레드 수
+QUOTE_BATCH_SIZE = 20        # yf.download 한 번에 요청할 종목 수
+WATCHLIST_MAX_TICKERS = 50   # 관심종목 가격 조회 최대 종목 수
+
+# 종목 스캔 설정
+SCAN_MAX_WORKERS = 8  # 동시 분석 종목 수
+ANALYSIS_MAX_WORKERS = None  # 분석 프로세스 풀 크기 (None이면 CPU 코어 수 ÷ 웹 워커 수 WEB_CONCURRENCY)
+ANALYSIS_TIMEOUT = 30        # 분석 작업 1건 최대 대기 시간 (초)
+
+# 24시간 모니터링 설정
+MONITOR_INTERVAL = 300       # 종목별 점검 주기 (초)
+MONITOR_MAX_WORKERS = 4      # 동시 점검 종목 수
+MONITOR_JITTER = 0.1         # 점검 시각 분산 비율 (주기의 ±10%)
+MONITOR_MAX_BACKOFF = 3600   # 연속 실패 시 최대 재시도 간격 (초)
 
 # 기술적 지표 설정
 MA_PERIODS = [20, 60, 120]  # 이동평균선 기간
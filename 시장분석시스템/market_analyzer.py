@@ -63,7 +63,7 @@ class MarketAnalyzer:
             print("❌ 데이터 수집 실패")
             return None
 
-        company_info = self.stock_collector.get_company_info(ticker)
+        company_info = self.stock_collector.get_company_info(ticker, stock_data)
 
         # 2. 기술적 분석
         print("\n2️⃣ 기술적 분석 단계")
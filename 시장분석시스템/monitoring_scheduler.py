@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+24시간 모니터링 스케줄러
+관심 종목을 다음 점검 시각 순 우선순위 큐로 관리하고,
+가격을 증분 갱신해 신호 변화가 생기면 알림 채널로 전달
+
+- 점검 시각에 ±지터를 줘 수백 종목도 한 번에 몰리지 않게 분산
+- 동시 점검 수 제한 (워커 풀) + 수집기의 호스트별 속도 제한
+- 지표는 종목별 증분 상태(IndicatorStateStore)로 새 봉만 반영
+- 연속 실패 종목은 점검 간격을 지수적으로 늘림
+"""
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from collectors.stock_collector import StockCollector
+from analyzers.confidence_calculator import ConfidenceCalculator
+from analyzers.incremental_indicators import get_indicator_state_store
+from config import (
+    MONITOR_INTERVAL, MONITOR_MAX_WORKERS, MONITOR_JITTER, MONITOR_MAX_BACKOFF,
+    TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
+)
+
+# 신호 변화 알림 대상 (중립으로 바뀐 경우는 알리지 않음)
+ALERT_SIGNALS = ['strong_buy', 'buy', 'sell', 'strong_sell']
+
+
+def default_notifiers():
+    """config에 설정된 알림 채널 목록"""
+    notifiers = []
+    if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+        from notifications.telegram_notifier import TelegramNotifier
+        notifiers.append(TelegramNotifier(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID))
+    return notifiers
+
+
+class MonitoringScheduler:
+    """관심 종목 주기 점검 스케줄러"""
+
+    def __init__(self, stock_collector=None, notifiers=None, interval=None, max_workers=None,
+                 jitter=None, max_backoff=None, state_store=None, period='1y'):
+        """
+        Args:
+            stock_collector (StockCollector): 가격 수집기 (없으면 새로 생성)
+            notifiers (list): send_trade_signal을 가진 알림 채널 (기본값: config 설정 채널)
+            interval (int): 종목별 점검 주기 (초, 기본값: config.MONITOR_INTERVAL)
+            max_workers (int): 동시 점검 종목 수 (기본값: config.MONITOR_MAX_WORKERS)
+            jitter (float): 점검 시각 분산 비율 (기본값: config.MONITOR_JITTER)
+            max_backoff (int): 실패 시 최대 재시도 간격 (초)
+            state_store (IndicatorStateStore): 증분 지표 상태 저장소
+            period (str): 지표 계산에 쓰는 이력 기간 (MA120 확보용 1y)
+        """
+        self.stock_collector = stock_collector or StockCollector()
+        self.notifiers = default_notifiers() if notifiers is None else notifiers
+        self.interval = interval or MONITOR_INTERVAL
+        self.max_workers = max_workers or MONITOR_MAX_WORKERS
+        self.jitter = MONITOR_JITTER if jitter is None else jitter
+        self.max_backoff = max_backoff or MONITOR_MAX_BACKOFF
+        self.state_store = state_store or get_indicator_state_store()
+        self.period = period
+
+        self._queue = []                 # (다음 점검 시각, 순번, 티커)
+        self._entries = {}               # 티커 → 점검 상태
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._generation = 0             # start마다 증가 (이전 디스패처 종료 판별)
+        self._thread = None
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self.alerts = deque(maxlen=100)  # 최근 알림 (상태 API용)
+
+    # ==================== 종목 관리 ====================
+
+    def add(self, ticker, interval=None):
+        """관심 종목 추가 (첫 점검은 지터 범위 안에서 분산)"""
+        with self._cond:
+            if ticker in self._entries:
+                return
+            entry = {
+                'ticker': ticker,
+                'interval': interval or self.interval,
+                'signal': None,
+                'confidence': None,
+                'cross_date': None,
+                'last_check': None,
+                'last_error': None,
+                'errors': 0,
+                'running': False
+            }
+            self._entries[ticker] = entry
+            self._push(ticker, time.time() + random.uniform(0, entry['interval'] * self.jitter))
+            self._cond.notify()
+
+    def remove(self, ticker):
+        """관심 종목 제거 (큐에 남은 항목은 꺼낼 때 무시)"""
+        with self._cond:
+            self._entries.pop(ticker, None)
+
+    def set_tickers(self, tickers):
+        """관심 종목 목록 교체 (기존 종목의 상태는 유지)"""
+        with self._cond:
+            for ticker in set(self._entries) - set(tickers):
+                self._entries.pop(ticker)
+        for ticker in tickers:
+            self.add(ticker)
+
+    def tickers(self):
+        with self._cond:
+            return list(self._entries)
+
+    def _push(self, ticker, due):
+        """점검 예약 (호출자가 락 보유)"""
+        self._entries[ticker]['due'] = due
+        heapq.heappush(self._queue, (due, next(self._counter), ticker))
+
+    # ==================== 실행 ====================
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        """디스패처 스레드 시작 (이미 실행 중이면 False)"""
+        with self._cond:
+            if self._running:
+                return False
+            self._running = True
+            self._generation += 1
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='monitor')
+            self._thread = threading.Thread(target=self._dispatch_loop, args=(self._generation,),
+                                            name='monitor-dispatcher', daemon=True)
+            self._thread.start()
+
+        print(f"👀 모니터링 시작: {len(self._entries)}개 종목, 주기 {self.interval}초, 동시 {self.max_workers}개")
+        return True
+
+    def stop(self, wait=False):
+        """디스패처 중지 (진행 중인 점검은 끝까지 실행)"""
+        with self._cond:
+            if not self._running:
+                return False
+            self._running = False
+            self._cond.notify_all()
+            executor = self._executor
+            self._executor = None
+
+        executor.shutdown(wait=wait)
+        print("⏹️ 모니터링 중지")
+        return True
+
+    def _dispatch_loop(self, generation):
+        """점검 시각이 된 종목을 꺼내 워커 풀에 제출"""
+        while True:
+            # 동시 점검 수 제한 (빈 슬롯이 생길 때까지 대기)
+            self._slots.acquire()
+
+            with self._cond:
+                ticker = self._next_due(generation)
+                if ticker is None:
+                    self._slots.release()
+                    return
+                self._executor.submit(self._run_check, ticker)
+
+    def _next_due(self, generation):
+        """가장 이른 점검 종목이 될 때까지 대기 후 반환 (호출자가 락 보유, 중지 시 None)"""
+        while self._running and self._generation == generation:
+            if not self._queue:
+                self._cond.wait()
+                continue
+
+            due, _, ticker = self._queue[0]
+            entry = self._entries.get(ticker)
+            if entry is None or entry['due'] != due or entry['running']:
+                heapq.heappop(self._queue)  # 제거됐거나 재예약된 항목
+                continue
+
+            delay = due - time.time()
+            if delay > 0:
+                self._cond.wait(timeout=delay)
+                continue
+
+            heapq.heappop(self._queue)
+            entry['running'] = True
+            return ticker
+        return None
+
+    def _run_check(self, ticker):
+        """종목 1회 점검 후 다음 점검 예약"""
+        try:
+            self.check(ticker)
+            failed = False
+        except Exception as e:
+            print(f"⚠️ 모니터링 점검 실패 ({ticker}): {e}")
+            failed = str(e)
+        finally:
+            self._slots.release()
+
+        with self._cond:
+            entry = self._entries.get(ticker)
+            if entry is None:
+                return
+
+            entry['running'] = False
+            entry['last_check'] = datetime.now().isoformat()
+            if failed:
+                entry['errors'] += 1
+                entry['last_error'] = failed
+                delay = min(self.max_backoff, entry['interval'] * 2 ** entry['errors'])
+            else:
+                entry['errors'] = 0
+                entry['last_error'] = None
+                delay = entry['interval']
+
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+            self._push(ticker, time.time() + delay)
+            self._cond.notify()
+
+    # ==================== 점검 ====================
+
+    def check(self, ticker):
+        """
+        가격 증분 갱신 → 지표/신뢰도 계산 → 직전 상태와 비교해 알림
+
+        Returns:
+            dict or None: 이번 점검에서 보낸 알림
+        """
+        price_data = self.stock_collector.get_stock_data(ticker, period=self.period, max_age=self.interval)
+        if price_data is None or price_data.empty:
+            raise ValueError('가격 데이터 없음')
+
+        technical_result = self.state_store.sync(ticker, price_data)
+        confidence = ConfidenceCalculator().calculate_confidence(technical_result, {})
+        price = technical_result['support_resistance']['current']
+
+        with self._cond:
+            entry = self._entries.get(ticker)
+            if entry is None:
+                return None
+            previous_signal = entry['signal']
+            previous_cross = entry['cross_date']
+            entry['signal'] = confidence['signal']
+            entry['confidence'] = confidence['score']
+            entry['price'] = price
+            cross = technical_result['cross']
+            if cross:
+                entry['cross_date'] = technical_result['date']
+
+        # 첫 점검은 기준 상태만 기록
+        reasons = []
+        if previous_signal is not None and confidence['signal'] != previous_signal \
+                and confidence['signal'] in ALERT_SIGNALS:
+            reasons.append({'reason': f"신호 변경: {previous_signal} → {confidence['signal']}"})
+        if previous_signal is not None and cross and technical_result['date'] != previous_cross:
+            reasons.append({'reason': cross['description']})
+
+        if not reasons:
+            return None
+
+        alert = {
+            'ticker': ticker,
+            'signal': confidence['signal'],
+            'previous_signal': previous_signal,
+            'confidence': confidence['score'],
+            'price': price,
+            'reasons': reasons + confidence['reasons'][:3],
+            'time': datetime.now().isoformat()
+        }
+        self.alerts.append(alert)
+        self._notify(alert)
+        return alert
+
+    def _notify(self, alert):
+        """알림 채널로 전달 (채널 실패는 다른 채널에 영향 없음)"""
+        print(f"🔔 {alert['ticker']} {alert['reasons'][0]['reason']} (신뢰도 {alert['confidence']}%)")
+        for notifier in self.notifiers:
+            try:
+                notifier.send_trade_signal(
+                    alert['ticker'], alert['signal'], alert['price'], alert['confidence'], alert['reasons']
+                )
+            except Exception as e:
+                print(f"⚠️ 알림 전송 실패 ({type(notifier).__name__}): {e}")
+
+    # ==================== 상태 ====================
+
+    def status(self):
+        """스케줄러 상태 (상태 API용)"""
+        with self._cond:
+            now = time.time()
+            schedule = [
+                {
+                    'ticker': entry['ticker'],
+                    'next_check_in': None if entry['running'] else round(max(0, entry['due'] - now), 1),
+                    'running': entry['running'],
+                    'last_check': entry['last_check'],
+                    'signal': entry['signal'],
+                    'confidence': entry['confidence'],
+                    'errors': entry['errors'],
+                    'last_error': entry['last_error']
+                }
+                for entry in self._entries.values()
+            ]
+            return {
+                'active': self._running,
+                'tickers': list(self._entries),
+                'interval': self.interval,
+                'max_workers': self.max_workers,
+                'schedule': sorted(schedule, key=lambda s: s['next_check_in'] if s['next_check_in'] is not None else -1),
+                'alerts': list(self.alerts)[-20:]
+            }
@@ -2,10 +2,14 @@
 """
 카카오톡 알림 모듈 (카카오 비즈니스 메시지 API)
 """
-import requests
+import sys
+import os
 import json
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_session import get_http_session
+
 
 class KakaoNotifier:
     """카카오톡 메시지 전송"""
@@ -15,6 +19,7 @@ class KakaoNotifier:
         self.template_id = template_id
         self.phone_number = phone_number
         self.access_token = None
+        self.session = get_http_session()  # 공용 연결 풀 세션
 
     def get_access_token(self, auth_code):
         """OAuth 인증 토큰 받기"""
@@ -26,7 +31,7 @@ class KakaoNotifier:
         }
 
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = self.session.post(url, data=data)
             if response.status_code == 200:
                 self.access_token = response.json()['access_token']
                 print("✅ 카카오 토큰 발급 완료")
@@ -54,7 +59,7 @@ class KakaoNotifier:
         }
 
         try:
-            response = requests.post(url, headers=headers, data=data, timeout=10)
+            response = self.session.post(url, headers=headers, data=data)
             if response.status_code == 200:
                 print("✅ 카카오톡 알림 전송 완료")
                 return True
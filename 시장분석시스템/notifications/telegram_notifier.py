@@ -2,10 +2,14 @@
 """
 텔레그램 알림 모듈
 """
-import requests
+import sys
+import os
 import json
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_session import get_http_session
+
 
 class TelegramNotifier:
     """텔레그램 메시지 전송"""
@@ -14,6 +18,7 @@ class TelegramNotifier:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.base_url = f"https://api.telegram.org/bot{bot_token}" if bot_token else None
+        self.session = get_http_session()  # 공용 연결 풀 세션
 
     def send_message(self, message, parse_mode="HTML"):
         """텔레그램 메시지 전송"""
@@ -29,7 +34,7 @@ class TelegramNotifier:
                 "parse_mode": parse_mode
             }
 
-            response = requests.post(url, json=data, timeout=10)
+            response = self.session.post(url, json=data)
             if response.status_code == 200:
                 print("✅ 텔레그램 알림 전송 완료")
                 return True
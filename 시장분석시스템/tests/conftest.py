@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 픽스처
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helpers import make_ohlcv
+
+
+@pytest.fixture(params=[0, 1, 2], ids=lambda seed: f'seed{seed}')
+def price_data(request):
+    """시드별 합성 일봉 300개"""
+    return make_ohlcv(bars=300, seed=request.param)
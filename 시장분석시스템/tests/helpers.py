@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 도구
+- make_ohlcv: 시드 고정 합성 일봉 (네트워크 없이 실행)
+- assert_same: 분석 결과(dict/list/배열/DataFrame) 비교 (실수는 상대 오차 허용, NaN끼리는 같음)
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def make_ohlcv(bars=300, seed=0, start_price=50000.0):
+    """
+    시드 고정 랜덤워크 일봉 (영문 컬럼, 영업일 인덱스)
+
+    Args:
+        bars (int): 봉 개수
+        seed (int): 난수 시드
+        start_price (float): 시작 가격
+
+    Returns:
+        DataFrame: Open, High, Low, Close, Volume
+    """
+    rng = np.random.default_rng(seed)
+    close = start_price * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    open_ = close * (1 + rng.normal(0, 0.005, bars))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, bars))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, bars))
+    volume = rng.integers(100_000, 1_000_000, bars).astype('float64')
+    volume[rng.choice(bars, bars // 20, replace=False)] *= 3  # 거래량 급증 봉
+
+    index = pd.bdate_range('2023-01-02', periods=bars)
+    return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume}, index=index)
+
+
+def assert_same(actual, expected, rtol=1e-9, path='result'):
+    """중첩 결과 비교 (어디가 다른지 path로 표시)"""
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), path
+        assert set(actual) == set(expected), f"{path}: 키 다름 {set(actual) ^ set(expected)}"
+        for key in expected:
+            assert_same(actual[key], expected[key], rtol, f"{path}.{key}")
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected), f"{path}: 길이 다름"
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            assert_same(a, e, rtol, f"{path}[{i}]")
+    elif isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=rtol, obj=path)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual, expected, check_exact=False, rtol=rtol, obj=path)
+    elif isinstance(expected, np.ndarray):
+        np.testing.assert_allclose(actual, expected, rtol=rtol, equal_nan=True, err_msg=path)
+    elif isinstance(expected, (float, np.floating)) and not isinstance(expected, bool):
+        if math.isnan(expected):
+            assert math.isnan(actual), f"{path}: {actual} != NaN"
+        else:
+            assert actual == pytest.approx(expected, rel=rtol, abs=1e-12), f"{path}: {actual} != {expected}"
+    else:
+        assert actual == expected, f"{path}: {actual!r} != {expected!r}"
+
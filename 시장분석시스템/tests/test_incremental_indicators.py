@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+증분 지표 동등성 테스트
+봉 1개씩 update한 결과가 그 봉까지의 이력으로 TechnicalAnalyzer.analyze_all을 돌린 결과와 같은지,
+JSON 저장/복원과 peek가 상태를 바꾸지 않는지 확인
+"""
+import copy
+import json
+
+import pytest
+
+from analyzers.technical_analyzer import TechnicalAnalyzer
+from analyzers.incremental_indicators import IncrementalIndicators, IndicatorStateStore
+from helpers import assert_same
+
+RTOL = 1e-7  # 이동 합계(링 버퍼)와 누적합 방식의 반올림 차이
+RESULT_KEYS = ('rsi', 'macd', 'bollinger', 'volume', 'support_resistance', 'trend', 'cross', 'signals')
+
+
+def analyze_all(df):
+    """기존 경로: 전체 이력 재계산 ('data' 제외)"""
+    result = TechnicalAnalyzer(df).analyze_all()
+    return {key: result[key] for key in RESULT_KEYS}
+
+
+def indicator_result(snapshot):
+    return {key: snapshot[key] for key in RESULT_KEYS}
+
+
+def test_update_matches_analyze_all_every_bar(price_data):
+    state = IncrementalIndicators()
+    for t in range(len(price_data)):
+        snapshot = state.update(price_data.iloc[t], price_data.index[t])
+        assert_same(indicator_result(snapshot), analyze_all(price_data.iloc[:t + 1]), RTOL, f"bar {t}")
+
+
+def test_moving_averages_match_analyze_all(price_data):
+    snapshot = IncrementalIndicators.from_history(price_data).snapshot()
+    data = TechnicalAnalyzer(price_data).analyze_all()['data']
+    for period in (20, 60, 120):
+        assert snapshot['moving_averages'][f'MA{period}'] == pytest.approx(data[f'MA{period}'].iloc[-1], rel=RTOL)
+    assert snapshot['bars'] == len(price_data)
+
+
+def test_korean_columns_are_accepted(price_data):
+    korean = price_data.rename(columns={'Open': '시가', 'High': '고가', 'Low': '저가', 'Close': '종가', 'Volume': '거래량'})
+    assert_same(IncrementalIndicators.from_history(korean).snapshot(),
+                IncrementalIndicators.from_history(price_data).snapshot())
+
+
+def test_json_round_trip_continues_identically(price_data):
+    state = IncrementalIndicators.from_history(price_data.iloc[:200])
+    restored = IncrementalIndicators.from_dict(json.loads(json.dumps(state.to_dict())))
+
+    for t in range(200, len(price_data)):
+        bar, date = price_data.iloc[t], price_data.index[t]
+        assert_same(restored.update(bar, date), state.update(bar, date), path=f"bar {t}")
+
+
+def test_peek_does_not_change_state(price_data):
+    state = IncrementalIndicators.from_history(price_data.iloc[:-1])
+    before = copy.deepcopy(state.to_dict())
+
+    peeked = state.peek(price_data.iloc[-1], price_data.index[-1])
+
+    assert state.to_dict() == before
+    assert_same(indicator_result(peeked), analyze_all(price_data), RTOL)
+
+
+def test_store_sync_feeds_only_new_bars(price_data, tmp_path):
+    store = IndicatorStateStore(base_dir=tmp_path)
+
+    first = store.sync('TEST', price_data.iloc[:200])
+    assert_same(indicator_result(first), analyze_all(price_data.iloc[:200]), RTOL)
+    assert store.get('TEST').bars == 199  # 마지막 봉은 장중 미완성으로 보고 확정하지 않음
+
+    latest = store.sync('TEST', price_data)
+    assert_same(indicator_result(latest), analyze_all(price_data), RTOL)
+    assert store.get('TEST').bars == len(price_data) - 1
+
+    # 디스크에서 다시 읽어도 같은 상태
+    reloaded = IndicatorStateStore(base_dir=tmp_path)
+    assert reloaded.get('TEST').to_dict() == store.get('TEST').to_dict()
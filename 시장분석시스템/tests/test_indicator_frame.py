@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+IndicatorFrame 동등성 테스트
+공용 지표 엔진의 NumPy 계산이 분석기들이 쓰던 pandas 계산(rolling/ewm)과 같은 값을 내는지,
+분석기가 프레임을 공유해도 각자 만들 때와 결과가 같은지 확인
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzers.indicator_frame import IndicatorFrame
+from analyzers.technical_analyzer import TechnicalAnalyzer
+from analyzers.bollinger_rsi_analyzer import BollingerRSIAnalyzer
+from analyzers.ma_cross_analyzer import MovingAverageCrossAnalyzer
+from analyzers.volume_analyzer import VolumeAnalyzer
+from helpers import assert_same
+
+RTOL = 1e-9
+
+
+# ==================== 기존 pandas 계산 (IndicatorFrame 도입 전 분석기 코드) ====================
+
+def pandas_rsi(close, period=14):
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def pandas_macd(close, fast=12, slow=26, signal=9):
+    macd = close.ewm(span=fast, adjust=False).mean() - close.ewm(span=slow, adjust=False).mean()
+    macd_signal = macd.ewm(span=signal, adjust=False).mean()
+    return {'macd': macd, 'signal': macd_signal, 'histogram': macd - macd_signal}
+
+
+def pandas_bollinger(close, period=20, std_dev=2):
+    middle = close.rolling(window=period).mean()
+    std = close.rolling(window=period).std()
+    upper = middle + std * std_dev
+    lower = middle - std * std_dev
+    return {
+        'upper': upper,
+        'middle': middle,
+        'lower': lower,
+        'percent_b': (close - lower) / (upper - lower),
+        'width': (upper - lower) / middle
+    }
+
+
+def assert_array(actual, expected, atol=1e-9):
+    np.testing.assert_allclose(actual, np.asarray(expected, dtype='float64'), rtol=RTOL, atol=atol, equal_nan=True)
+
+
+# ==================== 지표 ====================
+
+@pytest.mark.parametrize('period', [5, 20, 60, 120])
+def test_sma_matches_pandas_rolling_mean(price_data, period):
+    frame = IndicatorFrame(price_data)
+    assert_array(frame.sma(period), price_data['Close'].rolling(period).mean())
+    assert_array(frame.sma(period, 'Volume'), price_data['Volume'].rolling(period).mean())
+
+
+@pytest.mark.parametrize('period', [2, 20, 60])
+def test_rolling_std_matches_pandas(price_data, period):
+    """누적합 방식이라 가격 수준 대비 오차만 허용 (가격 ~5만, 허용 1e-6)"""
+    frame = IndicatorFrame(price_data)
+    assert_array(frame.rolling_std(period), price_data['Close'].rolling(period).std(), atol=1e-6)
+
+
+def test_ema_rsi_macd_bollinger_match_pandas(price_data):
+    frame = IndicatorFrame(price_data)
+    close = price_data['Close']
+
+    assert_array(frame.ema(12), close.ewm(span=12, adjust=False).mean())
+    assert_array(frame.rsi(14), pandas_rsi(close, 14))
+
+    expected_macd = pandas_macd(close)
+    for key, values in frame.macd().items():
+        assert_array(values, expected_macd[key])
+
+    expected_bb = pandas_bollinger(close)
+    for key, values in frame.bollinger().items():
+        assert_array(values, expected_bb[key])
+
+
+def test_nan_gaps_follow_pandas_rules(price_data):
+    """결측 봉이 창 안에 있으면 NaN (pandas rolling 기본 min_periods와 동일)"""
+    data = price_data.copy()
+    data.iloc[[30, 31, 150], data.columns.get_loc('Close')] = np.nan
+    data.iloc[200, data.columns.get_loc('Volume')] = np.nan
+    frame = IndicatorFrame(data)
+
+    assert_array(frame.sma(20), data['Close'].rolling(20).mean())
+    assert_array(frame.rolling_std(20), data['Close'].rolling(20).std(), atol=1e-6)
+    assert_array(frame.sma(20, 'Volume'), data['Volume'].rolling(20).mean())
+    assert_array(frame.rsi(14), pandas_rsi(data['Close'], 14))
+
+
+def test_short_history_is_all_nan():
+    data = pd.DataFrame({'Close': [1.0, 2.0, 3.0], 'Volume': [1.0, 1.0, 1.0]},
+                        index=pd.bdate_range('2024-01-01', periods=3))
+    frame = IndicatorFrame(data)
+    assert np.isnan(frame.sma(20)).all()
+    assert np.isnan(frame.rolling_std(20)).all()
+
+
+def test_memoized_per_parameters(price_data):
+    frame = IndicatorFrame(price_data)
+    assert frame.sma(20) is frame.sma(20)
+    assert frame.sma(20) is not frame.sma(60)
+    assert frame.bollinger(20, 2) is not frame.bollinger(20, 3)
+
+
+# ==================== 분석기 ====================
+
+def test_technical_analyzer_matches_pandas(price_data):
+    result = TechnicalAnalyzer(price_data).analyze_all()
+    close = price_data['Close']
+
+    assert result['rsi'] == pytest.approx(pandas_rsi(close).iloc[-1], rel=RTOL)
+    macd = pandas_macd(close)
+    for key in ('macd', 'signal', 'histogram'):
+        assert result['macd'][key] == pytest.approx(macd[key].iloc[-1], rel=RTOL)
+    bb = pandas_bollinger(close)
+    for key in ('upper', 'middle', 'lower'):
+        assert result['bollinger'][key] == pytest.approx(bb[key].iloc[-1], rel=RTOL)
+    assert result['volume']['average'] == pytest.approx(price_data['Volume'].rolling(20).mean().iloc[-1], rel=RTOL)
+    for period in (20, 60, 120):
+        assert_array(result['data'][f'MA{period}'], close.rolling(period).mean())
+
+
+def test_shared_frame_matches_separate_frames(price_data):
+    """/api/analyze처럼 한 프레임을 네 분석기가 공유해도 각자 계산한 결과와 같음"""
+    shared = IndicatorFrame(price_data)
+    results = {
+        'technical': TechnicalAnalyzer(price_data, shared).analyze_all(),
+        'bb_rsi': BollingerRSIAnalyzer().analyze(price_data, shared),
+        'ma_cross': MovingAverageCrossAnalyzer().analyze(price_data, shared),
+        'volume': VolumeAnalyzer().analyze(price_data, shared),
+    }
+    separate = {
+        'technical': TechnicalAnalyzer(price_data).analyze_all(),
+        'bb_rsi': BollingerRSIAnalyzer().analyze(price_data),
+        'ma_cross': MovingAverageCrossAnalyzer().analyze(price_data),
+        'volume': VolumeAnalyzer().analyze(price_data),
+    }
+    assert_same(results, separate)
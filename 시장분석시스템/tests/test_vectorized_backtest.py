@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+벡터화 백테스트 동등성 테스트
+봉별 신뢰도 시계열이 그 봉까지의 데이터로 TechnicalAnalyzer + ConfidenceCalculator를 돌린 점수와 같은지,
+배열 청산 시뮬레이션이 거래별 봉 순회 결과와 같은지 확인
+"""
+import numpy as np
+import pytest
+
+from analyzers.technical_analyzer import TechnicalAnalyzer
+from analyzers.confidence_calculator import ConfidenceCalculator
+from backtesting.vectorized_backtest import (
+    VectorizedBacktester, component_scores, confidence_series, simulate_trades
+)
+from helpers import make_ohlcv
+
+NO_NEWS = {'total_news': 0}  # 과거 뉴스 없음 → 감성 중립 0.5
+
+
+def per_bar_score(df, t):
+    """기존 경로: t번째 봉까지 잘라 분석 (점수는 소수 첫째 자리 반올림)"""
+    technical = TechnicalAnalyzer(df.iloc[:t + 1]).analyze_all()
+    return ConfidenceCalculator().calculate_confidence(technical, NO_NEWS)['score']
+
+
+def per_bar_trades(df, entries, hold_days, stop_loss, risk_reward):
+    """기존 방식의 거래별 봉 순회 (손절 우선, 갭이면 시가 청산)"""
+    close, open_ = df['Close'].to_numpy(), df['Open'].to_numpy()
+    high, low = df['High'].to_numpy(), df['Low'].to_numpy()
+    n = len(df)
+
+    trades = []
+    daily = [[] for _ in range(n)]
+    for t in np.flatnonzero(entries[:max(0, n - hold_days)]):
+        entry = close[t]
+        stop = entry * (1 - stop_loss)
+        target = entry * (1 + stop_loss * risk_reward)
+        for i in range(t + 1, t + hold_days + 1):
+            if low[i] <= stop:
+                exit_price, reason = min(stop, open_[i]), 'stop_loss'
+                break
+            if high[i] >= target:
+                exit_price, reason = max(target, open_[i]), 'take_profit'
+                break
+        else:
+            i, exit_price, reason = t + hold_days, close[t + hold_days], 'hold_expired'
+
+        for j in range(t + 1, i + 1):
+            price = exit_price if j == i else close[j]
+            daily[j].append(price / close[j - 1] - 1)
+        trades.append((df.index[t], df.index[i], entry, exit_price, i - t, reason))
+
+    daily_returns = np.array([np.mean(r) if r else 0.0 for r in daily])
+    return trades, daily_returns
+
+
+def test_confidence_series_matches_per_bar_analysis(price_data):
+    scores = confidence_series(component_scores(price_data))
+    for t in range(1, len(price_data), 7):
+        assert scores[t] == pytest.approx(per_bar_score(price_data, t), abs=0.05 + 1e-9), f"bar {t}"
+
+
+def test_confidence_series_on_long_history():
+    """MA120 이후 구간 전체 (정배열/역배열, 크로스가 모두 나오는 긴 이력)"""
+    df = make_ohlcv(bars=500, seed=7)
+    scores = confidence_series(component_scores(df))
+    for t in range(120, len(df), 3):
+        assert scores[t] == pytest.approx(per_bar_score(df, t), abs=0.05 + 1e-9), f"bar {t}"
+
+
+@pytest.mark.parametrize('hold_days', [1, 5, 10])
+def test_simulate_trades_matches_per_trade_loop(price_data, hold_days):
+    rng = np.random.default_rng(hold_days)
+    entries = rng.random(len(price_data)) < 0.2
+    stop_loss, risk_reward = 0.03, 2.0
+
+    trades, daily_returns = simulate_trades(price_data, entries, hold_days, stop_loss, risk_reward)
+    expected, expected_daily = per_bar_trades(price_data, entries, hold_days, stop_loss, risk_reward)
+
+    assert len(trades) == len(expected)
+    for row, (entry_date, exit_date, entry, exit_price, bars_held, reason) in zip(trades.itertuples(), expected):
+        assert (row.entry_date, row.exit_date, row.bars_held, row.exit_reason) == \
+            (entry_date, exit_date, bars_held, reason)
+        assert row.entry_price == pytest.approx(entry)
+        assert row.exit_price == pytest.approx(exit_price)
+    np.testing.assert_allclose(daily_returns, expected_daily, rtol=1e-12, atol=1e-15)
+
+
+def test_backtester_enters_on_threshold_after_warmup(price_data):
+    backtester = VectorizedBacktester(entry_threshold=50, hold_days=5)
+    scores, entries = backtester.signals(price_data)
+
+    assert not entries[:backtester.warmup].any()
+    np.testing.assert_array_equal(entries[backtester.warmup:], scores[backtester.warmup:] >= 50)
+
+    result = backtester.run(price_data, 'TEST')
+    assert result['total_trades'] == int(entries[:len(price_data) - 5].sum())
+    assert 0 <= result['hit_rate'] <= 100
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+공용 asyncio 이벤트 루프 스레드
+웹 프로세스에 루프 스레드 하나를 두고, 동기 코드(Flask 요청 스레드, 스캔 워커)에서
+코루틴을 제출해 결과를 기다림 - 여러 종목의 뉴스/코인 조회를 한 루프에서 동시에 처리
+
+네트워크 호출은 기존 동기 수집기(공용 HTTP 세션 + 호스트별 속도 제한)를
+asyncio.to_thread로 감싸 실행하므로 새 의존성이 필요 없습니다.
+
+사용 예:
+    from utils.async_loop import run_sync
+
+    async def fetch_all(names):
+        return await asyncio.gather(*(collector.get_news_async(name) for name in names))
+
+    results = run_sync(fetch_all(['삼성전자', 'SK하이닉스']), timeout=30)
+"""
+
+import asyncio
+import threading
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ASYNC_IO_WORKERS
+
+
+class AsyncLoopThread:
+    """데몬 스레드에서 실행되는 이벤트 루프"""
+
+    def __init__(self, io_workers=None):
+        """
+        Args:
+            io_workers (int): to_thread 블로킹 호출용 스레드 수 (기본값: config.ASYNC_IO_WORKERS)
+        """
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=io_workers or ASYNC_IO_WORKERS, thread_name_prefix='async-io')
+        )
+        self._thread = threading.Thread(target=self._run, name='async-loop', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def in_loop_thread(self):
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro):
+        """코루틴 제출 (concurrent.futures.Future 반환)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """
+        코루틴 실행 후 결과 대기 (동기 래퍼)
+
+        루프 스레드 안에서 호출하면 교착되므로 RuntimeError를 발생시킵니다 - 코루틴에서는 await 사용.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError('이벤트 루프 스레드에서는 run 대신 await를 사용하세요')
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+
+def get_async_loop():
+    """전역 이벤트 루프 스레드 (처음 호출 시 시작)"""
+    global _async_loop
+    if _async_loop is None:
+        with _async_loop_lock:
+            if _async_loop is None:
+                _async_loop = AsyncLoopThread()
+    return _async_loop
+
+
+def run_sync(coro, timeout=None):
+    """전역 루프에서 코루틴 실행 후 결과 반환"""
+    return get_async_loop().run(coro, timeout)
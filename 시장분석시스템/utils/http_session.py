@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+공용 HTTP 세션 (연결 풀 + Keep-Alive + 재시도)
+requests.get/post를 매번 호출하면 요청마다 TCP/TLS 연결을 새로 맺으므로,
+프로세스 공용 세션 하나로 호스트별 연결을 재사용
+
+- 호스트별 연결 풀 (동시 요청 수만큼 연결 유지)
+- 기본 타임아웃 (연결, 읽기) - 호출 시 timeout을 주면 그 값 사용
+- 429/5xx 및 연결 오류는 지수 백오프로 재시도, Retry-After 헤더 준수
+
+사용 예:
+    from utils.http_session import get_http_session
+
+    session = get_http_session()
+    response = session.get(url, params=params)  # 기본 타임아웃 적용
+"""
+
+import threading
+import sys
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    HTTP_TIMEOUT, HTTP_RETRIES, HTTP_BACKOFF, HTTP_MAX_RETRY_AFTER,
+    HTTP_POOL_HOSTS, HTTP_POOL_SIZE
+)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CappedRetry(Retry):
+    """
+    재시도 정책
+    - Retry-After 대기 시간 상한 (서버가 긴 대기를 요구해도 요청 스레드를 오래 묶지 않음)
+    - POST는 서버가 처리하지 않았음이 확실한 429/503 응답만 재시도 (알림 중복 전송 방지)
+    """
+
+    def parse_retry_after(self, retry_after):
+        return min(super().parse_retry_after(retry_after), HTTP_MAX_RETRY_AFTER)
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == 'POST':
+            return bool(self.total) and status_code in (429, 503)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class PooledSession(requests.Session):
+    """기본 타임아웃이 있는 세션"""
+
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout or HTTP_TIMEOUT
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(timeout=None, retries=None, backoff=None, pool_size=None):
+    """
+    연결 풀/재시도 정책이 설정된 세션 생성
+
+    재시도를 모두 소진하면 예외 대신 마지막 응답을 그대로 반환합니다
+    (기존 status_code 처리 코드가 그대로 동작).
+
+    Args:
+        timeout (tuple): (연결, 읽기) 타임아웃 초 (기본값: config.HTTP_TIMEOUT)
+        retries (int): 최대 재시도 횟수 (기본값: config.HTTP_RETRIES)
+        backoff (float): 지수 백오프 기준 초 (기본값: config.HTTP_BACKOFF)
+        pool_size (int): 호스트별 최대 연결 수 (기본값: config.HTTP_POOL_SIZE)
+
+    Returns:
+        PooledSession
+    """
+    retry = CappedRetry(
+        total=HTTP_RETRIES if retries is None else retries,
+        backoff_factor=HTTP_BACKOFF if backoff is None else backoff,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_HOSTS,
+        pool_maxsize=pool_size or HTTP_POOL_SIZE,
+        max_retries=retry
+    )
+
+    session = PooledSession(timeout)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """전역 HTTP 세션 인스턴스"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = create_session()
+    return _http_session
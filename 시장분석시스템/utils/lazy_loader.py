@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+지연 로딩 + 시작 시간 측정
+웹 서버 시작 시 yfinance/FinanceDataReader/reportlab 등 무거운 모듈을 바로 임포트하지 않고,
+수집기/PDF 생성기는 처음 사용할 때 생성 - 워커가 '/'와 '/api/search'를 바로 처리할 수 있게 함
+
+- LazyInstance: 첫 속성 접근 시 모듈 임포트 + 객체 생성 (이후에는 그 객체에 그대로 위임)
+- StartupProfile: 임포트/생성 단계별 소요 시간 기록 (시작 시간 보고서)
+
+사용 예:
+    from utils.lazy_loader import get_startup_profile, lazy_instance
+
+    startup = get_startup_profile()
+    with startup.measure('flask'):
+        from flask import Flask
+
+    stock_collector = lazy_instance('collectors.stock_collector', 'StockCollector')
+    stock_collector.get_stock_data('005930')  # 이 시점에 임포트 + 생성
+
+    startup.print_report()
+"""
+
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """임포트/객체 생성 단계별 소요 시간 기록"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.ready = None  # 서버 준비 완료까지 걸린 시간 (초)
+        self._entries = []
+        self._lock = threading.Lock()
+
+    def record(self, label, kind, seconds):
+        """
+        단계 기록
+
+        Args:
+            label (str): 모듈 이름 또는 객체 이름
+            kind (str): import (모듈 임포트) / init (객체 생성, 안쪽 임포트 포함)
+            seconds (float): 소요 시간
+        """
+        with self._lock:
+            self._entries.append({
+                'label': label,
+                'kind': kind,
+                'seconds': round(seconds, 4),
+                'at': round(time.perf_counter() - self.started, 4)  # 시작 후 경과 시간
+            })
+
+    @contextmanager
+    def measure(self, label, kind='import'):
+        """with 블록 소요 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(label, kind, time.perf_counter() - start)
+
+    def import_module(self, name):
+        """모듈 임포트 (처음 임포트할 때만 시간 기록)"""
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+
+        with self.measure(name, 'import'):
+            return importlib.import_module(name)
+
+    def mark_ready(self):
+        """서버 준비 완료 시점 기록"""
+        self.ready = time.perf_counter() - self.started
+
+    def report(self):
+        """
+        시작 시간 보고서
+
+        init 시간에는 안쪽 임포트 시간이 포함되므로 단계 시간을 더하지 않습니다.
+
+        Returns:
+            dict: ready_seconds (준비 완료까지), entries (소요 시간 내림차순)
+        """
+        with self._lock:
+            entries = sorted(self._entries, key=lambda e: e['seconds'], reverse=True)
+
+        return {
+            'ready_seconds': round(self.ready, 4) if self.ready is not None else None,
+            'entries': entries
+        }
+
+    def print_report(self, top=10):
+        """시작 시간 보고서 출력 (상위 top개 단계)"""
+        report = self.report()
+        ready = report['ready_seconds']
+        print(f"⏱️ 시작 시간 보고서: 준비 완료 {ready if ready is not None else '-'}초")
+        for entry in report['entries'][:top]:
+            print(f"   {entry['seconds'] * 1000:8.1f}ms  [{entry['kind']}] {entry['label']}")
+
+
+class LazyInstance:
+    """
+    첫 사용 시 생성되는 객체 프록시
+
+    속성 접근을 실제 객체에 위임하므로 기존 전역 변수 자리에 그대로 둘 수 있습니다.
+    생성은 한 번만 수행 (동시 첫 접근은 잠금으로 직렬화).
+    """
+
+    def __init__(self, label, factory, profile=None):
+        """
+        Args:
+            label (str): 보고서에 표시할 이름
+            factory (callable): 실제 객체를 만드는 함수 (인자 없음)
+            profile (StartupProfile): 생성 시간 기록 대상 (기본값: 전역 프로파일)
+        """
+        object.__setattr__(self, '_label', label)
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_profile', profile or get_startup_profile())
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _resolve(self):
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    start = time.perf_counter()
+                    instance = self._factory()
+                    self._profile.record(self._label, 'init', time.perf_counter() - start)
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+
+    def is_loaded(self):
+        """객체 생성 여부"""
+        return self._instance is not None
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self):
+        state = 'loaded' if self.is_loaded() else 'pending'
+        return f"<LazyInstance {self._label} ({state})>"
+
+
+def lazy_instance(module, attr, *args, **kwargs):
+    """
+    모듈의 클래스/팩토리 함수를 첫 사용 시 호출하는 프록시 생성
+
+    Args:
+        module (str): 모듈 경로 (예: 'collectors.stock_collector')
+        attr (str): 클래스 또는 get_xxx 함수 이름
+        *args, **kwargs: 생성 인자 (다른 LazyInstance를 넘겨도 됨)
+
+    Returns:
+        LazyInstance
+    """
+    profile = get_startup_profile()
+
+    def factory():
+        return getattr(profile.import_module(module), attr)(*args, **kwargs)
+
+    return LazyInstance(attr, factory, profile)
+
+
+def resolve(obj):
+    """LazyInstance이면 실제 객체 생성 후 반환 (그 외에는 그대로)"""
+    if isinstance(obj, LazyInstance):
+        return obj._resolve()
+    return obj
+
+
+def warm_up(*objects):
+    """
+    백그라운드 스레드에서 지연 객체 미리 생성 (첫 요청 지연 방지)
+
+    Returns:
+        threading.Thread
+    """
+    def run():
+        for obj in objects:
+            try:
+                resolve(obj)  # 생성 시간은 LazyInstance가 init으로 기록
+            except Exception as e:
+                print(f"⚠️ 사전 준비 실패 ({obj!r}): {e}")
+
+    thread = threading.Thread(target=run, name='warm-up', daemon=True)
+    thread.start()
+    return thread
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_startup_profile = None
+_startup_profile_lock = threading.Lock()
+
+
+def get_startup_profile():
+    """전역 시작 시간 프로파일 (처음 호출 시점이 시작 기준)"""
+    global _startup_profile
+    if _startup_profile is None:
+        with _startup_profile_lock:
+            if _startup_profile is None:
+                _startup_profile = StartupProfile()
+    return _startup_profile
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 요청 속도 제한 (Token Bucket)
+고정 time.sleep 대신, 호스트별 요청 예산이 소진됐을 때만 필요한 만큼 대기
+
+사용 예:
+    from utils.rate_limiter import rate_limit
+
+    rate_limit('search.naver.com')  # 예산이 있으면 즉시 반환
+    response = requests.get(...)
+"""
+
+import threading
+import time
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import RATE_LIMITS, DEFAULT_RATE_LIMIT
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 capacity개 버스트)"""
+
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            capacity (float): 한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본값: max(1, rate))
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """경과 시간만큼 토큰 충전"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        토큰 사용 (부족하면 충전될 때까지 대기)
+
+        대기 순서는 요청 순서를 따릅니다 (토큰을 먼저 예약하고 밖에서 대기).
+
+        Args:
+            tokens (float): 사용할 토큰 수
+            timeout (float): 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            bool: 토큰 확보 여부 (timeout 초과 예상 시 False, 토큰은 사용하지 않음)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = max(0.0, (tokens - self.tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                return False
+            self.tokens -= tokens
+
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 모음 (프로세스 공용)"""
+
+    def __init__(self, rates=None, default_rate=None):
+        """
+        Args:
+            rates (dict): {호스트: (초당 요청 수, 버스트)} (기본값: config.RATE_LIMITS)
+            default_rate (tuple): 설정에 없는 호스트의 (초당 요청 수, 버스트)
+        """
+        self.rates = dict(RATE_LIMITS if rates is None else rates)
+        self.default_rate = default_rate or DEFAULT_RATE_LIMIT
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host):
+        """호스트의 토큰 버킷 (처음 요청 시 생성)"""
+        with self._lock:
+            if host not in self._buckets:
+                rate, capacity = self.rates.get(host, self.default_rate)
+                self._buckets[host] = TokenBucket(rate, capacity)
+            return self._buckets[host]
+
+    def set_rate(self, host, rate, capacity=None):
+        """호스트 속도 변경 (이미 생성된 버킷은 교체)"""
+        with self._lock:
+            self.rates[host] = (rate, capacity)
+            self._buckets[host] = TokenBucket(rate, capacity)
+
+    def acquire(self, host, tokens=1, timeout=None):
+        """호스트 요청 1회 허가 (예산 소진 시 대기)"""
+        return self.bucket(host).acquire(tokens, timeout)
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """전역 속도 제한기 인스턴스"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def rate_limit(host, tokens=1, timeout=None):
+    """전역 속도 제한기로 호스트 요청 허가 받기"""
+    return get_rate_limiter().acquire(host, tokens, timeout)
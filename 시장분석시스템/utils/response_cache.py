@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+API 응답 캐시 (ETag + 장 시간 연동 TTL)
+같은 종목/기간 분석을 몇 분 안에 다시 요청하면 직렬화된 응답을 그대로 재사용
+
+- 캐시 키에 가격 이력 버전(바 저장소 meta['version'])을 포함해 새 봉이 들어오면 자동 무효화
+- 장중에는 짧은 TTL, 장 마감 후에는 다음 개장까지 유지
+- 응답 본문 해시를 ETag로 사용 (If-None-Match 일치 시 304)
+
+사용 예:
+    from utils.response_cache import get_response_cache, market_ttl
+
+    cache = get_response_cache()
+    entry = cache.get(key)
+    if entry is None:
+        entry = cache.put(key, body, market_ttl('KRX'))
+"""
+
+import hashlib
+import threading
+import time
+import sys
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone, time as dt_time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    BAR_STORE_TTL, RESPONSE_CACHE_TTL_OPEN, RESPONSE_CACHE_TTL_CRYPTO, RESPONSE_CACHE_MAX_ENTRIES
+)
+
+# 시장별 정규장 시간 (시간대, 개장, 마감) - 휴장일은 고려하지 않음
+MARKET_HOURS = {
+    'KRX': ('Asia/Seoul', timezone(timedelta(hours=9)), dt_time(9, 0), dt_time(15, 30)),
+    'US': ('America/New_York', timezone(timedelta(hours=-5)), dt_time(9, 30), dt_time(16, 0)),
+}
+
+
+def _market_timezone(market):
+    """시장 시간대 (tzdata가 없으면 고정 오프셋 - 미국은 서머타임 미반영)"""
+    name, fallback = MARKET_HOURS[market][:2]
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        return fallback
+
+
+def market_ttl(market, now=None):
+    """
+    시장 시간에 맞춘 응답 캐시 유효 시간
+
+    장중(및 마감 직후 가격 이력 캐시가 장중 봉일 수 있는 BAR_STORE_TTL 동안)은 짧은 TTL,
+    그 이후에는 다음 평일 개장 시각까지 유지합니다.
+
+    Args:
+        market (str): 'KRX', 'US' 또는 None (가상화폐 - 24시간 거래)
+        now (datetime): 기준 시각 (테스트용, 기본값: 현재)
+
+    Returns:
+        float: 유효 시간 (초)
+    """
+    if market not in MARKET_HOURS:
+        return RESPONSE_CACHE_TTL_CRYPTO
+
+    tz = _market_timezone(market)
+    open_time, close_time = MARKET_HOURS[market][2:]
+    local = (now or datetime.now(timezone.utc)).astimezone(tz)
+
+    session_open = datetime.combine(local.date(), open_time, tzinfo=tz)
+    settled = datetime.combine(local.date(), close_time, tzinfo=tz) + timedelta(seconds=BAR_STORE_TTL)
+    if local.weekday() < 5 and session_open <= local < settled:
+        return RESPONSE_CACHE_TTL_OPEN
+
+    # 다음 평일 개장 시각
+    next_day = local.date() if local < session_open else local.date() + timedelta(days=1)
+    while next_day.weekday() >= 5:
+        next_day += timedelta(days=1)
+    next_open = datetime.combine(next_day, open_time, tzinfo=tz)
+    return max(RESPONSE_CACHE_TTL_OPEN, (next_open - local).total_seconds())
+
+
+def build_entry(body, status=200, ttl=0):
+    """
+    캐시 항목 생성
+
+    Args:
+        body (bytes or str): 직렬화된 응답 본문
+        status (int): HTTP 상태 코드
+        ttl (float): 유효 시간 (초)
+
+    Returns:
+        dict: body, etag, status, created_at, expires_at
+    """
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    now = time.time()
+    return {
+        'body': body,
+        'etag': hashlib.sha1(body).hexdigest(),
+        'status': status,
+        'created_at': now,
+        'expires_at': now + ttl
+    }
+
+
+class ResponseCache:
+    """직렬화된 응답 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries=None):
+        """
+        Args:
+            max_entries (int): 최대 보관 응답 수 (기본값: config.RESPONSE_CACHE_MAX_ENTRIES)
+        """
+        self.max_entries = max_entries or RESPONSE_CACHE_MAX_ENTRIES
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """유효한 캐시 항목 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['expires_at'] <= time.time():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, body, ttl, status=200):
+        """응답 저장 (가장 오래 안 쓴 항목부터 제거)"""
+        entry = build_entry(body, status, ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, match=None):
+        """
+        캐시 삭제
+
+        Args:
+            match (callable): 키를 받아 삭제 여부를 반환 (None이면 전체 삭제)
+        """
+        with self._lock:
+            if match is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if match(key)]:
+                del self._entries[key]
+
+    def stats(self):
+        """캐시 상태"""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# 전역 인스턴스 (프로세스 내 공유)
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """전역 응답 캐시 인스턴스"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
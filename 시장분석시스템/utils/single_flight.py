@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+동일 작업 중복 실행 방지 (Single Flight)
+같은 키의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 함께 받음
+
+사용 예:
+    from utils.single_flight import SingleFlight, single_flight
+
+    flight = SingleFlight()
+    result = flight.do(('005930', '3mo'), collector.get_stock_data, '005930', period='3mo')
+
+    class StockCollector:
+        @single_flight
+        def get_stock_data(self, ticker, period='1y'):  # 같은 인자 동시 호출은 한 번만 조회
+            ...
+"""
+
+import functools
+import inspect
+import threading
+
+
+class _Call:
+    """실행 중인 작업 1건 (결과/예외를 대기자와 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.shared = 0  # 결과를 함께 받는 대기자 수
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 작업만 실행"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        키의 작업 실행 (이미 실행 중이면 끝날 때까지 대기 후 같은 결과 반환)
+
+        Args:
+            key: 작업 식별 키 (hashable)
+            fn (callable): 실행할 함수
+
+        Returns:
+            fn의 반환값 (실행 중 예외는 대기자에게도 그대로 전달)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # 완료된 키는 바로 제거 (이후 요청은 새로 실행)
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self):
+        """실행 중인 키 목록"""
+        with self._lock:
+            return list(self._calls)
+
+
+# 수집기 메서드 공용 인스턴스 (프로세스 내 공유)
+_collector_flight = SingleFlight()
+
+
+def single_flight(method):
+    """
+    수집기 메서드 데코레이터 - 같은 인자의 동시 호출을 하나의 조회로 합침
+
+    키는 (메서드 이름, 기본값을 채운 인자)이며 self는 제외해 수집기 인스턴스가 달라도
+    같은 조회를 공유합니다. 반환값에 copy()가 있으면 호출자마다 복사본을 돌려줘
+    한 호출자의 수정이 다른 호출자에게 보이지 않게 합니다.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__qualname__,) + tuple(bound.arguments.items())[1:]
+        try:
+            hash(key)
+        except TypeError:
+            return method(*args, **kwargs)  # 해시 불가 인자는 합치지 않음
+
+        result = _collector_flight.do(key, method, *args, **kwargs)
+        return result.copy() if hasattr(result, 'copy') else result
+
+    return wrapper
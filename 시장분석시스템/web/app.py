@@ -11,63 +11,79 @@ import os
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+# 상위 디렉토리 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 시작 시간 측정 (무거운 모듈은 처음 사용할 때 임포트)
+from utils.lazy_loader import get_startup_profile, lazy_instance, warm_up
+startup = get_startup_profile()
+
+with startup.measure('flask'):
+    from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
 import json
-from datetime import datetime
 import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
-# 상위 디렉토리 경로 추가
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ANALYZE_CONCURRENCY, COMPARE_MAX_WORKERS, ANALYZE_TIMEOUTS, WATCHLIST_MAX_TICKERS
 
-# 유틸리티 임포트 (근본 문제 해결 시스템)
-from utils.data_normalizer import normalize_dataframe, validate_dataframe
+# 유틸리티 임포트 (근본 문제 해결 시스템 - pandas를 쓰는 data_normalizer는 분석 시 임포트)
 from utils.logger import log_error, log_warning, log_info, log_dataframe_error
-
-from collectors.stock_collector import StockCollector
-from collectors.crypto_collector import CryptoCollector
-from collectors.commodity_collector import CommodityCollector
-from collectors.naver_news_collector import NaverNewsCollector
-from collectors.google_news_collector import GoogleNewsCollector
-from collectors.krx_stock_list import get_krx_list
-from collectors.multi_source_collector import MultiSourceCollector
-from collectors.economic_event_collector import EconomicEventCollector
-from analyzers.technical_analyzer import TechnicalAnalyzer
-from analyzers.sentiment_analyzer import SentimentAnalyzer
-from analyzers.confidence_calculator import ConfidenceCalculator
-from analyzers.comprehensive_analyzer import ComprehensiveAnalyzer
-from analyzers.pattern_analyzer import PatternAnalyzer  # Phase 3-1: 패턴 분석기 추가
-from analyzers.bollinger_rsi_analyzer import BollingerRSIAnalyzer  # Phase 3-2: 볼린저 밴드 & RSI 분석기 추가
-from analyzers.ma_cross_analyzer import MovingAverageCrossAnalyzer  # Phase 3-3: 이동평균선 크로스 분석기 추가
-from analyzers.volume_analyzer import VolumeAnalyzer  # Phase 3-4: 거래량 분석기 추가
-from reports.report_generator import ReportGenerator
-from reports.pdf_generator import PDFReportGenerator
-from reports.premium_pdf_generator import PremiumPDFGenerator  # Phase 3: 프리미엄 PDF 추가
-from reports.share_generator import ShareTextGenerator  # Phase 3: 공유하기 기능 추가
-from auto_recommender import AutoRecommender
+from utils.response_cache import get_response_cache, build_entry, market_ttl
+from utils.single_flight import SingleFlight
 
 app = Flask(__name__,
             template_folder='../templates',
             static_folder='../static')
 
-# 전역 변수
-stock_collector = StockCollector()
-multi_collector = MultiSourceCollector()  # 다중 소스 수집기 추가
-crypto_collector = CryptoCollector()
-commodity_collector = CommodityCollector()  # 원자재 수집기 추가
-news_collector = NaverNewsCollector()
-google_news_collector = GoogleNewsCollector()  # Phase 2-2: Google News 추가
-sentiment_analyzer = SentimentAnalyzer()
-krx_list = get_krx_list()  # 전체 KRX 종목 리스트
-pdf_generator = PDFReportGenerator()  # PDF 생성기
-premium_pdf_generator = PremiumPDFGenerator()  # 프리미엄 PDF 생성기 (Phase 3)
-share_text_generator = ShareTextGenerator()  # 공유 텍스트 생성기 (Phase 3)
-hot_stock_recommender = AutoRecommender()  # 핫 종목 추천 엔진
-event_collector = EconomicEventCollector()  # 경제 이벤트 수집기 (Phase 2-3)
-
-# 24시간 모니터링 상태
-monitoring_active = False
-monitoring_thread = None
-monitored_tickers = []
+# 전역 변수 (수집기/생성기는 처음 사용할 때 임포트 + 생성)
+stock_collector = lazy_instance('collectors.stock_collector', 'StockCollector')
+multi_collector = lazy_instance('collectors.multi_source_collector', 'MultiSourceCollector')  # 다중 소스 수집기 추가
+crypto_collector = lazy_instance('collectors.crypto_collector', 'CryptoCollector')
+commodity_collector = lazy_instance('collectors.commodity_collector', 'CommodityCollector')  # 원자재 수집기 추가
+news_collector = lazy_instance('collectors.naver_news_collector', 'NaverNewsCollector')
+google_news_collector = lazy_instance('collectors.google_news_collector', 'GoogleNewsCollector')  # Phase 2-2: Google News 추가
+sentiment_analyzer = lazy_instance('analyzers.sentiment_analyzer', 'SentimentAnalyzer')
+ticker_search = lazy_instance('collectors.search_index', 'get_ticker_search')  # 종목 검색 인덱스 (KRX + 미국 + 가상화폐)
+pdf_generator = lazy_instance('reports.pdf_generator', 'PDFReportGenerator')  # PDF 생성기
+premium_pdf_generator = lazy_instance('reports.premium_pdf_generator', 'PremiumPDFGenerator')  # 프리미엄 PDF 생성기 (Phase 3)
+share_text_generator = lazy_instance('reports.share_generator', 'ShareTextGenerator')  # 공유 텍스트 생성기 (Phase 3)
+analysis_pool = lazy_instance('analyzers.parallel_analysis', 'get_analysis_pool')  # CPU 분석 전용 프로세스 풀 (첫 작업 시 시작)
+hot_stock_recommender = lazy_instance('auto_recommender', 'AutoRecommender', analysis_pool=analysis_pool)  # 핫 종목 추천 엔진
+event_collector = lazy_instance('collectors.economic_event_collector', 'EconomicEventCollector')  # 경제 이벤트 수집기 (Phase 2-3)
+ANALYZE_FETCHES = {'price': 1, 'info': 1, 'news': 2, 'fx': 1}  # /api/analyze 요청당 소스별 조회 수
+fetch_executors = {  # /api/analyze 외부 조회 (소스별 풀 - 시간 초과 후 남은 조회가 다른 소스 자리를 차지하지 않음)
+    source: ThreadPoolExecutor(max_workers=count * ANALYZE_CONCURRENCY * 2,  # 시간 초과 후 실행 중인 조회 여유분 포함
+                               thread_name_prefix=f'fetch-{source}')
+    for source, count in ANALYZE_FETCHES.items()
+}
+compare_executor = ThreadPoolExecutor(max_workers=COMPARE_MAX_WORKERS, thread_name_prefix='compare')  # /api/compare 전용 (분석 조회가 대기열에 밀리지 않게)
+response_cache = get_response_cache()  # 분석 응답 캐시 (ETag + 장 시간 TTL)
+analyze_flight = SingleFlight()  # 동일 분석 요청 중복 실행 방지
+
+monitoring_scheduler = lazy_instance('monitoring_scheduler', 'MonitoringScheduler', stock_collector)  # 24시간 모니터링 (우선순위 큐 스케줄러)
+
+startup.mark_ready()
+startup.print_report()
+
+# 첫 요청이 들어오면 검색 인덱스와 분석 수집기를 백그라운드에서 미리 준비
+# (모듈 임포트 시점에 스레드를 만들면 gunicorn --preload fork 후 잠금이 남을 수 있음)
+_warm_up_started = False
+_warm_up_lock = threading.Lock()
+
+
+@app.before_request
+def _start_warm_up():
+    global _warm_up_started
+    if _warm_up_started:
+        return
+    with _warm_up_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+    warm_up(ticker_search, stock_collector, multi_collector, crypto_collector,
+            news_collector, google_news_collector, sentiment_analyzer)
 
 
 @app.route('/')
@@ -82,202 +98,365 @@ def manifest():
     return send_from_directory(os.path.join(app.root_path, '..', 'templates'), 'manifest.json')
 
 
+@app.route('/api/startup-report', methods=['GET'])
+def startup_report():
+    """시작 시간 보고서 (모듈 임포트/객체 생성 단계별 소요 시간)"""
+    return jsonify(startup.report())
 
-@app.route('/api/analyze', methods=['POST'])
-def analyze():
-    """종목 분석 API"""
-    try:
-        data = request.json
-        ticker = data.get('ticker', '').strip()
-        asset_type = data.get('type', 'stock')  # stock or crypto
-        period = data.get('period', '3mo')
-
-        if not ticker:
-            return jsonify({'error': '종목 코드를 입력하세요'}), 400
-
-        # 데이터 수집
-        if asset_type == 'crypto':
-            # 한글 암호화폐 이름 매핑
-            crypto_kr_mapping = {
-                '비트코인': 'bitcoin',
-                '이더리움': 'ethereum',
-                '이더': 'ethereum',
-                '리플': 'ripple',
-                '에이다': 'cardano',
-                '카르다노': 'cardano',
-                '솔라나': 'solana',
-                '오덜리': 'orderly-network',
-                '오더리': 'orderly-network',
-                'orderly': 'orderly-network',
-                'order': 'orderly-network',
-                '바이낸스': 'binancecoin',
-                '도지': 'dogecoin',
-                '도지코인': 'dogecoin',
-                '폴카닷': 'polkadot',
-                '체인링크': 'chainlink',
-                '아발란체': 'avalanche-2',
-            }
 
-            # 한글 입력 시 자동 변환
-            ticker_lower = ticker.lower()
-            if ticker in crypto_kr_mapping:
-                ticker = crypto_kr_mapping[ticker]
-                print(f"🔄 한글 코인명 변환: {data.get('ticker')} → {ticker}")
-            elif ticker_lower in crypto_kr_mapping:
-                ticker = crypto_kr_mapping[ticker_lower]
-                print(f"🔄 한글 코인명 변환: {data.get('ticker')} → {ticker}")
-
-            price_data = crypto_collector.get_crypto_data(ticker, days=90)
-            coin_info = crypto_collector.get_coin_info(ticker)
-            name = coin_info.get('코인명', ticker) if coin_info else ticker
-            error_msg = None
-        else:
-            # 한국 주식 확인
-            is_korean = ticker.endswith('.KS') or ticker.endswith('.KQ') or (ticker.replace('.', '').isdigit() and len(ticker.replace('.', '')) == 6)
-
-            if is_korean:
-                # 한국 주식 - 기존 방식
-                price_data = stock_collector.get_stock_data(ticker, period=period)
-                company_info = stock_collector.get_company_info(ticker)
-                name = company_info.get('종목명', ticker) if company_info else ticker
-                error_msg = None
-            else:
-                # 미국 주식 - 다중 소스 전략 사용
-                price_data, error_msg = multi_collector.get_stock_data(ticker, period=period)
 
-                # 기업 정보는 기존 방식 시도
-                try:
-                    company_info = stock_collector.get_company_info(ticker)
-                    name = company_info.get('종목명', ticker) if company_info else ticker
-                except:
-                    name = ticker
-
-        # 에러 처리
-        if price_data is None or (hasattr(price_data, 'empty') and price_data.empty):
-            log_error(f"데이터 수집 실패: {ticker} ({asset_type})")
-            if error_msg:
-                log_dataframe_error(price_data, f"Empty data for {ticker}")
-            if error_msg:
-                return jsonify({'error': error_msg}), 404
-            else:
-                return jsonify({'error': '데이터를 가져올 수 없습니다.\n\n종목코드를 확인하세요:\n- 미국 주식: AAPL, MSFT, INTC\n- 한국 주식: 005930.KS, 035720.KQ'}), 404
-
-        # ✨ 컬럼명 자동 정규화 (통합 시스템)
-        log_info(f"데이터 정규화 시작: {ticker}")
-        price_data = normalize_dataframe(price_data)
-
-        # 검증
-        is_valid, missing = validate_dataframe(price_data)
-        if not is_valid:
-            log_warning(f"데이터 검증 실패: {ticker}, 누락 컬럼: {missing}")
-            return jsonify({'error': f'데이터 형식 오류: 누락된 컬럼 {missing}'}), 500
-
-        # 기술적 분석
-        tech_analyzer = TechnicalAnalyzer(price_data)
-        technical_result = tech_analyzer.analyze_all()
-
-        # Phase 3-1: 고급 패턴 분석
-        pattern_analyzer = PatternAnalyzer()
-        pattern_result = pattern_analyzer.analyze_patterns(price_data)
-
-        # Phase 3-2: 볼린저 밴드 & RSI 전략 분석
-        bb_rsi_analyzer = BollingerRSIAnalyzer()
-        bb_rsi_result = bb_rsi_analyzer.analyze(price_data)
-
-        # Phase 3-3: 이동평균선 크로스 전략 분석
-        ma_cross_analyzer = MovingAverageCrossAnalyzer()
-        ma_cross_result = ma_cross_analyzer.analyze(price_data)
-
-        # Phase 3-4: 거래량 분석
-        volume_analyzer = VolumeAnalyzer()
-        volume_result = volume_analyzer.analyze(price_data)
-
-        # 뉴스 수집 및 감성 분석 (Phase 2-2: 다중 소스)
-        naver_news = news_collector.get_news(name, max_count=10)
-        google_news = google_news_collector.get_news(name, max_count=10, language='ko')
-        news_list = naver_news + google_news  # 통합
-        sentiment_result = sentiment_analyzer.analyze_news_list(news_list)
-
-        # 신뢰도 계산
-        calculator = ConfidenceCalculator()
-        confidence = calculator.calculate_confidence(technical_result, sentiment_result)
-
-        # 종합 의견 생성
-        comprehensive_analyzer = ComprehensiveAnalyzer()
-        comprehensive_data = {
-            'name': name,
-            'technical': technical_result,
-            'sentiment': sentiment_result,
-            'confidence': confidence
-        }
-        comprehensive_result = comprehensive_analyzer.generate_opinion(comprehensive_data)
+def _remaining(source, submitted):
+    """소스별 남은 대기 시간 (초) - 타임아웃은 기다리기 시작한 때가 아니라 조회를 제출한 때부터"""
+    return max(0, submitted + ANALYZE_TIMEOUTS[source] - time.monotonic())
 
-        # 현재가 (컬럼명 표준화 후에는 항상 영문)
-        if 'Close' in price_data.columns:
-            current_price = price_data['Close'].iloc[-1]
-            close_col = 'Close'
-            volume_col = 'Volume'
-        else:
-            # fallback: 만약 표준화가 실패한 경우
-            current_price = price_data.iloc[-1, 3]  # 4번째 컬럼 (보통 종가)
-            close_col = price_data.columns[3]
-            volume_col = price_data.columns[4] if len(price_data.columns) > 4 else price_data.columns[3]
 
-        # 환율 정보 추가 (외국 주식 및 가상화폐인 경우)
-        exchange_rate = None
-        price_krw = None
-        currency = 'KRW'
+def _await_fetch(future, source, submitted, default=None):
+    """
+    동시 조회 결과 대기 (소스별 타임아웃, 제출 시점 기준)
 
-        if asset_type == 'crypto' or (not is_korean and asset_type == 'stock'):
-            try:
-                import yfinance as yf
-                # USD/KRW 환율 가져오기
-                usd_krw = yf.Ticker('KRW=X')
-                rate_data = usd_krw.history(period='1d')
-                if not rate_data.empty:
-                    exchange_rate = float(rate_data['Close'].iloc[-1])
-                    price_krw = float(current_price) * exchange_rate
-                    currency = 'USD'
-            except Exception as e:
-                print(f"⚠️ 환율 조회 실패: {e}")
-                # 환율 조회 실패 시 고정 환율 사용
-                exchange_rate = 1330.0
-                price_krw = float(current_price) * exchange_rate
-                currency = 'USD'
+    여러 소스를 차례로 기다려도 대기 시간이 더해지지 않고 가장 긴 타임아웃을 넘지 않습니다.
+    시간 초과 시 작업을 취소합니다 (아직 시작 전이면 스레드를 차지하지 않음).
 
-        # 결과 반환
-        result = {
-            'ticker': ticker,
-            'name': name,
-            'current_price': float(current_price),
-            'currency': currency,
-            'exchange_rate': exchange_rate,
-            'price_krw': price_krw,
-            'confidence': confidence,
-            'technical': {
-                'rsi': technical_result.get('rsi'),
-                'macd': technical_result.get('macd'),
-                'trend': technical_result.get('trend'),
-                'signals': technical_result.get('signals', [])
-            },
-            'sentiment': sentiment_result,
-            'patterns': pattern_result,  # Phase 3-1: 패턴 분석 결과 추가
-            'bollinger_rsi': bb_rsi_result,  # Phase 3-2: 볼린저 밴드 & RSI 분석 결과 추가
-            'ma_cross': ma_cross_result,  # Phase 3-3: 이동평균선 크로스 분석 결과 추가
-            'volume': volume_result,  # Phase 3-4: 거래량 분석 결과 추가
-            'comprehensive_opinion': comprehensive_result.get('comprehensive_opinion'),
-            'news': news_list[:10],  # 상위 10개 뉴스만
-            'chart_data': {
-                'dates': price_data.index.strftime('%Y-%m-%d').tolist(),
-                'prices': price_data[close_col].tolist(),
-                'volumes': price_data[volume_col].tolist()
-            }
-        }
+    Args:
+        future: fetch_executors/compare_executor에 제출한 작업
+        source (str): ANALYZE_TIMEOUTS 키 (price, info, news, fx)
+        submitted (float): 조회 제출 시각 (time.monotonic())
+        default: 타임아웃/실패 시 반환값
 
-        return jsonify(result)
+    Returns:
+        조회 결과 또는 default
+    """
+    if future is None:
+        return default
 
+    try:
+        return future.result(timeout=_remaining(source, submitted))
+    except FutureTimeoutError:
+        future.cancel()
+        log_warning(f"{source} 조회 시간 초과 ({ANALYZE_TIMEOUTS[source]}초)")
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        log_warning(f"{source} 조회 실패: {e}")
+    return default
+
+
+def _news_query(ticker, asset_type, is_korean):
+    """
+    뉴스 검색어 (네트워크 조회 없이 알 수 있는 종목명, 없으면 티커)
+
+    기업 정보 조회를 기다리지 않고 가격/정보와 함께 뉴스 조회를 시작하기 위해 사용합니다.
+    """
+    from collectors.search_index import US_STOCKS, CRYPTOS
+
+    if asset_type == 'crypto':
+        return next((crypto['name'] for crypto in CRYPTOS if crypto['id'] == ticker), ticker)
+
+    if is_korean:
+        from collectors.krx_stock_list import get_krx_list
+        stock = get_krx_list().get_by_code(ticker)  # 메모리 목록 (스냅샷/기본 종목)
+        return stock['name'] if stock else ticker
+
+    cached = stock_collector.info_cache.get(ticker)  # 기업 정보 디스크 캐시
+    if cached and cached.get('종목명'):
+        return cached['종목명']
+    return next((stock['name'] for stock in US_STOCKS if stock['code'] == ticker.upper()), ticker)
+
+
+def _fetch_usd_krw():
+    """USD/KRW 환율 조회 (데이터 없으면 None)"""
+    import yfinance as yf
+    rate_data = yf.Ticker('KRW=X').history(period='1d')
+    if rate_data.empty:
+        return None
+    return float(rate_data['Close'].iloc[-1])
+
+
+# 한글 암호화폐 이름 매핑
+CRYPTO_KR_MAPPING = {
+    '비트코인': 'bitcoin',
+    '이더리움': 'ethereum',
+    '이더': 'ethereum',
+    '리플': 'ripple',
+    '에이다': 'cardano',
+    '카르다노': 'cardano',
+    '솔라나': 'solana',
+    '오덜리': 'orderly-network',
+    '오더리': 'orderly-network',
+    'orderly': 'orderly-network',
+    'order': 'orderly-network',
+    '바이낸스': 'binancecoin',
+    '도지': 'dogecoin',
+    '도지코인': 'dogecoin',
+    '폴카닷': 'polkadot',
+    '체인링크': 'chainlink',
+    '아발란체': 'avalanche-2',
+}
+
+
+def _resolve_crypto_id(ticker):
+    """한글 코인명 → CoinGecko ID (매핑에 없으면 그대로)"""
+    coin_id = CRYPTO_KR_MAPPING.get(ticker) or CRYPTO_KR_MAPPING.get(ticker.lower())
+    if coin_id:
+        print(f"🔄 한글 코인명 변환: {ticker} → {coin_id}")
+        return coin_id
+    return ticker
+
+
+def _is_korean_ticker(ticker):
+    """한국 주식 여부 (.KS/.KQ 또는 6자리 숫자)"""
+    return ticker.endswith('.KS') or ticker.endswith('.KQ') or (ticker.replace('.', '').isdigit() and len(ticker.replace('.', '')) == 6)
+
+
+def _data_version(ticker, asset_type, is_korean):
+    """
+    분석에 쓰이는 가격 이력 버전 (바 저장소 meta['version'], 이력이 없으면 None)
+
+    새 봉이 저장될 때마다 버전이 바뀌므로 응답 캐시 키에 포함해 자동 무효화합니다.
+    """
+    if asset_type == 'crypto':
+        store_key = f"crypto_{ticker}_usd"
+    elif is_korean:
+        store_key = ticker.replace('.KS', '').replace('.KQ', '')
+    else:
+        store_key = ticker
+
+    meta = stock_collector.bar_store.load_meta(store_key)
+    return meta.get('version') if meta else None
+
+
+@app.route('/api/analyze', methods=['POST'])
+def analyze():
+    """종목 분석 API (응답 캐시 + ETag)"""
+    data = request.json or {}
+    ticker = data.get('ticker', '').strip()
+    asset_type = data.get('type', 'stock')  # stock or crypto
+    period = data.get('period', '3mo')
+
+    if not ticker:
+        return jsonify({'error': '종목 코드를 입력하세요'}), 400
+
+    if asset_type == 'crypto':
+        ticker = _resolve_crypto_id(ticker)
+    is_korean = asset_type != 'crypto' and _is_korean_ticker(ticker)
+
+    # 같은 가격 이력 버전의 응답이 남아 있으면 재사용, 없으면 동일 요청끼리 한 번만 계산
+    request_key = (ticker, asset_type, period)
+    entry = response_cache.get(request_key + (_data_version(ticker, asset_type, is_korean),))
+    cache_status = 'HIT'
+    if entry is None:
+        entry = analyze_flight.do(request_key, _cache_analysis, ticker, asset_type, period, is_korean)
+        cache_status = 'MISS'
+
+    if entry['status'] == 200 and entry['etag'] in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(entry['body'], status=entry['status'], mimetype='application/json')
+
+    if entry['status'] == 200:
+        response.set_etag(entry['etag'])
+        response.headers['Cache-Control'] = 'private, no-cache'  # 매번 ETag로 재검증
+        response.headers['X-Cache'] = cache_status
+    return response
+
+
+def _cache_analysis(ticker, asset_type, period, is_korean):
+    """분석 실행 후 응답 직렬화 (성공한 응답만 캐시)"""
+    try:
+        result, status = _analyze(ticker, asset_type, period, is_korean)
+    except Exception as e:
+        result, status = {'error': str(e)}, 500
+
+    body = app.json.dumps(result)
+    if status != 200:
+        return build_entry(body, status)
+
+    # 분석 중 가격 이력이 갱신됐을 수 있으므로 계산 후 버전으로 저장
+    version = _data_version(ticker, asset_type, is_korean)
+    market = None if asset_type == 'crypto' else ('KRX' if is_korean else 'US')
+    return response_cache.put((ticker, asset_type, period, version), body, market_ttl(market))
+
+
+def _analyze(ticker, asset_type, period, is_korean):
+    """
+    종목 분석 파이프라인
+
+    Returns:
+        tuple: (결과 dict, HTTP 상태 코드)
+    """
+    # 데이터 수집 (가격/정보/뉴스/환율을 동시에 조회, 타임아웃은 모두 지금부터)
+    submitted = time.monotonic()
+    if asset_type == 'crypto':
+        price_future = fetch_executors['price'].submit(crypto_collector.get_crypto_data, ticker, days=90)
+        info_future = fetch_executors['info'].submit(crypto_collector.get_coin_info, ticker)
+        name_key = '코인명'
+    else:
+        if is_korean:
+            # 한국 주식 - 기존 방식
+            price_future = fetch_executors['price'].submit(stock_collector.get_stock_data, ticker, period=period)
+        else:
+            # 미국 주식 - 다중 소스 전략 사용 (결과: (데이터, 에러 메시지))
+            price_future = fetch_executors['price'].submit(multi_collector.get_stock_data, ticker, period=period)
+
+        # 기업 정보
+        info_future = fetch_executors['info'].submit(stock_collector.get_company_info, ticker)
+        name_key = '종목명'
+
+    # 환율 (외국 주식 및 가상화폐인 경우)
+    needs_fx = asset_type == 'crypto' or (not is_korean and asset_type == 'stock')
+    fx_future = fetch_executors['fx'].submit(_fetch_usd_krw) if needs_fx else None
+
+    # 뉴스도 바로 조회 시작 (Phase 2-2: 다중 소스) - 기업 정보를 기다리지 않도록 로컬에서 아는 이름 사용
+    news_query = _news_query(ticker, asset_type, is_korean)
+    naver_future = fetch_executors['news'].submit(news_collector.get_news, news_query, max_count=10)
+    google_future = fetch_executors['news'].submit(google_news_collector.get_news, news_query, max_count=10, language='ko')
+
+    # 가격 데이터가 도착하면 정보/뉴스를 기다리지 않고 분석 시작
+    price_result = _await_fetch(price_future, 'price', submitted)
+    if asset_type != 'crypto' and not is_korean:
+        price_data, error_msg = price_result if price_result else (None, None)
+    else:
+        price_data, error_msg = price_result, None
+
+    # 에러 처리
+    if price_data is None or (hasattr(price_data, 'empty') and price_data.empty):
+        log_error(f"데이터 수집 실패: {ticker} ({asset_type})")
+        for future in (info_future, naver_future, google_future, fx_future):
+            if future is not None:
+                future.cancel()  # 더 이상 필요 없는 조회
+        if error_msg:
+            log_dataframe_error(price_data, f"Empty data for {ticker}")
+        if error_msg:
+            return {'error': error_msg}, 404
+        else:
+            return {'error': '데이터를 가져올 수 없습니다.\n\n종목코드를 확인하세요:\n- 미국 주식: AAPL, MSFT, INTC\n- 한국 주식: 005930.KS, 035720.KQ'}, 404
+
+    from utils.data_normalizer import normalize_dataframe, validate_dataframe
+    from analyzers.indicator_frame import IndicatorFrame  # 공용 지표 엔진
+    from analyzers.technical_analyzer import TechnicalAnalyzer
+    from analyzers.pattern_analyzer import PatternAnalyzer  # Phase 3-1: 패턴 분석기
+    from analyzers.bollinger_rsi_analyzer import BollingerRSIAnalyzer  # Phase 3-2: 볼린저 밴드 & RSI 분석기
+    from analyzers.ma_cross_analyzer import MovingAverageCrossAnalyzer  # Phase 3-3: 이동평균선 크로스 분석기
+    from analyzers.volume_analyzer import VolumeAnalyzer  # Phase 3-4: 거래량 분석기
+    from analyzers.confidence_calculator import ConfidenceCalculator
+    from analyzers.comprehensive_analyzer import ComprehensiveAnalyzer
+
+    # ✨ 컬럼명 자동 정규화 (통합 시스템)
+    log_info(f"데이터 정규화 시작: {ticker}")
+    price_data = normalize_dataframe(price_data)
+
+    # 검증
+    is_valid, missing = validate_dataframe(price_data)
+    if not is_valid:
+        log_warning(f"데이터 검증 실패: {ticker}, 누락 컬럼: {missing}")
+        return {'error': f'데이터 형식 오류: 누락된 컬럼 {missing}'}, 500
+
+    # 공용 지표 엔진 (MA/RSI/볼린저/거래량 MA를 요청당 한 번만 계산)
+    indicators = IndicatorFrame(price_data)
+
+    # 기술적 분석
+    tech_analyzer = TechnicalAnalyzer(price_data, indicators)
+    technical_result = tech_analyzer.analyze_all()
+
+    # Phase 3-1: 고급 패턴 분석
+    pattern_analyzer = PatternAnalyzer()
+    pattern_result = pattern_analyzer.analyze_patterns(price_data)
+
+    # Phase 3-2: 볼린저 밴드 & RSI 전략 분석
+    bb_rsi_analyzer = BollingerRSIAnalyzer()
+    bb_rsi_result = bb_rsi_analyzer.analyze(price_data, indicators)
+
+    # Phase 3-3: 이동평균선 크로스 전략 분석
+    ma_cross_analyzer = MovingAverageCrossAnalyzer()
+    ma_cross_result = ma_cross_analyzer.analyze(price_data, indicators)
+
+    # Phase 3-4: 거래량 분석
+    volume_analyzer = VolumeAnalyzer()
+    volume_result = volume_analyzer.analyze(price_data, indicators)
+
+    # 종목명 (기업 정보 조회 결과, 실패 시 티커)
+    info = _await_fetch(info_future, 'info', submitted)
+    name = info.get(name_key, ticker) if info else ticker
+
+    # 뉴스 수집 및 감성 분석 (Phase 2-2: 다중 소스)
+    naver_news = _await_fetch(naver_future, 'news', submitted, default=[]) or []
+    google_news = _await_fetch(google_future, 'news', submitted, default=[]) or []
+    news_list = naver_news + google_news  # 통합
+    sentiment_result = sentiment_analyzer.analyze_news_list(news_list)
+
+    # 신뢰도 계산
+    calculator = ConfidenceCalculator()
+    confidence = calculator.calculate_confidence(technical_result, sentiment_result)
+
+    # 종합 의견 생성
+    comprehensive_analyzer = ComprehensiveAnalyzer()
+    comprehensive_data = {
+        'name': name,
+        'technical': technical_result,
+        'sentiment': sentiment_result,
+        'confidence': confidence
+    }
+    comprehensive_result = comprehensive_analyzer.generate_opinion(comprehensive_data)
+
+    # 현재가 (컬럼명 표준화 후에는 항상 영문)
+    if 'Close' in price_data.columns:
+        current_price = price_data['Close'].iloc[-1]
+        close_col = 'Close'
+        volume_col = 'Volume'
+    else:
+        # fallback: 만약 표준화가 실패한 경우
+        current_price = price_data.iloc[-1, 3]  # 4번째 컬럼 (보통 종가)
+        close_col = price_data.columns[3]
+        volume_col = price_data.columns[4] if len(price_data.columns) > 4 else price_data.columns[3]
+
+    # 환율 정보 추가 (외국 주식 및 가상화폐인 경우)
+    exchange_rate = None
+    price_krw = None
+    currency = 'KRW'
+
+    if needs_fx:
+        try:
+            # USD/KRW 환율 (동시 조회 결과)
+            exchange_rate = fx_future.result(timeout=_remaining('fx', submitted))
+            if exchange_rate is not None:
+                price_krw = float(current_price) * exchange_rate
+                currency = 'USD'
+        except Exception as e:
+            fx_future.cancel()
+            print(f"⚠️ 환율 조회 실패: {e or '시간 초과'}")
+            # 환율 조회 실패 시 고정 환율 사용
+            exchange_rate = 1330.0
+            price_krw = float(current_price) * exchange_rate
+            currency = 'USD'
+
+    # 결과 반환
+    result = {
+        'ticker': ticker,
+        'name': name,
+        'current_price': float(current_price),
+        'currency': currency,
+        'exchange_rate': exchange_rate,
+        'price_krw': price_krw,
+        'confidence': confidence,
+        'technical': {
+            'rsi': technical_result.get('rsi'),
+            'macd': technical_result.get('macd'),
+            'trend': technical_result.get('trend'),
+            'signals': technical_result.get('signals', [])
+        },
+        'sentiment': sentiment_result,
+        'patterns': pattern_result,  # Phase 3-1: 패턴 분석 결과 추가
+        'bollinger_rsi': bb_rsi_result,  # Phase 3-2: 볼린저 밴드 & RSI 분석 결과 추가
+        'ma_cross': ma_cross_result,  # Phase 3-3: 이동평균선 크로스 분석 결과 추가
+        'volume': volume_result,  # Phase 3-4: 거래량 분석 결과 추가
+        'comprehensive_opinion': comprehensive_result.get('comprehensive_opinion'),
+        'news': news_list[:10],  # 상위 10개 뉴스만
+        'chart_data': {
+            'dates': price_data.index.strftime('%Y-%m-%d').tolist(),
+            'prices': price_data[close_col].tolist(),
+            'volumes': price_data[volume_col].tolist()
+        }
+    }
+
+    return result, 200
 
 
 @app.route('/api/compare', methods=['POST'])
@@ -290,40 +469,57 @@ def compare():
         if not tickers or len(tickers) < 2:
             return jsonify({'error': '최소 2개 이상의 종목을 입력하세요'}), 400
 
-        results = []
+        tickers = tickers[:10]  # 최대 10개
 
-        for ticker in tickers[:10]:  # 최대 10개
+        # 1단계: 종목별 가격/뉴스 동시 조회 (I/O, 전용 풀 - /api/analyze 조회와 스레드를 나누지 않음)
+        submitted = time.monotonic()
+        fetches = [
+            (
+                ticker,
+                compare_executor.submit(stock_collector.get_stock_data, ticker, period='3mo'),
+                compare_executor.submit(news_collector.get_news, ticker, max_count=10)
+            )
+            for ticker in tickers
+        ]
+
+        # 2단계: 가격 배열을 분석 프로세스 풀로 전달 (CPU)
+        analyses = []
+        for ticker, price_future, news_future in fetches:
             try:
-                price_data = stock_collector.get_stock_data(ticker, period='3mo')
+                price_data = _await_fetch(price_future, 'price', submitted)
                 if price_data is None:
+                    news_future.cancel()
                     continue
 
-                tech_analyzer = TechnicalAnalyzer(price_data)
-                technical_result = tech_analyzer.analyze_all()
-
-                news_list = news_collector.get_news(ticker, max_count=10)
+                news_list = _await_fetch(news_future, 'news', submitted, default=[])
                 sentiment_result = sentiment_analyzer.analyze_news_list(news_list)
 
-                calculator = ConfidenceCalculator()
-                confidence = calculator.calculate_confidence(technical_result, sentiment_result)
+                analyses.append((ticker, sentiment_result, analysis_pool.submit(price_data, sentiment_result)))
 
-                # 컬럼명 호환성 처리
-                if '종가' in price_data.columns:
-                    current_price = float(price_data['종가'].iloc[-1])
-                elif 'Close' in price_data.columns:
-                    current_price = float(price_data['Close'].iloc[-1])
-                else:
-                    current_price = float(price_data.iloc[-1, 3])
+            except Exception as e:
+                print(f"⚠️ {ticker} 분석 실패: {str(e)}")
+                continue
+
+        # 3단계: 입력 순서대로 결과 수집 (종목별 최대 config.ANALYSIS_TIMEOUT초, 초과 시 작업 취소)
+        from analyzers.parallel_analysis import wait_result
+        results = []
+        for ticker, sentiment_result, analysis_future in analyses:
+            try:
+                analysis = wait_result(analysis_future)
+                confidence = analysis['confidence']
 
                 results.append({
                     'ticker': ticker,
-                    'current_price': current_price,
+                    'current_price': analysis['current_price'],
                     'confidence_score': confidence['score'],
                     'signal': confidence['signal'],
-                    'rsi': technical_result.get('rsi'),
+                    'rsi': analysis['technical'].get('rsi'),
                     'sentiment': sentiment_result.get('overall_sentiment')
                 })
 
+            except FutureTimeoutError:
+                print(f"⚠️ {ticker} 분석 시간 초과")
+                continue
             except Exception as e:
                 print(f"⚠️ {ticker} 분석 실패: {str(e)}")
                 continue
@@ -348,12 +544,13 @@ def portfolio():
             else:
                 portfolio_data = {'stocks': []}
 
-            # 현재가 업데이트
+            # 현재가 업데이트 (보유 종목 일괄 시세 조회)
+            quotes = stock_collector.get_quotes([stock['ticker'] for stock in portfolio_data['stocks']])
             for stock in portfolio_data['stocks']:
                 try:
-                    price_data = stock_collector.get_stock_data(stock['ticker'], period='1d')
-                    if price_data is not None:
-                        current_price = float(price_data['종가'].iloc[-1])
+                    quote = quotes.get(stock['ticker'], {})
+                    if 'error' not in quote:
+                        current_price = quote['current_price']
                         stock['current_price'] = current_price
                         stock['profit'] = (current_price - stock['avg_price']) * stock['quantity']
                         stock['return'] = ((current_price / stock['avg_price']) - 1) * 100
@@ -407,37 +604,29 @@ def portfolio():
 @app.route('/api/monitoring/start', methods=['POST'])
 def start_monitoring():
     """24시간 모니터링 시작"""
-    global monitoring_active, monitoring_thread, monitored_tickers
-
     data = request.json
-    monitored_tickers = data.get('tickers', [])
+    tickers = data.get('tickers', [])
 
-    if monitoring_active:
+    if monitoring_scheduler.running:
         return jsonify({'error': '이미 모니터링이 실행 중입니다'}), 400
 
-    monitoring_active = True
-    monitoring_thread = threading.Thread(target=monitoring_loop, daemon=True)
-    monitoring_thread.start()
+    monitoring_scheduler.set_tickers(tickers)
+    monitoring_scheduler.start()
 
-    return jsonify({'success': True, 'message': f'{len(monitored_tickers)}개 종목 모니터링 시작'})
+    return jsonify({'success': True, 'message': f'{len(tickers)}개 종목 모니터링 시작'})
 
 
 @app.route('/api/monitoring/stop', methods=['POST'])
 def stop_monitoring():
     """모니터링 중지"""
-    global monitoring_active
-
-    monitoring_active = False
+    monitoring_scheduler.stop()
     return jsonify({'success': True, 'message': '모니터링 중지'})
 
 
 @app.route('/api/monitoring/status', methods=['GET'])
 def monitoring_status():
     """모니터링 상태 조회"""
-    return jsonify({
-        'active': monitoring_active,
-        'tickers': monitored_tickers
-    })
+    return jsonify(monitoring_scheduler.status())
 
 
 @app.route('/api/search', methods=['GET'])
@@ -450,90 +639,10 @@ def search_ticker():
         if not query or len(query) < 1:
             return jsonify({'results': []})
 
-        results = []
-
-        if asset_type == 'stock':
-            # KRX 전체 종목 검색
-            krx_results = krx_list.search_stocks(query, limit=15)
-
-            for stock in krx_results:
-                results.append({
-                    'ticker': stock['ticker'],
-                    'name': stock['name'],
-                    'market': stock['market'],
-                    'display': f"{stock['name']} ({stock['ticker']}) - {stock['market']}"
-                })
+        # 미리 만든 인덱스 (KRX + 미국 주요 종목 / 가상화폐, 초성 검색 지원)
+        results = ticker_search.search(query, asset_type, limit=10)
 
-            # 미국 주요 종목도 추가 검색 (한글명 포함)
-            us_stocks = [
-                {'code': 'AAPL', 'name': 'Apple', 'name_kr': '애플', 'market': 'NASDAQ'},
-                {'code': 'MSFT', 'name': 'Microsoft', 'name_kr': '마이크로소프트', 'market': 'NASDAQ'},
-                {'code': 'GOOGL', 'name': 'Google', 'name_kr': '구글', 'market': 'NASDAQ'},
-                {'code': 'AMZN', 'name': 'Amazon', 'name_kr': '아마존', 'market': 'NASDAQ'},
-                {'code': 'TSLA', 'name': 'Tesla', 'name_kr': '테슬라', 'market': 'NASDAQ'},
-                {'code': 'META', 'name': 'Meta', 'name_kr': '메타', 'market': 'NASDAQ'},
-                {'code': 'NVDA', 'name': 'NVIDIA', 'name_kr': '엔비디아', 'market': 'NASDAQ'},
-                {'code': 'INTC', 'name': 'Intel', 'name_kr': '인텔', 'market': 'NASDAQ'},
-                {'code': 'AMD', 'name': 'AMD', 'name_kr': 'AMD', 'market': 'NASDAQ'},
-                {'code': 'NFLX', 'name': 'Netflix', 'name_kr': '넷플릭스', 'market': 'NASDAQ'},
-                {'code': 'JPM', 'name': 'JPMorgan Chase', 'name_kr': 'JP모건', 'market': 'NYSE'},
-                {'code': 'V', 'name': 'Visa', 'name_kr': '비자', 'market': 'NYSE'},
-                {'code': 'WMT', 'name': 'Walmart', 'name_kr': '월마트', 'market': 'NYSE'},
-                {'code': 'DIS', 'name': 'Disney', 'name_kr': '디즈니', 'market': 'NYSE'},
-                {'code': 'BA', 'name': 'Boeing', 'name_kr': '보잉', 'market': 'NYSE'},
-                {'code': 'BABA', 'name': 'Alibaba', 'name_kr': '알리바바', 'market': 'NYSE'},
-                {'code': 'NKE', 'name': 'Nike', 'name_kr': '나이키', 'market': 'NYSE'},
-                {'code': 'PYPL', 'name': 'PayPal', 'name_kr': '페이팔', 'market': 'NASDAQ'},
-                {'code': 'ADBE', 'name': 'Adobe', 'name_kr': '어도비', 'market': 'NASDAQ'},
-                {'code': 'CRM', 'name': 'Salesforce', 'name_kr': '세일즈포스', 'market': 'NYSE'},
-            ]
-
-            query_lower = query.lower()
-            for stock in us_stocks:
-                # 영문 대소문자 무시 검색 + 한글 검색
-                if (query_lower in stock['code'].lower() or
-                    query_lower in stock['name'].lower() or
-                    query_lower in stock.get('name_kr', '').lower() or  # 한글도 소문자 변환
-                    query in stock.get('name_kr', '')):  # 원본 한글 검색도 유지
-                    results.append({
-                        'ticker': stock['code'],
-                        'name': stock['name'],
-                        'market': stock['market'],
-                        'display': f"{stock['name']} ({stock['code']}) - {stock['market']}"
-                    })
-
-        elif asset_type == 'crypto':
-            # 주요 가상화폐 리스트 (한글명 포함)
-            cryptos = [
-                {'id': 'bitcoin', 'name': 'Bitcoin', 'name_kr': '비트코인', 'symbol': 'BTC'},
-                {'id': 'ethereum', 'name': 'Ethereum', 'name_kr': '이더리움', 'symbol': 'ETH'},
-                {'id': 'binancecoin', 'name': 'Binance Coin', 'name_kr': '바이낸스', 'symbol': 'BNB'},
-                {'id': 'ripple', 'name': 'XRP', 'name_kr': '리플', 'symbol': 'XRP'},
-                {'id': 'cardano', 'name': 'Cardano', 'name_kr': '카르다노', 'symbol': 'ADA'},
-                {'id': 'solana', 'name': 'Solana', 'name_kr': '솔라나', 'symbol': 'SOL'},
-                {'id': 'polkadot', 'name': 'Polkadot', 'name_kr': '폴카닷', 'symbol': 'DOT'},
-                {'id': 'dogecoin', 'name': 'Dogecoin', 'name_kr': '도지코인', 'symbol': 'DOGE'},
-                {'id': 'avalanche-2', 'name': 'Avalanche', 'name_kr': '아발란체', 'symbol': 'AVAX'},
-                {'id': 'chainlink', 'name': 'Chainlink', 'name_kr': '체인링크', 'symbol': 'LINK'},
-                {'id': 'orderly-network', 'name': 'Orderly', 'name_kr': '오덜리', 'symbol': 'ORDER'},
-            ]
-
-            query_lower = query.lower()
-            for crypto in cryptos:
-                # 영문 + 한글 검색 지원
-                if (query_lower in crypto['id'].lower() or
-                    query_lower in crypto['name'].lower() or
-                    query_lower in crypto['symbol'].lower() or
-                    query_lower in crypto.get('name_kr', '').lower() or
-                    query in crypto.get('name_kr', '')):
-                    results.append({
-                        'ticker': crypto['id'],
-                        'name': crypto['name'],
-                        'symbol': crypto['symbol'],
-                        'display': f"{crypto['name']} ({crypto['symbol']}) - {crypto.get('name_kr', '')}"
-                    })
-
-        return jsonify({'results': results[:10]})  # 최대 10개
+        return jsonify({'results': results})  # 최대 10개
 
     except Exception as e:
         return jsonify({'error': str(e), 'results': []})
@@ -833,98 +942,19 @@ def get_backtest_performance():
 
 @app.route('/api/watchlist/prices', methods=['GET'])
 def get_watchlist_prices():
-    """관심종목 가격 정보 조회 (Phase 2-1)"""
+    """관심종목 가격 정보 조회 (Phase 2-1) - 일괄 시세 조회"""
     try:
         tickers_str = request.args.get('tickers', '')
         if not tickers_str:
             return jsonify({'error': '티커가 제공되지 않았습니다'}), 400
 
-        tickers = [t.strip() for t in tickers_str.split(',')]
-
-        if len(tickers) > 10:
-            return jsonify({'error': '최대 10개까지만 조회 가능합니다'}), 400
+        tickers = [t.strip() for t in tickers_str.split(',') if t.strip()]
 
-        result = {}
-        from datetime import datetime
+        if len(tickers) > WATCHLIST_MAX_TICKERS:
+            return jsonify({'error': f'최대 {WATCHLIST_MAX_TICKERS}개까지만 조회 가능합니다'}), 400
 
-        for ticker in tickers:
-            try:
-                # 한국 주식은 FinanceDataReader 사용
-                if ticker.endswith('.KS') or ticker.endswith('.KQ'):
-                    import FinanceDataReader as fdr
-                    from datetime import timedelta
-
-                    # 최근 1개월 데이터
-                    end_date = datetime.now()
-                    start_date = end_date - timedelta(days=30)
-
-                    # 티커에서 .KS/.KQ 제거
-                    code = ticker.replace('.KS', '').replace('.KQ', '')
-                    hist = fdr.DataReader(code, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
-
-                    if hist is None or hist.empty:
-                        result[ticker] = {
-                            'error': '데이터 없음',
-                            'current_price': 0,
-                            'change_percent': 0,
-                            'sparkline': [],
-                            'last_update': '정보 없음'
-                        }
-                        continue
-
-                    # 현재 가격 및 변동률
-                    current_price = float(hist['Close'].iloc[-1])
-                    prev_price = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
-                    change_percent = ((current_price - prev_price) / prev_price) * 100 if prev_price > 0 else 0
-
-                    # Sparkline 데이터 (최근 20개 종가)
-                    sparkline = hist['Close'].tail(20).tolist()
-
-                else:
-                    # 암호화폐 및 기타는 yfinance 사용
-                    import yfinance as yf
-                    stock = yf.Ticker(ticker)
-                    hist = stock.history(period='1mo')
-
-                    if hist.empty:
-                        result[ticker] = {
-                            'error': '데이터 없음',
-                            'current_price': 0,
-                            'change_percent': 0,
-                            'sparkline': [],
-                            'last_update': '정보 없음'
-                        }
-                        continue
-
-                    # 현재 가격 및 변동률
-                    current_price = float(hist['Close'].iloc[-1])
-                    prev_price = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
-                    change_percent = ((current_price - prev_price) / prev_price) * 100 if prev_price > 0 else 0
-
-                    # Sparkline 데이터 (최근 20개 종가)
-                    sparkline = hist['Close'].tail(20).tolist()
-
-                # 마지막 업데이트 시간
-                last_update = "방금 전"
-
-                result[ticker] = {
-                    'current_price': round(current_price, 2),
-                    'change_percent': round(change_percent, 2),
-                    'sparkline': sparkline,
-                    'last_update': last_update
-                }
-
-            except Exception as e:
-                import traceback
-                print(f"❌ {ticker} 가격 조회 실패: {str(e)}")
-                print(traceback.format_exc())
-                result[ticker] = {
-                    'error': str(e),
-                    'current_price': 0,
-                    'change_percent': 0,
-                    'sparkline': [],
-                    'last_update': '오류'
-                }
+        # 한국 주식은 동시 증분 수집, 그 외는 yf.download 한 번으로 (현재가/등락률/스파크라인)
+        result = stock_collector.get_quotes(tickers)
 
         return jsonify(result)
 
@@ -936,25 +966,6 @@ def get_watchlist_prices():
         return jsonify({'error': str(e), 'traceback': error_trace}), 500
 
 
-def monitoring_loop():
-    """백그라운드 모니터링 루프"""
-    import time
-
-    while monitoring_active:
-        try:
-            for ticker in monitored_tickers:
-                # 분석 수행
-                # (여기에 매수/매도 신호 체크 로직 추가)
-                pass
-
-            # 5분마다 체크
-            time.sleep(300)
-
-        except Exception as e:
-            print(f"⚠️ 모니터링 오류: {str(e)}")
-            time.sleep(60)
-
-
 if __name__ == '__main__':
     print("="*60)
     print("🚀 시장 분석 시스템 웹 대시보드 시작")